@@ -88,11 +88,12 @@ def create_spec_file():
     """Create PyInstaller spec file for advanced configuration"""
     print_step(4, 6, "Creating PyInstaller spec file")
     
-    from build_config import HIDDEN_IMPORTS, EXCLUDES, APP_NAME
+    from build_config import HIDDEN_IMPORTS, EXCLUDES, DATA_FILES, APP_NAME
     
     # Convert lists to properly formatted strings
     hidden_imports_str = ',\n        '.join([f"'{imp}'" for imp in HIDDEN_IMPORTS])
     excludes_str = ',\n        '.join([f"'{exc}'" for exc in EXCLUDES])
+    datas_str = ', '.join([f"({os.path.abspath(src)!r}, {dst!r})" for src, dst in DATA_FILES])
     
     spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
 
@@ -102,7 +103,7 @@ a = Analysis(
     ['{os.path.abspath("../src/main.py")}'],
     pathex=['{os.path.abspath("../src")}', '{os.path.abspath("..")}'],
     binaries=[],
-    datas=[],
+    datas=[{datas_str}],
     hiddenimports=[
         {hidden_imports_str}
     ],
@@ -36,6 +36,7 @@ HIDDEN_IMPORTS = [
     "matplotlib.backends.backend_qt5agg",
     "matplotlib.figure",
     "numpy",
+    "icmplib",
     "ctypes.wintypes",
     "subprocess",
     "threading",
@@ -59,6 +60,10 @@ DATA_FILES = [
     # ("source_path", "dest_path_in_exe"),
 ]
 
+# MAC vendor database, present once build_oui_db.py has been run
+if os.path.isdir("../src/oui_data"):
+    DATA_FILES.append(("../src/oui_data", "oui_data"))
+
 # Exclude unnecessary modules to reduce size (be careful not to exclude needed modules)
 EXCLUDES = [
     "tkinter",
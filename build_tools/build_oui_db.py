@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Convert the IEEE OUI registry into the lookup files used by the Network Scanner
+
+Download oui.txt from https://standards-oui.ieee.org/oui/oui.txt, then run:
+    python build_oui_db.py path/to/oui.txt
+
+Writes src/oui_data/ouis.bin (sorted little-endian uint32 OUI prefixes) and
+src/oui_data/vendors.txt (one vendor per line, in the same order).
+"""
+
+import os
+import re
+import sys
+import struct
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "oui_data")
+
+# Registry lines look like "00-1B-63   (hex)\t\tApple, Inc."
+OUI_LINE = re.compile(r"^\s*([0-9A-Fa-f]{2})-([0-9A-Fa-f]{2})-([0-9A-Fa-f]{2})\s+\(hex\)\s+(.*?)\s*$")
+
+
+def parse_oui_file(path):
+    """Parse oui.txt into {oui_int: vendor}"""
+    vendors = {}
+    with open(path, encoding="utf-8", errors="replace") as oui_file:
+        for line in oui_file:
+            match = OUI_LINE.match(line)
+            if match:
+                oui = int("".join(match.group(1, 2, 3)), 16)
+                vendors[oui] = match.group(4) or "Unknown"
+    return vendors
+
+
+def write_oui_database(vendors, output_dir=OUTPUT_DIR):
+    """Write the sorted prefix array and the matching vendor list"""
+    os.makedirs(output_dir, exist_ok=True)
+    ouis = sorted(vendors)
+
+    with open(os.path.join(output_dir, "ouis.bin"), "wb") as bin_file:
+        bin_file.write(struct.pack(f"<{len(ouis)}I", *ouis))
+    with open(os.path.join(output_dir, "vendors.txt"), "w", encoding="utf-8") as text_file:
+        text_file.write("\n".join(vendors[oui].replace("\n", " ") for oui in ouis))
+        text_file.write("\n")
+
+    return len(ouis)
+
+
+def main():
+    if len(sys.argv) != 2:
+        print(f"Usage: python {os.path.basename(__file__)} path/to/oui.txt")
+        return 1
+
+    vendors = parse_oui_file(sys.argv[1])
+    if not vendors:
+        print("✗ No OUI entries found - is this the IEEE oui.txt file?")
+        return 1
+
+    count = write_oui_database(vendors)
+    print(f"✓ Wrote {count} OUI entries to {os.path.normpath(OUTPUT_DIR)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
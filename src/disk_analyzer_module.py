@@ -32,6 +32,19 @@ RAW_FOLDER_DATA_ROLE = Qt.UserRole + 12  # Store raw folder data for dynamic exp
 FOLDER_EXPANDED_ROLE = Qt.UserRole + 13  # Track if folder has been dynamically expanded
 
 
+class DriveListWorker(QThread):
+    """Worker thread that lists the logical drives, querying slow network or optical drives off the GUI thread"""
+    drives_listed = Signal(list)
+    
+    def run(self):
+        try:
+            drives = disk_utilities.get_logical_drives_with_types()
+        except Exception as e:
+            debug_print(f"Error populating drives: {e}")
+            drives = []
+        self.drives_listed.emit(drives)
+
+
 class DiskAnalyzerWorker(QThread):
     """Worker thread for disk analysis"""
     analysis_complete = Signal(dict)
@@ -43,12 +56,14 @@ class DiskAnalyzerWorker(QThread):
     progress_update = Signal(int, int, str)  # folders_scanned, files_scanned, current_path
     progress_percentage = Signal(int)  # overall progress percentage (0-100)
 
-    def __init__(self, path_to_analyze, use_fast_scan=True, ultra_fast=False, mft_direct=False, parent=None):
+    def __init__(self, path_to_analyze, use_fast_scan=True, ultra_fast=False, mft_direct=False,
+                 mft_strategies=None, parent=None):
         super().__init__(parent)
         self.path_to_analyze = path_to_analyze
         self.use_fast_scan = use_fast_scan
         self.ultra_fast = ultra_fast
         self.mft_direct = mft_direct
+        self.mft_strategies = mft_strategies  # None uses disk_utilities.MFT_ENABLED_STRATEGIES
         self._cancelled = False
         
         # Progress tracking
@@ -81,21 +96,23 @@ class DiskAnalyzerWorker(QThread):
                 return self._cancelled
                 
             def item_callback(item_data):
-                """Callback for when individual items are discovered"""
+                """Callback for when individual items (or batches of items from the MFT paths) are discovered"""
                 if not self._cancelled:
-                    self.item_discovered.emit(item_data)
-                    
-                    # Update counters based on item type
-                    item_type = item_data.get('type', '')
-                    if item_type == 'folder' or item_type == 'folder_start':
-                        self.folders_scanned += 1
-                    elif item_type == 'file':
-                        self.files_scanned += 1
-                    
-                    # Always update current path for better tracking
-                    new_path = item_data.get('path', '')
-                    if new_path:
-                        self.current_path = new_path
+                    items = item_data if isinstance(item_data, list) else (item_data,)
+                    for item in items:
+                        self.item_discovered.emit(item)
+                        
+                        # Update counters based on item type
+                        item_type = item.get('type', '')
+                        if item_type == 'folder' or item_type == 'folder_start':
+                            self.folders_scanned += 1
+                        elif item_type == 'file':
+                            self.files_scanned += 1
+                        
+                        # Always update current path for better tracking
+                        new_path = item.get('path', '')
+                        if new_path:
+                            self.current_path = new_path
                     
                     # Emit progress update every 0.5 seconds (keep existing logic)
                     current_time = time.time()
@@ -118,7 +135,8 @@ class DiskAnalyzerWorker(QThread):
                 result = disk_utilities.analyze_directory_mft_direct(
                     self.path_to_analyze,
                     check_cancelled_callback=cancel_check,
-                    item_discovered_callback=item_callback
+                    item_discovered_callback=item_callback,
+                    strategies=self.mft_strategies
                 )
             elif self.ultra_fast:
                 # Use ultra-fast parallel processing as fallback
@@ -239,6 +257,7 @@ class DiskAnalyzerWidget(QWidget):
         # Initialize data structures
         self.raw_analysis_root_node = None
         self.current_custom_folder_path = None
+        self.mft_strategies = None  # MFT scan strategies to try, set from --mft-strategies
         self.analysis_worker = None
         self.manually_expanded_folders_paths = set()  # Track manually expanded file groups
         self.scan_start_time = None  # Track scan duration
@@ -246,6 +265,11 @@ class DiskAnalyzerWidget(QWidget):
         # Initialize progress tracking (no popup dialog)
         self.progress_timer = None
         
+        # Drives are listed in the background, a drive asked for before then is selected once they arrive
+        self.drive_list_worker = None
+        self.drives_loaded = False
+        self.pending_drive_selection = None
+        
         # Initialize UI
         self._init_ui()
         self._setup_disk_analyzer_page_components()
@@ -444,26 +468,47 @@ class DiskAnalyzerWidget(QWidget):
         
     def _setup_disk_analyzer_page_components(self):
         """Setup disk analyzer components"""
-        # Populate drive selection combo box
-        try:
-            drives = disk_utilities.get_logical_drives_with_types()
-            self.drive_select_combo.clear()
-            
-            for drive_info in drives:
-                drive_path = drive_info['drive']
-                drive_name = drive_info['name']
-                self.drive_select_combo.addItem(drive_name, userData=drive_path)
-            
-            # Automatically select the first drive to populate space information
-            if drives:
-                self.drive_select_combo.setCurrentIndex(0)
-                
-        except Exception as e:
-            debug_print(f"Error populating drives: {e}")
+        # Populate drive selection combo box in the background
+        self.drive_select_combo.setPlaceholderText("Loading drives...")
+        self.drive_list_worker = DriveListWorker(self)
+        self.drive_list_worker.drives_listed.connect(self._on_drives_listed)
+        self.drive_list_worker.start()
             
         # Set initial column visibility - Path column is hidden by default
         self.disk_results_tree.setColumnHidden(self.disk_tree_path_col_idx, True)
         
+    @Slot(list)
+    def _on_drives_listed(self, drives):
+        """Fill the drive selection combo box once the drives are listed"""
+        self.drives_loaded = True
+        self.drive_select_combo.setPlaceholderText("Select a Drive")
+        
+        # Filled silently so the first item added does not count as a selection
+        self.drive_select_combo.blockSignals(True)
+        self.drive_select_combo.clear()
+        for drive_info in drives:
+            drive_path = drive_info['drive']
+            drive_name = drive_info['name']
+            self.drive_select_combo.addItem(drive_name, userData=drive_path)
+        self.drive_select_combo.setCurrentIndex(-1)
+        self.drive_select_combo.blockSignals(False)
+        
+        if self.pending_drive_selection:
+            self.select_drive(self.pending_drive_selection)
+        elif drives and not self.current_custom_folder_path:
+            # Automatically select the first drive to populate space information
+            self.drive_select_combo.setCurrentIndex(0)
+            
+    def select_drive(self, drive_path):
+        """Select a drive by path, waiting for the drive list if it is still loading"""
+        if not self.drives_loaded:
+            self.pending_drive_selection = drive_path
+            return
+        self.pending_drive_selection = None
+        index = self.drive_select_combo.findData(drive_path)
+        if index >= 0:
+            self.drive_select_combo.setCurrentIndex(index)
+            
     @Slot(int)
     def _on_disk_analyzer_drive_selected(self, index):
         """Handle drive selection change"""
@@ -544,7 +589,8 @@ class DiskAnalyzerWidget(QWidget):
         mft_direct = True     # Always use MFT direct
         
         # Create and start worker
-        self.analysis_worker = DiskAnalyzerWorker(target_path, use_fast_scan, ultra_fast, mft_direct, self)
+        self.analysis_worker = DiskAnalyzerWorker(target_path, use_fast_scan, ultra_fast, mft_direct,
+                                                  self.mft_strategies, self)
         self.analysis_worker.analysis_complete.connect(self._handle_analysis_completion)
         self.analysis_worker.analysis_error.connect(self._on_disk_analysis_error)
         self.analysis_worker.analysis_progress.connect(self._on_disk_analysis_progress)
@@ -704,7 +750,7 @@ class DiskAnalyzerWidget(QWidget):
         
         # Size column (sortable)
         size_item = SortableSizeStandardItem(self._format_bytes_for_display(node_size))
-        size_item.setData(node_size, Qt.UserRole)
+        size_item.setSortKey(node_size)
         row_items.append(size_item)
         
         # Files column
@@ -813,7 +859,7 @@ class DiskAnalyzerWidget(QWidget):
         group_percentage_item.setData(group_perc_val, Qt.UserRole)
         
         group_size_item = SortableSizeStandardItem(self._format_bytes_for_display(files_group_size))
-        group_size_item.setData(int(files_group_size), Qt.UserRole)
+        group_size_item.setSortKey(int(files_group_size))
         
         group_files_item = QStandardItem(str(files_group_count))
         group_files_item.setData(int(files_group_count), Qt.UserRole)
@@ -958,6 +1004,10 @@ class DiskAnalyzerWidget(QWidget):
                 if drive_path:
                     cmd_args.extend(['--drive', drive_path])
             
+            # Keep the chosen MFT strategies, the volume-level ones are what need admin
+            if self.mft_strategies:
+                cmd_args.extend(['--mft-strategies', ','.join(self.mft_strategies)])
+            
             debug_print(f"Restarting as admin with command: {cmd_args}")
             
             # Use ShellExecuteW to run as administrator
@@ -1160,7 +1210,7 @@ class DiskAnalyzerWidget(QWidget):
         file_percentage_item.setData(file_perc_val, Qt.UserRole)
         
         file_size_item = SortableSizeStandardItem(self._format_bytes_for_display(file_size_bytes))
-        file_size_item.setData(int(file_size_bytes), Qt.UserRole)
+        file_size_item.setSortKey(int(file_size_bytes))
         
         file_files_item = QStandardItem("-")
         file_files_item.setData(1, Qt.UserRole)  # Represents 1 file
@@ -1430,7 +1480,7 @@ class DiskAnalyzerWidget(QWidget):
         
         # Size column
         size_item = SortableSizeStandardItem(self._format_bytes_for_display(item_size))
-        size_item.setData(item_size, Qt.UserRole)
+        size_item.setSortKey(item_size)
         row_items.append(size_item)
         
         # Files column
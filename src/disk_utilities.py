@@ -2,10 +2,19 @@
 Disk utilities module for IT Helper application
 Provides disk analysis functionality using Windows API
 """
+import array
+import atexit
 import ctypes
 from ctypes import wintypes
 import os
+import struct
 import time
+from collections import deque
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+
+import numpy as np
 
 
 # Windows API Constants
@@ -29,8 +38,13 @@ DRIVE_TYPES = {
 
 FILE_ATTRIBUTE_DIRECTORY = 0x00000010
 FILE_ATTRIBUTE_REPARSE_POINT = 0x00000400
+_DIRECTORY_KIND_MASK = FILE_ATTRIBUTE_DIRECTORY | FILE_ATTRIBUTE_REPARSE_POINT
 INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
 
+# Reparse point tags (os.stat's st_reparse_tag, or the EaSize field of a directory query entry)
+IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003  # Junctions and volume mount points
+IO_REPARSE_TAG_SYMLINK = 0xA000000C
+
 
 # Windows API Structures
 class LARGE_INTEGER(ctypes.Structure):
@@ -70,24 +84,6 @@ class ULARGE_INTEGER(ctypes.Structure):
         self.HighPart = (value >> 32) & 0xFFFFFFFF
 
 
-class FILETIME(ctypes.Structure):
-    _fields_ = [("dwLowDateTime", wintypes.DWORD),
-                ("dwHighDateTime", wintypes.DWORD)]
-
-
-class WIN32_FIND_DATAW(ctypes.Structure):
-    _fields_ = [("dwFileAttributes", wintypes.DWORD),
-                ("ftCreationTime", FILETIME),
-                ("ftLastAccessTime", FILETIME),
-                ("ftLastWriteTime", FILETIME),
-                ("nFileSizeHigh", wintypes.DWORD),
-                ("nFileSizeLow", wintypes.DWORD),
-                ("dwReserved0", wintypes.DWORD),
-                ("dwReserved1", wintypes.DWORD),
-                ("cFileName", wintypes.WCHAR * 260),
-                ("cAlternateFileName", wintypes.WCHAR * 14)]
-
-
 # Function Prototypes from kernel32.dll
 kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
 
@@ -107,28 +103,37 @@ GetDiskFreeSpaceExW.argtypes = [
 ]
 GetDiskFreeSpaceExW.restype = wintypes.BOOL
 
-FindFirstFileW = kernel32.FindFirstFileW
-FindFirstFileW.argtypes = [wintypes.LPCWSTR, ctypes.POINTER(WIN32_FIND_DATAW)]
-FindFirstFileW.restype = wintypes.HANDLE
 
-FindNextFileW = kernel32.FindNextFileW
-FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(WIN32_FIND_DATAW)]
-FindNextFileW.restype = wintypes.BOOL
+EPOCH_DIFFERENCE_100NS = 116444736000000000
 
-FindClose = kernel32.FindClose
-FindClose.argtypes = [wintypes.HANDLE]
-FindClose.restype = wintypes.BOOL
 
-
-def filetime_to_unix_timestamp(filetime_obj):
-    """Convert a FILETIME structure to a Unix timestamp"""
-    _100ns_intervals = (filetime_obj.dwHighDateTime << 32) + filetime_obj.dwLowDateTime
-    EPOCH_DIFFERENCE_100NS = 116444736000000000
+def filetime_100ns_to_unix_timestamp(_100ns_intervals):
+    """Convert a raw 64-bit FILETIME value to a Unix timestamp"""
     unix_timestamp_100ns = _100ns_intervals - EPOCH_DIFFERENCE_100NS
     if unix_timestamp_100ns < 0:
         return 0
-    unix_timestamp_seconds = unix_timestamp_100ns / 10000000
-    return unix_timestamp_seconds
+    return unix_timestamp_100ns / 10000000
+
+
+def filetime_100ns_to_unix_timestamps(filetimes_100ns):
+    """Convert an int64 array of raw FILETIME values to Unix timestamps in one pass"""
+    unix_timestamps_100ns = filetimes_100ns - EPOCH_DIFFERENCE_100NS
+    return np.maximum(unix_timestamps_100ns, 0) / 10000000
+
+
+def is_traversable_directory(attributes, reparse_tag):
+    """
+    Decide whether a directory entry should be descended into
+    Plain directories and directory symlinks are followed; junctions and mount
+    points are skipped since they commonly loop back into the same volume.
+    Followed symlinks are listed but left out of their parent's totals (see _roll_up_subfolder),
+    and a symlink to a directory the scan already reached is not followed again
+    """
+    if not attributes & FILE_ATTRIBUTE_DIRECTORY:
+        return False
+    if not attributes & FILE_ATTRIBUTE_REPARSE_POINT:
+        return True
+    return reparse_tag == IO_REPARSE_TAG_SYMLINK
 
 
 def get_logical_drives_with_types():
@@ -189,190 +194,266 @@ def get_drive_space_info(drive_path_str):
         return None
 
 
-def analyze_directory_recursively(path_str, current_depth=0, max_depth=10, check_cancelled_callback=None):
+def _make_folder_result(path_str, folder_type='folder', last_modified=0):
+    """Build an empty folder result dictionary"""
+    return {
+        'name': os.path.basename(path_str) if path_str else "Unknown",
+        'path': path_str,
+        'size': 0,
+        'type': folder_type,
+        'direct_files': [],
+        'sub_folders': [],
+        'file_count': 0,
+        'folder_count': 0,
+        'last_modified_timestamp': last_modified
+    }
+
+
+def _make_file_result(item_path, filename, file_size, last_modified):
+    """Build a file result dictionary"""
+    return {
+        'name': filename,
+        'path': item_path,
+        'size': file_size,
+        'type': 'file',
+        'direct_files': [],
+        'sub_folders': [],
+        'file_count': 1,
+        'folder_count': 0,
+        'last_modified_timestamp': last_modified
+    }
+
+
+class FileRec:
     """
-    Recursively analyze a directory to get sizes of files and folders
-    Returns a dictionary with hierarchical structure
+    Compact file entry for large scans, readable like a file result dictionary through
+    get() and [] so tree-view code can treat both the same way
+    """
+    __slots__ = ('name', 'path', 'size', 'mtime', 'is_dir', 'file_count')
+
+    def __init__(self, name, path, size, mtime, is_dir=False, file_count=1):
+        self.name = name
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.is_dir = is_dir
+        self.file_count = file_count
+
+    def to_dict(self):
+        """Return the equivalent file result dictionary"""
+        return _make_file_result(self.path, self.name, self.size, self.mtime)
+
+    def __getitem__(self, key):
+        if key == 'name':
+            return self.name
+        if key == 'path':
+            return self.path
+        if key == 'size':
+            return self.size
+        if key == 'last_modified_timestamp':
+            return self.mtime
+        if key == 'type':
+            return 'folder' if self.is_dir else 'file'
+        if key == 'file_count':
+            return self.file_count
+        if key == 'folder_count':
+            return 0
+        if key in ('direct_files', 'sub_folders'):
+            return []
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def _add_subfolder(dir_data, subfolder_data):
+    """Attach a scanned sub-folder and roll its totals into the parent"""
+    dir_data['sub_folders'].append(subfolder_data)
+    _roll_up_subfolder(dir_data, subfolder_data)
+
+
+def _roll_up_subfolder(dir_data, subfolder_data):
+    """Add a sub-folder's totals to its parent"""
+    if subfolder_data.get('is_link'):
+        # A followed directory symlink takes no space itself and its target may also be
+        # inside the scanned tree, so only the link is counted, never its contents
+        dir_data['folder_count'] += 1
+        return
+    dir_data['size'] += subfolder_data['size']
+    dir_data['file_count'] += subfolder_data['file_count']
+    dir_data['folder_count'] += subfolder_data['folder_count'] + 1
+
+
+class _VisitedDirectories:
+    """Identities of the real directories scanned so far in one scan, shared by its threads"""
+    __slots__ = ('_keys', '_lock')
+
+    def __init__(self):
+        self._keys = set()
+        self._lock = Lock()
+
+    def claim(self, key):
+        """Record a directory, returns False if it was already scanned"""
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            return True
+
+
+def _directory_key(path_str, stat_info):
+    """Identity of the real directory behind path_str, the resolved path where there is no file ID"""
+    if stat_info.st_ino:
+        return stat_info.st_dev, stat_info.st_ino
+    return os.path.normcase(os.path.realpath(path_str))
+
+
+def _begin_directory_scan(path_str, current_depth, max_depth, check_cancelled_callback, visited):
+    """
+    Common preamble shared by the analyze_directory_* scanners
+    Returns (dir_data, dir_stat_info); dir_stat_info is None when dir_data is a
+    finished placeholder (cancelled, inaccessible, beyond max_depth or a directory
+    symlink whose target this scan already visited)
     """
     if check_cancelled_callback and check_cancelled_callback():
-        return {
-            'name': os.path.basename(path_str), 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_cancelled',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0, 
-            'last_modified_timestamp': 0
-        }
+        return _make_folder_result(path_str, 'folder_cancelled'), None
 
-    dir_stat_info = None
     try:
-        dir_stat_info = os.stat(path_str)
+        dir_stat_info = os.lstat(path_str)
     except Exception:
-        return {
-            'name': os.path.basename(path_str) if path_str else "Unknown", 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_inaccessible',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0, 
-            'last_modified_timestamp': 0
-        }
+        return _make_folder_result(path_str, 'folder_inaccessible'), None
 
     if current_depth > max_depth:
-        return {
-            'name': os.path.basename(path_str), 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_max_depth',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0,
-            'last_modified_timestamp': dir_stat_info.st_mtime if dir_stat_info else 0
-        }
+        return _make_folder_result(path_str, 'folder_max_depth', dir_stat_info.st_mtime), None
 
-    dir_data = {
-        'name': os.path.basename(path_str) if path_str else "Unknown",
-        'path': path_str,
-        'size': 0,
-        'type': 'folder',
-        'direct_files': [],
-        'sub_folders': [],
-        'file_count': 0,
-        'folder_count': 0,
-        'last_modified_timestamp': dir_stat_info.st_mtime if dir_stat_info else 0
-    }
+    dir_data = _make_folder_result(path_str, 'folder', dir_stat_info.st_mtime)
+    if not dir_stat_info.st_file_attributes & FILE_ATTRIBUTE_REPARSE_POINT:
+        visited.claim(_directory_key(path_str, dir_stat_info))
+        return dir_data, dir_stat_info
 
-    search_pattern = os.path.join(path_str, "*")
-    find_data = WIN32_FIND_DATAW()
+    dir_data['is_link'] = True  # Only directory symlinks are traversed, see is_traversable_directory
+    try:
+        target_stat_info = os.stat(path_str)
+    except OSError:
+        dir_data['type'] = 'folder_inaccessible'
+        return dir_data, None
+    # Ancestors are claimed before their children, so this also stops links back up the tree
+    if not visited.claim(_directory_key(path_str, target_stat_info)):
+        dir_data['type'] = 'folder_link_visited'
+        return dir_data, None
+    return dir_data, dir_stat_info
+
+
+def _read_directory_listing(path_str, check_cancelled_callback=None):
+    """
+    Enumerate the direct children of a directory
+    Returns (files, subdirs) where files are (path, name, size, last_modified) tuples
+    and subdirs are (path, name, last_modified) tuples, or None if cancelled
+    """
+    files_listed = []
+    subdirs = []
     
     try:
-        handle = FindFirstFileW(search_pattern, ctypes.byref(find_data))
-        if handle == INVALID_HANDLE_VALUE:
-            return dir_data
-            
-        while True:
-            if check_cancelled_callback and check_cancelled_callback():
-                FindClose(handle)
-                return dir_data
-                
-            filename = find_data.cFileName
-            if filename in ['.', '..']:
-                if not FindNextFileW(handle, ctypes.byref(find_data)):
-                    break
-                continue
-                
-            item_path = os.path.join(path_str, filename)
-            is_directory = find_data.dwFileAttributes & FILE_ATTRIBUTE_DIRECTORY
-            is_reparse_point = find_data.dwFileAttributes & FILE_ATTRIBUTE_REPARSE_POINT
-            
-            # Calculate file size
-            file_size = (find_data.nFileSizeHigh << 32) + find_data.nFileSizeLow
-            last_modified = filetime_to_unix_timestamp(find_data.ftLastWriteTime)
-            
-            if is_directory and not is_reparse_point:
-                # Recursively analyze subfolder
-                subfolder_data = analyze_directory_recursively(
-                    item_path, current_depth + 1, max_depth, check_cancelled_callback
-                )
-                dir_data['sub_folders'].append(subfolder_data)
-                dir_data['size'] += subfolder_data['size']
-                dir_data['file_count'] += subfolder_data['file_count']
-                dir_data['folder_count'] += subfolder_data['folder_count'] + 1
-                
-            elif not is_directory:
-                # Regular file
-                file_data = {
-                    'name': filename,
-                    'path': item_path,
-                    'size': file_size,
-                    'type': 'file',
-                    'direct_files': [],
-                    'sub_folders': [],
-                    'file_count': 1,
-                    'folder_count': 0,
-                    'last_modified_timestamp': last_modified
-                }
-                dir_data['direct_files'].append(file_data)
-                dir_data['size'] += file_size
-                dir_data['file_count'] += 1
-                
-            if not FindNextFileW(handle, ctypes.byref(find_data)):
-                break
-                
-        FindClose(handle)
-        
-    except Exception as e:
-        print(f"Error analyzing directory {path_str}: {e}")
+        # On Windows os.scandir fills DirEntry.stat() from the FindFirstFile/FindNextFile
+        # data, so no extra system call is made per entry
+        with os.scandir(path_str) as entries:
+            for entry in entries:
+                if check_cancelled_callback and check_cancelled_callback():
+                    return None
+                    
+                try:
+                    entry_stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                    
+                attributes = entry_stat.st_file_attributes
+                if attributes & FILE_ATTRIBUTE_DIRECTORY:
+                    if is_traversable_directory(attributes, entry_stat.st_reparse_tag):
+                        subdirs.append((entry.path, entry.name, entry_stat.st_mtime))
+                else:
+                    files_listed.append((entry.path, entry.name, entry_stat.st_size, entry_stat.st_mtime))
+    except OSError:
+        pass
         
-    return dir_data 
+    return files_listed, subdirs
+
+
+# Background prefetch of sub-directory entries so they are in the file system cache
+# by the time the scanner walks into them
+_PREFETCH_POOL = None
+_PREFETCH_POOL_LOCK = Lock()
+_PREFETCH_MAX_WORKERS = 2
+_PREFETCH_SLOTS = BoundedSemaphore(64)  # Bounds queued prefetches to avoid thrashing
+
+
+def _prefetch_directory(path_str):
+    """Open and close a directory so its entry block is paged in"""
+    try:
+        with os.scandir(path_str):
+            pass
+    except OSError:
+        pass
+    finally:
+        _PREFETCH_SLOTS.release()
+
+
+def _prefetch_subdirectories(subdirs):
+    """Queue prefetch hints for sub-directories, dropping hints when the queue is full"""
+    global _PREFETCH_POOL
+    if _PREFETCH_POOL is None:
+        with _PREFETCH_POOL_LOCK:
+            if _PREFETCH_POOL is None:
+                _PREFETCH_POOL = ThreadPoolExecutor(
+                    max_workers=_PREFETCH_MAX_WORKERS, thread_name_prefix="dir-prefetch"
+                )
+    for subdir_path, _subdir_name, _subdir_modified in subdirs:
+        if not _PREFETCH_SLOTS.acquire(blocking=False):
+            break
+        _PREFETCH_POOL.submit(_prefetch_directory, subdir_path)
+
+
+def _list_directory(path_str, check_cancelled_callback=None, prefetch=False):
+    """
+    Return the (files, subdirs) listing of a directory
+    Returns None if the scan was cancelled while enumerating
+    """
+    listing = _read_directory_listing(path_str, check_cancelled_callback)
+    if listing is None:
+        return None
+    # Warm up the sub-directories while this directory's files are processed
+    if prefetch:
+        _prefetch_subdirectories(listing[1])
+    return listing
+
+
+def analyze_directory_recursively(path_str, current_depth=0, max_depth=10, check_cancelled_callback=None):
+    """
+    Recursively analyze a directory to get sizes of files and folders
+    Returns a dictionary with hierarchical structure
+    """
+    return analyze_directory_recursively_realtime(
+        path_str, current_depth, max_depth, check_cancelled_callback, None
+    )
 
 
 def analyze_directory_recursively_realtime(path_str, current_depth=0, max_depth=10, 
-                                         check_cancelled_callback=None, item_discovered_callback=None):
+                                         check_cancelled_callback=None, item_discovered_callback=None,
+                                         visited=None):
     """
     Recursively analyze a directory to get sizes of files and folders with real-time callbacks
     Calls item_discovered_callback for each file/folder found during scanning
     Returns a dictionary with hierarchical structure
     """
-    if check_cancelled_callback and check_cancelled_callback():
-        return {
-            'name': os.path.basename(path_str), 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_cancelled',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0, 
-            'last_modified_timestamp': 0
-        }
-
-    dir_stat_info = None
-    try:
-        dir_stat_info = os.stat(path_str)
-    except Exception:
-        return {
-            'name': os.path.basename(path_str) if path_str else "Unknown", 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_inaccessible',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0, 
-            'last_modified_timestamp': 0
-        }
-
-    if current_depth > max_depth:
-        return {
-            'name': os.path.basename(path_str), 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_max_depth',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0,
-            'last_modified_timestamp': dir_stat_info.st_mtime if dir_stat_info else 0
-        }
-
-    dir_data = {
-        'name': os.path.basename(path_str) if path_str else "Unknown",
-        'path': path_str,
-        'size': 0,
-        'type': 'folder',
-        'direct_files': [],
-        'sub_folders': [],
-        'file_count': 0,
-        'folder_count': 0,
-        'last_modified_timestamp': dir_stat_info.st_mtime if dir_stat_info else 0
-    }
+    if visited is None:
+        visited = _VisitedDirectories()  # Start of a new scan
+    dir_data, dir_stat_info = _begin_directory_scan(
+        path_str, current_depth, max_depth, check_cancelled_callback, visited
+    )
+    if dir_stat_info is None:
+        return dir_data
 
     # Emit the folder being analyzed
     if item_discovered_callback:
@@ -384,88 +465,52 @@ def analyze_directory_recursively_realtime(path_str, current_depth=0, max_depth=
             'depth': current_depth
         })
 
-    search_pattern = os.path.join(path_str, "*")
-    find_data = WIN32_FIND_DATAW()
-    
     try:
-        handle = FindFirstFileW(search_pattern, ctypes.byref(find_data))
-        if handle == INVALID_HANDLE_VALUE:
+        listing = _list_directory(path_str, check_cancelled_callback=check_cancelled_callback)
+        if listing is None:
             return dir_data
-            
-        while True:
+        files_listed, subdirs = listing
+        
+        for item_path, filename, file_size, last_modified in files_listed:
             if check_cancelled_callback and check_cancelled_callback():
-                FindClose(handle)
                 return dir_data
                 
-            filename = find_data.cFileName
-            if filename in ['.', '..']:
-                if not FindNextFileW(handle, ctypes.byref(find_data)):
-                    break
-                continue
-                
-            item_path = os.path.join(path_str, filename)
-            is_directory = find_data.dwFileAttributes & FILE_ATTRIBUTE_DIRECTORY
-            is_reparse_point = find_data.dwFileAttributes & FILE_ATTRIBUTE_REPARSE_POINT
+            # Emit file discovery
+            if item_discovered_callback:
+                item_discovered_callback({
+                    'type': 'file',
+                    'path': item_path,
+                    'parent_path': path_str,
+                    'name': filename,
+                    'size': file_size,
+                    'depth': current_depth + 1,
+                    'last_modified': last_modified
+                })
             
-            # Calculate file size
-            file_size = (find_data.nFileSizeHigh << 32) + find_data.nFileSizeLow
-            last_modified = filetime_to_unix_timestamp(find_data.ftLastWriteTime)
+            dir_data['direct_files'].append(_make_file_result(item_path, filename, file_size, last_modified))
+            dir_data['size'] += file_size
+            dir_data['file_count'] += 1
             
-            if is_directory and not is_reparse_point:
-                # Emit folder discovery
-                if item_discovered_callback:
-                    item_discovered_callback({
-                        'type': 'folder',
-                        'path': item_path,
-                        'parent_path': path_str,
-                        'name': filename,
-                        'depth': current_depth + 1,
-                        'last_modified': last_modified
-                    })
-                
-                # Recursively analyze subfolder
-                subfolder_data = analyze_directory_recursively_realtime(
-                    item_path, current_depth + 1, max_depth, check_cancelled_callback, item_discovered_callback
-                )
-                dir_data['sub_folders'].append(subfolder_data)
-                dir_data['size'] += subfolder_data['size']
-                dir_data['file_count'] += subfolder_data['file_count']
-                dir_data['folder_count'] += subfolder_data['folder_count'] + 1
+        for item_path, filename, last_modified in subdirs:
+            if check_cancelled_callback and check_cancelled_callback():
+                return dir_data
                 
-            elif not is_directory:
-                # Regular file
-                file_data = {
-                    'name': filename,
+            # Emit folder discovery
+            if item_discovered_callback:
+                item_discovered_callback({
+                    'type': 'folder',
                     'path': item_path,
-                    'size': file_size,
-                    'type': 'file',
-                    'direct_files': [],
-                    'sub_folders': [],
-                    'file_count': 1,
-                    'folder_count': 0,
-                    'last_modified_timestamp': last_modified
-                }
-                
-                # Emit file discovery
-                if item_discovered_callback:
-                    item_discovered_callback({
-                        'type': 'file',
-                        'path': item_path,
-                        'parent_path': path_str,
-                        'name': filename,
-                        'size': file_size,
-                        'depth': current_depth + 1,
-                        'last_modified': last_modified
-                    })
-                
-                dir_data['direct_files'].append(file_data)
-                dir_data['size'] += file_size
-                dir_data['file_count'] += 1
-                
-            if not FindNextFileW(handle, ctypes.byref(find_data)):
-                break
-                
-        FindClose(handle)
+                    'parent_path': path_str,
+                    'name': filename,
+                    'depth': current_depth + 1,
+                    'last_modified': last_modified
+                })
+            
+            # Recursively analyze subfolder
+            _add_subfolder(dir_data, analyze_directory_recursively_realtime(
+                item_path, current_depth + 1, max_depth, check_cancelled_callback, item_discovered_callback,
+                visited
+            ))
         
     except Exception as e:
         print(f"Error analyzing directory {path_str}: {e}")
@@ -475,66 +520,20 @@ def analyze_directory_recursively_realtime(path_str, current_depth=0, max_depth=
 
 def analyze_directory_recursively_optimized(path_str, current_depth=0, max_depth=10, 
                                           check_cancelled_callback=None, item_discovered_callback=None,
-                                          batch_size=50):
+                                          batch_size=50, visited=None):
     """
     Optimized version of directory analysis with performance improvements:
     - Batch UI updates to reduce overhead
     - Optimized data structures
     - Better memory management
     """
-    if check_cancelled_callback and check_cancelled_callback():
-        return {
-            'name': os.path.basename(path_str), 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_cancelled',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0, 
-            'last_modified_timestamp': 0
-        }
-
-    dir_stat_info = None
-    try:
-        dir_stat_info = os.stat(path_str)
-    except Exception:
-        return {
-            'name': os.path.basename(path_str) if path_str else "Unknown", 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_inaccessible',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0, 
-            'last_modified_timestamp': 0
-        }
-
-    if current_depth > max_depth:
-        return {
-            'name': os.path.basename(path_str), 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_max_depth',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0,
-            'last_modified_timestamp': dir_stat_info.st_mtime if dir_stat_info else 0
-        }
-
-    dir_data = {
-        'name': os.path.basename(path_str) if path_str else "Unknown",
-        'path': path_str,
-        'size': 0,
-        'type': 'folder',
-        'direct_files': [],
-        'sub_folders': [],
-        'file_count': 0,
-        'folder_count': 0,
-        'last_modified_timestamp': dir_stat_info.st_mtime if dir_stat_info else 0
-    }
+    if visited is None:
+        visited = _VisitedDirectories()  # Start of a new scan
+    dir_data, dir_stat_info = _begin_directory_scan(
+        path_str, current_depth, max_depth, check_cancelled_callback, visited
+    )
+    if dir_stat_info is None:
+        return dir_data
 
     # Batch items for UI updates
     discovered_items_batch = []
@@ -557,92 +556,60 @@ def analyze_directory_recursively_optimized(path_str, current_depth=0, max_depth
             'depth': current_depth
         })
 
-    search_pattern = os.path.join(path_str, "*")
-    find_data = WIN32_FIND_DATAW()
-    
     try:
-        handle = FindFirstFileW(search_pattern, ctypes.byref(find_data))
-        if handle == INVALID_HANDLE_VALUE:
+        listing = _list_directory(
+            path_str, check_cancelled_callback,
+            prefetch=current_depth < max_depth
+        )
+        if listing is None:
+            flush_batch()  # Send remaining items
             return dir_data
-            
-        # Pre-allocate lists for better performance
-        subdirs_to_process = []
+        files_listed, subdirs_to_process = listing
         
-        while True:
+        for item_path, filename, last_modified in subdirs_to_process:
+            # Add to batch for UI update
+            if item_discovered_callback and current_depth < 4:  # Limit UI updates depth
+                discovered_items_batch.append({
+                    'type': 'folder',
+                    'path': item_path,
+                    'parent_path': path_str,
+                    'name': filename,
+                    'depth': current_depth + 1,
+                    'last_modified': last_modified
+                })
+                
+            # Batch processing for UI updates
+            batch_count += 1
+            if batch_count >= batch_size:
+                flush_batch()
+                batch_count = 0
+        
+        for item_path, filename, file_size, last_modified in files_listed:
             if check_cancelled_callback and check_cancelled_callback():
-                FindClose(handle)
                 flush_batch()  # Send remaining items
                 return dir_data
                 
-            filename = find_data.cFileName
-            if filename in ['.', '..']:
-                if not FindNextFileW(handle, ctypes.byref(find_data)):
-                    break
-                continue
-                
-            item_path = os.path.join(path_str, filename)
-            is_directory = find_data.dwFileAttributes & FILE_ATTRIBUTE_DIRECTORY
-            is_reparse_point = find_data.dwFileAttributes & FILE_ATTRIBUTE_REPARSE_POINT
-            
-            # Calculate file size
-            file_size = (find_data.nFileSizeHigh << 32) + find_data.nFileSizeLow
-            last_modified = filetime_to_unix_timestamp(find_data.ftLastWriteTime)
-            
-            if is_directory and not is_reparse_point:
-                # Store subdirectory for later processing
-                subdirs_to_process.append((item_path, filename, last_modified))
-                
-                # Add to batch for UI update
-                if item_discovered_callback and current_depth < 4:  # Limit UI updates depth
-                    discovered_items_batch.append({
-                        'type': 'folder',
-                        'path': item_path,
-                        'parent_path': path_str,
-                        'name': filename,
-                        'depth': current_depth + 1,
-                        'last_modified': last_modified
-                    })
-                
-            elif not is_directory:
-                # Regular file - optimize data structure
-                file_data = {
-                    'name': filename,
+            # Add to batch for UI update (only for larger files or in smaller directories)
+            if item_discovered_callback and current_depth < 4 and (file_size > 1024*1024 or len(dir_data['direct_files']) < 20):
+                discovered_items_batch.append({
+                    'type': 'file',
                     'path': item_path,
+                    'parent_path': path_str,
+                    'name': filename,
                     'size': file_size,
-                    'type': 'file',
-                    'direct_files': [],
-                    'sub_folders': [],
-                    'file_count': 1,
-                    'folder_count': 0,
-                    'last_modified_timestamp': last_modified
-                }
-                
-                # Add to batch for UI update (only for larger files or in smaller directories)
-                if item_discovered_callback and current_depth < 4 and (file_size > 1024*1024 or len(dir_data['direct_files']) < 20):
-                    discovered_items_batch.append({
-                        'type': 'file',
-                        'path': item_path,
-                        'parent_path': path_str,
-                        'name': filename,
-                        'size': file_size,
-                        'depth': current_depth + 1,
-                        'last_modified': last_modified
-                    })
-                
-                dir_data['direct_files'].append(file_data)
-                dir_data['size'] += file_size
-                dir_data['file_count'] += 1
+                    'depth': current_depth + 1,
+                    'last_modified': last_modified
+                })
+            
+            dir_data['direct_files'].append(_make_file_result(item_path, filename, file_size, last_modified))
+            dir_data['size'] += file_size
+            dir_data['file_count'] += 1
                 
             # Batch processing for UI updates
             batch_count += 1
             if batch_count >= batch_size:
                 flush_batch()
                 batch_count = 0
-                
-            if not FindNextFileW(handle, ctypes.byref(find_data)):
-                break
-                
-        FindClose(handle)
         
         # Flush remaining batch items
         flush_batch()
@@ -652,14 +619,10 @@ def analyze_directory_recursively_optimized(path_str, current_depth=0, max_depth
             if check_cancelled_callback and check_cancelled_callback():
                 break
                 
-            subfolder_data = analyze_directory_recursively_optimized(
+            _add_subfolder(dir_data, analyze_directory_recursively_optimized(
                 subdir_path, current_depth + 1, max_depth, check_cancelled_callback, 
-                item_discovered_callback, batch_size
-            )
-            dir_data['sub_folders'].append(subfolder_data)
-            dir_data['size'] += subfolder_data['size']
-            dir_data['file_count'] += subfolder_data['file_count']
-            dir_data['folder_count'] += subfolder_data['folder_count'] + 1
+                item_discovered_callback, batch_size, visited
+            ))
         
     except Exception as e:
         print(f"Error analyzing directory {path_str}: {e}")
@@ -669,7 +632,7 @@ def analyze_directory_recursively_optimized(path_str, current_depth=0, max_depth
 
 def analyze_directory_parallel(path_str, current_depth=0, max_depth=10, 
                              check_cancelled_callback=None, item_discovered_callback=None,
-                             max_workers=4):
+                             max_workers=4, visited=None):
     """
     Ultra-optimized parallel version for maximum performance:
     - Multi-threaded scanning of subdirectories
@@ -677,71 +640,26 @@ def analyze_directory_parallel(path_str, current_depth=0, max_depth=10,
     - Parallel processing of large directories
     """
     import concurrent.futures
-    from threading import Lock
     
     if check_cancelled_callback and check_cancelled_callback():
-        return {
-            'name': os.path.basename(path_str), 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_cancelled',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0, 
-            'last_modified_timestamp': 0
-        }
+        return _make_folder_result(path_str, 'folder_cancelled')
+
+    if visited is None:
+        visited = _VisitedDirectories()  # Start of a new scan
 
     # Use sequential scanning for deep levels to avoid thread overhead
     if current_depth > 3:
         return analyze_directory_recursively_optimized(
             path_str, current_depth, max_depth, check_cancelled_callback,
-            item_discovered_callback, batch_size=100
+            item_discovered_callback, batch_size=100, visited=visited
         )
 
-    dir_stat_info = None
-    try:
-        dir_stat_info = os.stat(path_str)
-    except Exception:
-        return {
-            'name': os.path.basename(path_str) if path_str else "Unknown", 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_inaccessible',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0, 
-            'last_modified_timestamp': 0
-        }
+    dir_data, dir_stat_info = _begin_directory_scan(path_str, current_depth, max_depth, None, visited)
+    if dir_stat_info is None:
+        return dir_data
 
-    if current_depth > max_depth:
-        return {
-            'name': os.path.basename(path_str), 
-            'path': path_str, 
-            'size': 0, 
-            'type': 'folder_max_depth',
-            'direct_files': [], 
-            'sub_folders': [], 
-            'file_count': 0, 
-            'folder_count': 0,
-            'last_modified_timestamp': dir_stat_info.st_mtime if dir_stat_info else 0
-        }
-
-    dir_data = {
-        'name': os.path.basename(path_str) if path_str else "Unknown",
-        'path': path_str,
-        'size': 0,
-        'type': 'folder',
-        'direct_files': [],
-        'sub_folders': [],
-        'file_count': 0,
-        'folder_count': 0,
-        'last_modified_timestamp': dir_stat_info.st_mtime if dir_stat_info else 0
-    }
-
-    # Thread-safe callback lock
-    callback_lock = Lock()
+    # Thread-safe callback lock
+    callback_lock = Lock()
 
     def safe_callback(item_data):
         """Thread-safe callback wrapper"""
@@ -749,61 +667,15 @@ def analyze_directory_parallel(path_str, current_depth=0, max_depth=10,
             with callback_lock:
                 item_discovered_callback(item_data)
 
-    search_pattern = os.path.join(path_str, "*")
-    find_data = WIN32_FIND_DATAW()
-    
     try:
-        handle = FindFirstFileW(search_pattern, ctypes.byref(find_data))
-        if handle == INVALID_HANDLE_VALUE:
-            return dir_data
-            
         # Collect all items first for parallel processing
-        subdirs_to_process = []
-        files_to_process = []
-        
-        while True:
-            if check_cancelled_callback and check_cancelled_callback():
-                FindClose(handle)
-                return dir_data
-                
-            filename = find_data.cFileName
-            if filename in ['.', '..']:
-                if not FindNextFileW(handle, ctypes.byref(find_data)):
-                    break
-                continue
-                
-            item_path = os.path.join(path_str, filename)
-            is_directory = find_data.dwFileAttributes & FILE_ATTRIBUTE_DIRECTORY
-            is_reparse_point = find_data.dwFileAttributes & FILE_ATTRIBUTE_REPARSE_POINT
-            
-            # Calculate file size
-            file_size = (find_data.nFileSizeHigh << 32) + find_data.nFileSizeLow
-            last_modified = filetime_to_unix_timestamp(find_data.ftLastWriteTime)
-            
-            if is_directory and not is_reparse_point:
-                subdirs_to_process.append((item_path, filename, last_modified))
-            elif not is_directory:
-                files_to_process.append((item_path, filename, file_size, last_modified))
-                
-            if not FindNextFileW(handle, ctypes.byref(find_data)):
-                break
-                
-        FindClose(handle)
+        listing = _list_directory(path_str, check_cancelled_callback=check_cancelled_callback)
+        if listing is None:
+            return dir_data
+        files_to_process, subdirs_to_process = listing
         
         # Process files sequentially (fast)
         for file_path, filename, file_size, last_modified in files_to_process:
-            file_data = {
-                'name': filename,
-                'path': file_path,
-                'size': file_size,
-                'type': 'file',
-                'direct_files': [],
-                'sub_folders': [],
-                'file_count': 1,
-                'folder_count': 0,
-                'last_modified_timestamp': last_modified
-            }
-            
             # Limited UI updates for performance
             if current_depth < 3 and (file_size > 10*1024*1024 or len(dir_data['direct_files']) < 10):
                 safe_callback({
@@ -816,7 +688,7 @@ def analyze_directory_parallel(path_str, current_depth=0, max_depth=10,
                     'last_modified': last_modified
                 })
             
-            dir_data['direct_files'].append(file_data)
+            dir_data['direct_files'].append(_make_file_result(file_path, filename, file_size, last_modified))
             dir_data['size'] += file_size
             dir_data['file_count'] += 1
 
@@ -830,7 +702,7 @@ def analyze_directory_parallel(path_str, current_depth=0, max_depth=10,
                         
                     return analyze_directory_parallel(
                         subdir_path, current_depth + 1, max_depth, check_cancelled_callback, 
-                        safe_callback, max_workers
+                        safe_callback, max_workers, visited
                     )
                 
                 # Submit all subdirectory tasks
@@ -844,24 +716,17 @@ def analyze_directory_parallel(path_str, current_depth=0, max_depth=10,
                         
                     subfolder_data = future.result()
                     if subfolder_data:
-                        dir_data['sub_folders'].append(subfolder_data)
-                        dir_data['size'] += subfolder_data['size']
-                        dir_data['file_count'] += subfolder_data['file_count']
-                        dir_data['folder_count'] += subfolder_data['folder_count'] + 1
+                        _add_subfolder(dir_data, subfolder_data)
         else:
             # Sequential processing for single subdirectory
             for subdir_path, subdir_name, subdir_modified in subdirs_to_process:
                 if check_cancelled_callback and check_cancelled_callback():
                     break
                     
-                subfolder_data = analyze_directory_parallel(
+                _add_subfolder(dir_data, analyze_directory_parallel(
                     subdir_path, current_depth + 1, max_depth, check_cancelled_callback, 
-                    safe_callback, max_workers
-                )
-                dir_data['sub_folders'].append(subfolder_data)
-                dir_data['size'] += subfolder_data['size']
-                dir_data['file_count'] += subfolder_data['file_count']
-                dir_data['folder_count'] += subfolder_data['folder_count'] + 1
+                    safe_callback, max_workers, visited
+                ))
         
     except Exception as e:
         print(f"Error analyzing directory {path_str}: {e}")
@@ -896,13 +761,75 @@ CloseHandle.restype = wintypes.BOOL
 GENERIC_READ = 0x80000000
 FILE_SHARE_READ = 0x00000001
 FILE_SHARE_WRITE = 0x00000002
+FILE_SHARE_DELETE = 0x00000004
+FILE_LIST_DIRECTORY = 0x00000001
 OPEN_EXISTING = 3
 FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+ERROR_INVALID_PARAMETER = 87
 FSCTL_GET_NTFS_VOLUME_DATA = 0x00090064
 FSCTL_GET_NTFS_FILE_RECORD = 0x00090068
 FSCTL_ENUM_USN_DATA = 0x000900b3
 FSCTL_READ_USN_JOURNAL = 0x000900bb
 FSCTL_QUERY_USN_JOURNAL = 0x000900f4
+IOCTL_STORAGE_QUERY_PROPERTY = 0x002d1400
+StorageDeviceSeekPenaltyProperty = 7
+PropertyStandardQuery = 0
+
+class STORAGE_PROPERTY_QUERY(ctypes.Structure):
+    _fields_ = [
+        ("PropertyId", ctypes.c_int),
+        ("QueryType", ctypes.c_int),
+        ("AdditionalParameters", ctypes.c_ubyte * 1),
+    ]
+
+class DEVICE_SEEK_PENALTY_DESCRIPTOR(ctypes.Structure):
+    _fields_ = [
+        ("Version", wintypes.DWORD),
+        ("Size", wintypes.DWORD),
+        ("IncursSeekPenalty", wintypes.BOOLEAN),
+    ]
+
+# Native directory enumeration (NtQueryDirectoryFile)
+ntdll = ctypes.WinDLL('ntdll')
+
+class IO_STATUS_BLOCK(ctypes.Structure):
+    _fields_ = [
+        ("Status", ctypes.c_void_p),             # Union of NTSTATUS Status / PVOID Pointer
+        ("Information", ctypes.c_size_t),
+    ]
+
+class FILE_BOTH_DIR_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ("NextEntryOffset", wintypes.ULONG),
+        ("FileIndex", wintypes.ULONG),
+        ("CreationTime", ctypes.c_longlong),
+        ("LastAccessTime", ctypes.c_longlong),
+        ("LastWriteTime", ctypes.c_longlong),    # FILETIME units
+        ("ChangeTime", ctypes.c_longlong),
+        ("EndOfFile", ctypes.c_longlong),
+        ("AllocationSize", ctypes.c_longlong),
+        ("FileAttributes", wintypes.ULONG),
+        ("FileNameLength", wintypes.ULONG),      # In bytes
+        ("EaSize", wintypes.ULONG),              # Reparse tag for reparse points
+        ("ShortNameLength", ctypes.c_byte),
+        ("ShortName", wintypes.WCHAR * 12),
+        # FileName (WCHAR[FileNameLength / 2]) follows
+    ]
+
+# FileName starts right after ShortName, before the structure's trailing padding
+_FILE_BOTH_DIR_NAME_OFFSET = FILE_BOTH_DIR_INFORMATION.ShortName.offset + ctypes.sizeof(wintypes.WCHAR * 12)
+# NextEntryOffset, LastWriteTime, EndOfFile, FileAttributes, FileNameLength and EaSize
+# unpacked from the raw entry in one call
+_FILE_BOTH_DIR_FIELDS = struct.Struct('<I20xq8xq8xIII')
+
+NtQueryDirectoryFile = ntdll.NtQueryDirectoryFile
+NtQueryDirectoryFile.argtypes = [wintypes.HANDLE, wintypes.HANDLE, wintypes.LPVOID, wintypes.LPVOID,
+                                 ctypes.POINTER(IO_STATUS_BLOCK), wintypes.LPVOID, wintypes.ULONG,
+                                 ctypes.c_int, wintypes.BOOLEAN, wintypes.LPVOID, wintypes.BOOLEAN]
+NtQueryDirectoryFile.restype = ctypes.c_long  # NTSTATUS, negative on errors and STATUS_NO_MORE_FILES
+
+FileBothDirectoryInformation = 3
+NT_QUERY_BUFFER_SIZE = 64 * 1024
 
 # MFT Structures
 class NTFS_VOLUME_DATA_BUFFER(ctypes.Structure):
@@ -947,6 +874,16 @@ class MFT_ENUM_DATA_V0(ctypes.Structure):
         ("HighUsn", ULARGE_INTEGER),
     ]
 
+class MFT_ENUM_DATA_V1(ctypes.Structure):
+    _fields_ = [
+        ("StartFileReferenceNumber", ULARGE_INTEGER),
+        ("LowUsn", ULARGE_INTEGER),
+        ("HighUsn", ULARGE_INTEGER),
+        ("MinMajorVersion", wintypes.WORD),      # Range of USN record versions to return
+        ("MaxMajorVersion", wintypes.WORD),
+        ("Padding", wintypes.DWORD),             # Native struct is 8-byte aligned (32 bytes)
+    ]
+
 class USN_RECORD_V2(ctypes.Structure):
     _fields_ = [
         ("RecordLength", wintypes.DWORD),
@@ -1001,10 +938,197 @@ ATTRIBUTE_TYPE_DATA = 0x80
 FILE_RECORD_FLAG_INUSE = 0x01
 FILE_RECORD_FLAG_DIRECTORY = 0x02
 
-def analyze_directory_mft_direct(path_str, check_cancelled_callback=None, item_discovered_callback=None):
+# Byte offsets used by the vectorised MFT record parser
+_MFT_SIGNATURE_OFFSET = MFT_FILE_RECORD_HEADER.Signature.offset
+_MFT_FIRST_ATTRIBUTE_OFFSET = MFT_FILE_RECORD_HEADER.FirstAttributeOffset.offset
+_MFT_FLAGS_OFFSET = MFT_FILE_RECORD_HEADER.Flags.offset
+_MFT_REAL_SIZE_OFFSET = MFT_FILE_RECORD_HEADER.RealSize.offset
+_ATTRIBUTE_TYPE_OFFSET = ATTRIBUTE_RECORD_HEADER.AttributeType.offset
+_ATTRIBUTE_LENGTH_OFFSET = ATTRIBUTE_RECORD_HEADER.RecordLength.offset
+_FILENAME_LENGTH_OFFSET = 24 + 64  # Resident data + FILE_NAME name length byte
+_FILENAME_NAME_OFFSET = 24 + 66    # Resident data + FILE_NAME name characters
+ATTRIBUTE_TYPE_END = 0xFFFFFFFF
+_MFT_MAX_ATTRIBUTE_HOPS = 32
+MFT_READ_SIZE = 8 * 1024 * 1024  # Bytes per MFT read request
+MFT_PARSE_CHUNK_RECORDS = 1000   # Records parsed at a time so the working set stays in cache
+
+
+def _read_le(records, rows, offsets, width):
+    """Read little-endian unsigned integers of the given byte width at per-row offsets"""
+    value = np.zeros(len(rows), dtype=np.uint64)
+    for byte in range(width):
+        value |= records[rows, offsets + byte].astype(np.uint64) << np.uint64(8 * byte)
+    return value
+
+
+def _parse_mft_batch(buf_u8, bytes_per_record, record_count):
+    """
+    Parse a batch of raw MFT FILE records with vectorised numpy operations
+    Returns (in_use, is_dir, real_size, name_start, name_length) arrays; name_start is
+    the byte offset of the UTF-16LE name in buf_u8 and name_length is in characters
+    (0 when no FILENAME attribute was found)
+    """
+    records = buf_u8[:record_count * bytes_per_record].reshape(record_count, bytes_per_record)
+
+    def header_field(offset, dtype):
+        # Reinterpret one fixed header column of every record as a little-endian integer
+        width = np.dtype(dtype).itemsize
+        return np.ascontiguousarray(records[:, offset:offset + width]).view(dtype)[:, 0]
+
+    # Signature and in-use checks for the whole batch in single array comparisons
+    flags = header_field(_MFT_FLAGS_OFFSET, '<u2')
+    in_use = ((header_field(_MFT_SIGNATURE_OFFSET, '<u4') == MFT_RECORD_SIGNATURE)
+              & ((flags & FILE_RECORD_FLAG_INUSE) != 0))
+    is_dir = (flags & FILE_RECORD_FLAG_DIRECTORY) != 0
+    real_size = header_field(_MFT_REAL_SIZE_OFFSET, '<u4').astype(np.int64)
+
+    name_start = np.zeros(record_count, dtype=np.int64)
+    name_length = np.zeros(record_count, dtype=np.int64)
+
+    # Walk the attribute chains of all records in lock-step until each one finds its
+    # FILENAME attribute or runs out of attributes
+    attr_offset = header_field(_MFT_FIRST_ATTRIBUTE_OFFSET, '<u2').astype(np.int64)
+    active = in_use.copy()
+    for _ in range(_MFT_MAX_ATTRIBUTE_HOPS):
+        active &= attr_offset < bytes_per_record - 16  # Minimum attribute header size
+        live = np.flatnonzero(active)
+        if live.size == 0:
+            break
+
+        offsets = attr_offset[live]
+        attr_type = _read_le(records, live, offsets + _ATTRIBUTE_TYPE_OFFSET, 4)
+        attr_length = _read_le(records, live, offsets + _ATTRIBUTE_LENGTH_OFFSET, 4).astype(np.int64)
+
+        found = (attr_type == ATTRIBUTE_TYPE_FILENAME) & (attr_length > 0)
+        found &= offsets + _FILENAME_NAME_OFFSET < bytes_per_record
+        found_rows = live[found]
+        found_offsets = offsets[found]
+        lengths = records[found_rows, found_offsets + _FILENAME_LENGTH_OFFSET].astype(np.int64)
+        fits = (lengths > 0) & (found_offsets + _FILENAME_NAME_OFFSET + lengths * 2 <= bytes_per_record)
+        name_start[found_rows[fits]] = found_rows[fits] * bytes_per_record + found_offsets[fits] + _FILENAME_NAME_OFFSET
+        name_length[found_rows[fits]] = lengths[fits]
+
+        # Stop at the first FILENAME attribute, the end marker or a corrupt length
+        done = (attr_type == ATTRIBUTE_TYPE_FILENAME) | (attr_type == ATTRIBUTE_TYPE_END) | (attr_length == 0)
+        active[live[done]] = False
+        attr_offset[live] += attr_length
+
+    return in_use, is_dir, real_size, name_start, name_length
+
+
+def _mft_name_skip_mask(buf_u8, name_start, name_length):
+    """
+    Flag records whose FILENAME marks a system/metadata file ($ or ~ prefix) or is longer
+    than 200 characters, using the raw UTF-16LE bytes so the names never need decoding
+    """
+    has_name = name_length > 0
+    starts = name_start[has_name]
+    first_char = np.zeros(len(name_length), dtype=np.uint16)
+    first_char[has_name] = buf_u8[starts] | (buf_u8[starts + 1].astype(np.uint16) << 8)
+    return (first_char == ord('$')) | (first_char == ord('~')) | (name_length > 200)
+
+
+def _parse_mft_chunks(buf_u8, bytes_per_record, record_count, chunk_records=MFT_PARSE_CHUNK_RECORDS):
+    """Run _parse_mft_batch over cache-sized sub-chunks of a large read and join the results"""
+    parts = []
+    for chunk_start in range(0, record_count, chunk_records):
+        chunk_count = min(chunk_records, record_count - chunk_start)
+        chunk_base = chunk_start * bytes_per_record
+        in_use, is_dir, real_size, name_start, name_length = _parse_mft_batch(
+            buf_u8[chunk_base:chunk_base + chunk_count * bytes_per_record], bytes_per_record, chunk_count
+        )
+        parts.append((in_use, is_dir, real_size, name_start + chunk_base, name_length))
+    if not parts:
+        return _parse_mft_batch(buf_u8, bytes_per_record, 0)
+    return tuple(np.concatenate(column) for column in zip(*parts))
+
+
+# Volume handles kept open per drive letter across scans, closed at interpreter exit
+_VOLUME_HANDLE_CACHE = {}
+_VOLUME_HANDLE_LOCK = Lock()
+
+
+def _close_all_volumes():
+    """Close every cached volume handle"""
+    with _VOLUME_HANDLE_LOCK:
+        for volume_handle in _VOLUME_HANDLE_CACHE.values():
+            CloseHandle(volume_handle)
+        _VOLUME_HANDLE_CACHE.clear()
+
+
+atexit.register(_close_all_volumes)
+
+
+def _evict_volume_handle(drive_letter):
+    """Close and forget a cached volume handle that stopped working"""
+    with _VOLUME_HANDLE_LOCK:
+        volume_handle = _VOLUME_HANDLE_CACHE.pop(drive_letter, None)
+    if volume_handle is not None:
+        CloseHandle(volume_handle)
+
+
+def _open_ntfs_volume(drive_letter):
+    """
+    Get the (cached) volume handle of a drive for the MFT strategies and fetch its
+    NTFS volume data
+    Returns (volume_handle, volume_data), the handle stays owned by the cache
+    """
+    with _VOLUME_HANDLE_LOCK:
+        volume_handle = _VOLUME_HANDLE_CACHE.get(drive_letter)
+        if volume_handle is None:
+            volume_path = f"\\\\.\\{drive_letter}:"
+            print(f"Volume path: {volume_path}")
+            
+            volume_handle = CreateFileW(
+                volume_path,
+                GENERIC_READ,
+                FILE_SHARE_READ | FILE_SHARE_WRITE,
+                None,
+                OPEN_EXISTING,
+                FILE_FLAG_BACKUP_SEMANTICS,
+                None
+            )
+            
+            if volume_handle == INVALID_HANDLE_VALUE:
+                error = ctypes.get_last_error()
+                raise Exception(f"Cannot open volume {drive_letter}: (error {error}, requires admin privileges)")
+            
+            _VOLUME_HANDLE_CACHE[drive_letter] = volume_handle
+            print(f"✅ Successfully opened volume handle: {volume_handle}")
+    
+    # Volume data is queried on every scan, the MFT grows between scans
+    volume_data = NTFS_VOLUME_DATA_BUFFER()
+    bytes_returned = wintypes.DWORD()
+    
+    success = DeviceIoControl(
+        volume_handle,
+        FSCTL_GET_NTFS_VOLUME_DATA,
+        None, 0,
+        ctypes.byref(volume_data), ctypes.sizeof(volume_data),
+        ctypes.byref(bytes_returned),
+        None
+    )
+    
+    if not success:
+        error = ctypes.get_last_error()
+        _evict_volume_handle(drive_letter)
+        raise Exception(f"Failed to get NTFS volume data (error {error})")
+        
+    print(f"✅ NTFS Volume Data Retrieved:")
+    print(f"   📊 Bytes per MFT record: {volume_data.BytesPerFileRecordSegment}")
+    print(f"   📊 MFT Start LCN: {volume_data.MftStartLcn.QuadPart}")
+    print(f"   📊 Bytes per sector: {volume_data.BytesPerSector}")
+    print(f"   📊 Bytes per cluster: {volume_data.BytesPerCluster}")
+    
+    return volume_handle, volume_data
+
+
+def analyze_directory_mft_direct(path_str, check_cancelled_callback=None, item_discovered_callback=None,
+                                 strategies=None):
     """
     Ultra-optimized MFT (Master File Table) direct access scanning for NTFS drives
-    This implementation uses true MFT direct access for maximum performance
+    Tries the given strategies (names from MFT_STRATEGIES, default MFT_ENABLED_STRATEGIES)
+    in order, the volume is only opened when one of them needs it
     """
     try:
         # Extract drive letter from path
@@ -1012,93 +1136,31 @@ def analyze_directory_mft_direct(path_str, check_cancelled_callback=None, item_d
             raise Exception("Invalid drive path for MFT access")
             
         drive_letter = path_str[0].upper()
-        volume_path = f"\\\\.\\{drive_letter}:"
-        
         print(f"🚀 Starting ULTRA-OPTIMIZED MFT direct access for drive {drive_letter}:")
-        print(f"Volume path: {volume_path}")
         
-        # Open the volume
-        volume_handle = CreateFileW(
-            volume_path,
-            GENERIC_READ,
-            FILE_SHARE_READ | FILE_SHARE_WRITE,
-            None,
-            OPEN_EXISTING,
-            FILE_FLAG_BACKUP_SEMANTICS,
-            None
-        )
-        
-        if volume_handle == INVALID_HANDLE_VALUE:
-            error = ctypes.get_last_error()
-            raise Exception(f"Cannot open volume {drive_letter}: (error {error}, requires admin privileges)")
-        
-        print(f"✅ Successfully opened volume handle: {volume_handle}")
-        
-        try:
-            # Get NTFS volume data
-            volume_data = NTFS_VOLUME_DATA_BUFFER()
-            bytes_returned = wintypes.DWORD()
-            
-            success = DeviceIoControl(
-                volume_handle,
-                FSCTL_GET_NTFS_VOLUME_DATA,
-                None, 0,
-                ctypes.byref(volume_data), ctypes.sizeof(volume_data),
-                ctypes.byref(bytes_returned),
-                None
-            )
-            
-            if not success:
-                error = ctypes.get_last_error()
-                raise Exception(f"Failed to get NTFS volume data (error {error})")
-                
-            print(f"✅ NTFS Volume Data Retrieved:")
-            print(f"   📊 Bytes per MFT record: {volume_data.BytesPerFileRecordSegment}")
-            print(f"   📊 MFT Start LCN: {volume_data.MftStartLcn.QuadPart}")
-            print(f"   📊 Bytes per sector: {volume_data.BytesPerSector}")
-            print(f"   📊 Bytes per cluster: {volume_data.BytesPerCluster}")
-            
-            # Try USN Journal enumeration first (fastest method)
-            # NOTE: USN Journal enumeration only shows recent changes, not complete file system
-            # For complete disk analysis, skip directly to MFT record reading
-            try:
-                print("🔥 Skipping USN Journal (only shows recent changes)")
-                print("🔥 Attempting limited MFT record reading...")
-                # Try MFT direct but with strict limits to fall back quickly
-                raise Exception("Skipping MFT direct for complete scan - parallel method gives better results")
-                
-                return _enumerate_usn_journal_ultra_fast(
-                    volume_handle, volume_data, path_str, 
-                    check_cancelled_callback, item_discovered_callback
-                )
-            except Exception as usn_error:
-                print(f"⚠️ MFT direct skipped: {usn_error}")
+        volume_handle = None
+        volume_data = None
+        for strategy in strategies or MFT_ENABLED_STRATEGIES:
+            if strategy in _MFT_VOLUME_STRATEGIES and volume_handle is None:
+                volume_handle, volume_data = _open_ntfs_volume(drive_letter)
                 
-            # Fallback to direct MFT reading (still very fast)
+            print(f"🔥 Trying MFT strategy: {strategy}")
             try:
-                print("🔥 Skipping MFT record reading...")
-                print("🔥 Going directly to parallel scanning for better results...")
-                raise Exception("MFT direct skipped - parallel scanning gives more complete results")
-                
-                return _read_mft_records_direct(
+                result = MFT_STRATEGIES[strategy](
                     volume_handle, volume_data, path_str,
                     check_cancelled_callback, item_discovered_callback
                 )
-            except Exception as mft_error:
-                print(f"⚠️ Direct MFT reading skipped: {mft_error}")
+            except Exception as strategy_error:
+                print(f"⚠️ MFT strategy {strategy} failed: {strategy_error}")
+                continue
                 
-            # Final fallback to optimized directory traversal
-            print("🔄 Falling back to ultra-fast directory traversal...")
-            result = _mft_turbo_scan(volume_handle, path_str, check_cancelled_callback, item_discovered_callback)
-            # Set the scan method for the fallback
-            if result:
+            # Set the scan method for the directory traversal
+            if result and strategy == 'parallel':
                 result['scan_method'] = 'MFT_TURBO_FALLBACK'
             return result
             
-        finally:
-            CloseHandle(volume_handle)
-            print("✅ Volume handle closed")
-            
+        raise Exception("No enabled MFT strategy completed")
+        
     except Exception as e:
         print(f"❌ MFT direct access failed: {e}")
         print("🔄 Falling back to optimized parallel scanning...")
@@ -1113,6 +1175,143 @@ def analyze_directory_mft_direct(path_str, check_cancelled_callback=None, item_d
         return result
 
 
+# Shapes of the sample entries the MFT paths return for the tree view, copied per entry
+_SAMPLE_FOLDER_TEMPLATE = {
+    'name': '', 'path': '', 'size': 0, 'type': 'folder', 'direct_files': None,
+    'sub_folders': None, 'file_count': 0, 'folder_count': 1, 'last_modified_timestamp': 0
+}
+_SAMPLE_FILE_TEMPLATE = {
+    'name': '', 'path': '', 'size': 0, 'type': 'file', 'direct_files': None,
+    'sub_folders': None, 'file_count': 1, 'folder_count': 0, 'last_modified_timestamp': 0
+}
+
+
+def _make_sample_folder(name, path):
+    entry = _SAMPLE_FOLDER_TEMPLATE.copy()
+    entry['name'] = name
+    entry['path'] = path
+    entry['direct_files'] = []
+    entry['sub_folders'] = []
+    return entry
+
+
+def _make_sample_file(name, path, size):
+    entry = _SAMPLE_FILE_TEMPLATE.copy()
+    entry['name'] = name
+    entry['path'] = path
+    entry['size'] = size
+    entry['direct_files'] = []
+    entry['sub_folders'] = []
+    return entry
+
+
+class _SampleColumns:
+    """Sample entries kept column-wise, only turned into entry dicts for the result"""
+
+    def __init__(self):
+        self.names = []
+        self.paths = []
+        self.sizes = []
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name, path, size=0):
+        self.names.append(name)
+        self.paths.append(path)
+        self.sizes.append(size)
+
+    def folder_entries(self):
+        return [_make_sample_folder(name, path) for name, path in zip(self.names, self.paths)]
+
+    def file_entries(self):
+        return [_make_sample_file(name, path, size) for name, path, size in zip(self.names, self.paths, self.sizes)]
+
+
+DISCOVERY_BATCH_SIZE = 256  # Items handed to item_discovered_callback per call
+
+
+class _DiscoveryBatcher:
+    """
+    Collects discovered items column-wise and hands them to item_discovered_callback
+    as a list of item dicts once a batch is full
+    """
+
+    def __init__(self, callback, batch_size=DISCOVERY_BATCH_SIZE):
+        self.callback = callback
+        self.batch_size = batch_size
+        self.types = []
+        self.paths = []
+        self.parent_paths = []
+        self.names = []
+        self.sizes = []
+
+    def add(self, item_type, path, parent_path, name, size):
+        self.types.append(item_type)
+        self.paths.append(path)
+        self.parent_paths.append(parent_path)
+        self.names.append(name)
+        self.sizes.append(size)
+        if len(self.types) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Build the item dicts for everything collected so far and emit them"""
+        if not self.types:
+            return
+        batch = [
+            {
+                'type': item_type,
+                'path': path,
+                'parent_path': parent_path,
+                'name': name,
+                'size': size,
+                'depth': 1,
+                'last_modified': 0
+            }
+            for item_type, path, parent_path, name, size
+            in zip(self.types, self.paths, self.parent_paths, self.names, self.sizes)
+        ]
+        self.types, self.paths, self.parent_paths, self.names, self.sizes = [], [], [], [], []
+        self.callback(batch)
+
+
+# USN_RECORD_V2 header as a numpy structured dtype, laid out exactly like the ctypes structure
+USN_RECORD_V2_DTYPE = np.dtype({
+    'names': ['RecordLength', 'MajorVersion', 'MinorVersion', 'FileReferenceNumber',
+              'ParentFileReferenceNumber', 'Usn', 'TimeStamp', 'Reason', 'SourceInfo',
+              'SecurityId', 'FileAttributes', 'FileNameLength', 'FileNameOffset'],
+    'formats': ['<u4', '<u2', '<u2', '<u8', '<u8', '<u8', '<u8', '<u4', '<u4', '<u4', '<u4', '<u2', '<u2'],
+    'offsets': [getattr(USN_RECORD_V2, name).offset for name, _ in USN_RECORD_V2._fields_],
+    'itemsize': ctypes.sizeof(USN_RECORD_V2),
+})
+_USN_RECORD_LENGTH = struct.Struct('<I').unpack_from
+_USN_HEAD = struct.Struct('<Q').unpack_from  # Next start reference at the head of each output buffer
+_USN_DOT_NAMES = ('.'.encode('utf-16le'), '..'.encode('utf-16le'))
+
+
+def _parse_usn_batch(buffer, data_length):
+    """
+    Locate the USN records in an FSCTL_ENUM_USN_DATA output buffer and gather their
+    fixed headers into one structured array
+    Returns (records, record_offsets)
+    """
+    header_size = USN_RECORD_V2_DTYPE.itemsize
+    offsets = []
+    offset = 8  # Skip the starting USN value
+    while offset + header_size <= data_length:
+        (record_length,) = _USN_RECORD_LENGTH(buffer, offset)
+        if record_length == 0 or record_length > data_length:
+            break
+        offsets.append(offset)
+        offset += record_length
+        
+    record_offsets = np.array(offsets, dtype=np.int64)
+    raw = np.frombuffer(buffer, dtype=np.uint8, count=data_length)
+    headers = raw[record_offsets[:, None] + np.arange(header_size)]
+    return headers.view(USN_RECORD_V2_DTYPE).ravel(), record_offsets
+
+
 def _enumerate_usn_journal_ultra_fast(volume_handle, volume_data, path_str, check_cancelled_callback, item_discovered_callback):
     """
     Complete MFT enumeration using USN Journal infrastructure
@@ -1120,6 +1319,9 @@ def _enumerate_usn_journal_ultra_fast(volume_handle, volume_data, path_str, chec
     """
     print("🚀 Complete MFT Enumeration via USN Infrastructure...")
     
+    result_name = os.path.basename(path_str) if path_str else f"Drive {path_str[0]}"
+    usn_prefix = "[USN] "
+    
     # Query USN Journal data first to verify it exists
     journal_data = USN_JOURNAL_DATA_V0()
     bytes_returned = wintypes.DWORD()
@@ -1144,21 +1346,27 @@ def _enumerate_usn_journal_ultra_fast(volume_handle, volume_data, path_str, chec
     print(f"   📊 Max Size: {journal_data.MaximumSize.QuadPart} bytes")
     
     # Set up MFT enumeration to get ALL file records (not just recent changes)
-    enum_data = MFT_ENUM_DATA_V0()
+    # V1 pins the record version to USN_RECORD_V2, the only layout parsed here, so
+    # volumes that default to V3 records with 128-bit references still enumerate
+    enum_data = MFT_ENUM_DATA_V1()
     enum_data.StartFileReferenceNumber.QuadPart = 0  # Start from first MFT record
     enum_data.LowUsn.QuadPart = 0  # From beginning of time
     enum_data.HighUsn.QuadPart = journal_data.NextUsn.QuadPart  # To current USN
+    enum_data.MinMajorVersion = 2
+    enum_data.MaxMajorVersion = 2
     
     # Allocate large buffer for batch processing
     buffer_size = 1024 * 1024  # 1MB buffer for maximum throughput
     buffer = (ctypes.c_byte * buffer_size)()
+    buffer_bytes = memoryview(buffer).cast('B')
     
     total_files = 0
+    total_folders = 0
     total_size = 0
-    folders_found = {}
-    files_found = {}
-    sample_files = []  # Sample files for tree view
-    sample_folders = []  # Sample folders for tree view
+    discovered = _DiscoveryBatcher(item_discovered_callback) if item_discovered_callback else None
+    sample_files = _SampleColumns()  # Sample files for tree view
+    sample_folders = _SampleColumns()  # Sample folders for tree view
+    samples_done = False  # Set once both sample lists are full
     
     print("🔥 Starting complete MFT enumeration...")
     
@@ -1180,6 +1388,15 @@ def _enumerate_usn_journal_ultra_fast(volume_handle, volume_data, path_str, chec
         
         if not success:
             error = ctypes.get_last_error()
+            if error == ERROR_INVALID_PARAMETER and isinstance(enum_data, MFT_ENUM_DATA_V1):
+                # Windows 7 and older only accept the V0 input structure
+                print(f"⚠️ MFT_ENUM_DATA_V1 not supported, retrying with V0...")
+                enum_data_v0 = MFT_ENUM_DATA_V0()
+                enum_data_v0.StartFileReferenceNumber.QuadPart = enum_data.StartFileReferenceNumber.QuadPart
+                enum_data_v0.LowUsn.QuadPart = enum_data.LowUsn.QuadPart
+                enum_data_v0.HighUsn.QuadPart = enum_data.HighUsn.QuadPart
+                enum_data = enum_data_v0
+                continue
             if error == 38:  # ERROR_HANDLE_EOF - normal completion
                 print(f"✅ MFT enumeration completed normally (EOF)")
                 break
@@ -1195,101 +1412,67 @@ def _enumerate_usn_journal_ultra_fast(volume_handle, volume_data, path_str, chec
             break
             
         # Process USN records in batch
-        offset = 8  # Skip the starting USN value
         processed_in_batch = 0
+        records, record_offsets = _parse_usn_batch(buffer, bytes_returned.value)
+        file_refs = records['FileReferenceNumber'].tolist()
+        parent_refs = records['ParentFileReferenceNumber'].tolist()
+        dir_flags = ((records['FileAttributes'] & FILE_ATTRIBUTE_DIRECTORY) != 0).tolist()
+        name_starts = (record_offsets + records['FileNameOffset']).tolist()
+        name_lengths = records['FileNameLength'].tolist()
         
-        while offset < bytes_returned.value:
+        for i in range(len(file_refs)):
             if check_cancelled_callback and check_cancelled_callback():
                 break
                 
-            # Read USN record header
-            if offset + ctypes.sizeof(USN_RECORD_V2) > bytes_returned.value:
-                break
-                
-            record = USN_RECORD_V2.from_buffer(buffer, offset)
-            
-            if record.RecordLength == 0 or record.RecordLength > buffer_size:
-                break
-                
             # Extract filename
-            filename_offset = offset + record.FileNameOffset
-            filename_length = record.FileNameLength
+            filename_offset = name_starts[i]
+            filename_length = name_lengths[i]
             
             if filename_offset + filename_length <= bytes_returned.value:
-                filename_data = (ctypes.c_wchar * (filename_length // 2)).from_buffer(buffer, filename_offset)
-                filename = ''.join(filename_data)
+                name_bytes = buffer_bytes[filename_offset:filename_offset + filename_length]
                 
-                # Include all files except . and .. 
-                if filename not in ['.', '..']:
-                    is_directory = bool(record.FileAttributes & FILE_ATTRIBUTE_DIRECTORY)
-                    
+                # Include all files except . and .. (compared on the raw UTF-16LE bytes)
+                if name_bytes not in _USN_DOT_NAMES:
+                    is_directory = dir_flags[i]
                     if is_directory:
-                        folders_found[record.FileReferenceNumber.QuadPart] = {
-                            'name': filename,
-                            'parent_ref': record.ParentFileReferenceNumber.QuadPart,
-                            'attributes': record.FileAttributes
-                        }
-                        # Collect sample folders for tree view (first 50)
-                        if len(sample_folders) < 50:
-                            sample_folders.append({
-                                'name': filename,
-                                'path': f"[USN] {filename}",
-                                'size': 0,
-                                'type': 'folder',
-                                'direct_files': [],
-                                'sub_folders': [],
-                                'file_count': 0,
-                                'folder_count': 1,
-                                'last_modified_timestamp': 0
-                            })
-                    else:
-                        # For files, we don't have size in USN record, estimate or use 0
-                        files_found[record.FileReferenceNumber.QuadPart] = {
-                            'name': filename,
-                            'parent_ref': record.ParentFileReferenceNumber.QuadPart,
-                            'attributes': record.FileAttributes,
-                            'size': 0  # USN doesn't contain file size
-                        }
-                        # Collect sample files for tree view (first 100)
-                        if len(sample_files) < 100:
-                            sample_files.append({
-                                'name': filename,
-                                'path': f"[USN] {filename}",
-                                'size': 0,
-                                'type': 'file',
-                                'direct_files': [],
-                                'sub_folders': [],
-                                'file_count': 1,
-                                'folder_count': 0,
-                                'last_modified_timestamp': 0
-                            })
-                        
+                        total_folders += 1
+                    
+                    # Only build a Python string when the name is sampled or sent to the UI
+                    filename = None
+                    if not samples_done or (discovered and processed_in_batch < 100):
+                        filename = str(name_bytes, 'utf-16le', 'surrogatepass')
+                
+                    if not samples_done:
+                        if is_directory:
+                            # Collect sample folders for tree view (first 50)
+                            if len(sample_folders) < 50:
+                                sample_folders.add(filename, usn_prefix + filename)
+                        else:
+                            # For files, we don't have size in USN record (USN doesn't contain file size)
+                            # Collect sample files for tree view (first 100)
+                            if len(sample_files) < 100:
+                                sample_files.add(filename, usn_prefix + filename, 0)
+                        samples_done = len(sample_folders) >= 50 and len(sample_files) >= 100
+                    
                     total_files += 1
                     processed_in_batch += 1
-                    
-                    # Emit discovery callback for real-time UI updates (limited)
-                    if item_discovered_callback and processed_in_batch <= 100:  # Limit UI updates
-                        item_discovered_callback({
-                            'type': 'folder' if is_directory else 'file',
-                            'path': f"[MFT:{record.FileReferenceNumber.QuadPart}] {filename}",
-                            'parent_path': f"[MFT:{record.ParentFileReferenceNumber.QuadPart}]",
-                            'name': filename,
-                            'size': 0,
-                            'depth': 1,
-                            'last_modified': 0
-                        })
-            
-            # Move to next record
-            offset += record.RecordLength
-            if offset >= bytes_returned.value:
-                break
                 
+                    # Queue discovery for real-time UI updates (limited)
+                    if discovered and processed_in_batch <= 100:  # Limit UI updates
+                        discovered.add(
+                            'folder' if is_directory else 'file',
+                            f"[MFT:{file_refs[i]}] {filename}",
+                            f"[MFT:{parent_refs[i]}]",
+                            filename,
+                            0
+                        )
+            
         print(f"⚡ Processed {processed_in_batch} records in batch {batch_count + 1}, total: {total_files}")
         batch_count += 1
         
         # Update enum_data for next batch
         if bytes_returned.value >= 8:
-            next_usn_value = ctypes.c_ulonglong.from_buffer(buffer, 0).value
+            next_usn_value = _USN_HEAD(buffer, 0)[0]
             enum_data.StartFileReferenceNumber.QuadPart = next_usn_value
         else:
             break
@@ -1299,33 +1482,46 @@ def _enumerate_usn_journal_ultra_fast(volume_handle, volume_data, path_str, chec
             print(f"⚠️ Only {processed_in_batch} records in batch, enumeration likely complete")
             break
     
+    if discovered:
+        discovered.flush()
+    
     print(f"🎉 Complete MFT enumeration finished!")
     print(f"   📊 Total entries processed: {total_files}")
-    print(f"   📊 Folders found: {len(folders_found)}")
-    print(f"   📊 Files found: {len(files_found)}")
+    folder_count = total_folders
+    file_count = total_files - total_folders
+    print(f"   📊 Folders found: {folder_count}")
+    print(f"   📊 Files found: {file_count}")
     print(f"   📊 Batches processed: {batch_count}")
     
     # Build result structure with sample data for tree view
     return {
-        'name': os.path.basename(path_str) if path_str else f"Drive {path_str[0]}",
+        'name': result_name,
         'path': path_str,
         'size': total_size,
         'type': 'folder',
-        'direct_files': sample_files,  # Sample files for tree view
-        'sub_folders': sample_folders,   # Sample folders for tree view
-        'file_count': len(files_found),
-        'folder_count': len(folders_found),
+        'direct_files': sample_files.file_entries(),  # Sample files for tree view
+        'sub_folders': sample_folders.folder_entries(),   # Sample folders for tree view
+        'file_count': file_count,
+        'folder_count': folder_count,
         'last_modified_timestamp': time.time(),
         'scan_method': 'COMPLETE_MFT_ENUMERATION'
     }
 
 
+def _parse_mft_buffer(buf_u8, bytes_per_record):
+    """Parse a read buffer into record columns plus the system-name skip mask"""
+    parsed = _parse_mft_chunks(buf_u8, bytes_per_record, len(buf_u8) // bytes_per_record)
+    return parsed + (_mft_name_skip_mask(buf_u8, parsed[3], parsed[4]),)
+
+
 def _read_mft_records_direct(volume_handle, volume_data, path_str, check_cancelled_callback, item_discovered_callback):
     """
     Direct MFT record reading - second fastest method
     """
     print("🚀 Direct MFT Record Reading Starting...")
     
+    result_name = os.path.basename(path_str) if path_str else f"Drive {path_str[0]}"
+    
     bytes_per_record = volume_data.BytesPerFileRecordSegment
     mft_start_lcn = volume_data.MftStartLcn.QuadPart
     bytes_per_cluster = volume_data.BytesPerCluster
@@ -1338,14 +1534,20 @@ def _read_mft_records_direct(volume_handle, volume_data, path_str, check_cancell
     mft_offset = mft_start_lcn * bytes_per_cluster
     
     # Read MFT records in large batches
-    records_per_batch = 1000  # Read 1000 records at once
+    records_per_batch = MFT_READ_SIZE // bytes_per_record  # 8192 records at 1KB per record
     batch_size = records_per_batch * bytes_per_record
     
     total_files = 0
     total_folders = 0
     current_record = 0
-    sample_files = []  # Sample files for tree view
-    sample_folders = []  # Sample folders for tree view
+    sample_files = _SampleColumns()  # Sample files for tree view
+    sample_folders = _SampleColumns()  # Sample folders for tree view
+    samples_done = False  # Set once both sample lists are full
+    
+    # One read buffer, reused for every batch
+    buffer = np.empty(batch_size, dtype=np.uint8)
+    buf_view = memoryview(buffer)  # Name slices decode straight from the read buffer
+    discovered = _DiscoveryBatcher(item_discovered_callback) if item_discovered_callback else None
     
     print("🔥 Starting direct MFT record reading...")
     
@@ -1353,163 +1555,94 @@ def _read_mft_records_direct(volume_handle, volume_data, path_str, check_cancell
         if check_cancelled_callback and check_cancelled_callback():
             break
             
-        # Calculate offset for this batch
-        batch_offset = mft_offset + (current_record * bytes_per_record)
-        
-        # Set file pointer
+        # Position and read the batch
         file_offset = LARGE_INTEGER()
-        file_offset.QuadPart = batch_offset
-        
-        result = SetFilePointerEx(
-            volume_handle,
-            file_offset,
-            None,
-            0  # FILE_BEGIN
-        )
-        
-        if not result:
-            print(f"⚠️ SetFilePointerEx failed at offset {batch_offset}")
+        file_offset.QuadPart = mft_offset + (current_record * bytes_per_record)
+        if not SetFilePointerEx(volume_handle, file_offset, None, 0):  # FILE_BEGIN
+            print(f"⚠️ SetFilePointerEx failed at offset {file_offset.QuadPart}")
             break
-        
-        # Read the batch
-        buffer = (ctypes.c_byte * batch_size)()
+            
         bytes_read = wintypes.DWORD()
-        
         success = ReadFile(
             volume_handle,
-            buffer, batch_size,
+            buffer.ctypes.data_as(wintypes.LPVOID), batch_size,
             ctypes.byref(bytes_read),
             None
         )
-        
         if not success or bytes_read.value == 0:
             print(f"⚠️ ReadFile failed or EOF reached")
             break
             
         # Process records in batch
-        records_in_batch = min(records_per_batch, bytes_read.value // bytes_per_record)
+        records_in_batch = bytes_read.value // bytes_per_record
         valid_records_in_batch = 0
-        
-        for i in range(records_in_batch):
-            if check_cancelled_callback and check_cancelled_callback():
-                break
-                
-            record_offset = i * bytes_per_record
+    
+        in_use, is_dir_flags, real_sizes, name_starts, name_lengths, skip = _parse_mft_buffer(
+            buffer[:records_in_batch * bytes_per_record], bytes_per_record
+        )
+    
+        # Only visit valid FILE records that are in use and not system/metadata files
+        keep = np.flatnonzero(in_use & ~skip)
+        sampling = not samples_done
+        if not sampling:
+            # Counting-only phase: totals come straight from the masks and only the
+            # records picked for UI discovery still need their names decoded
+            folders_in_batch = int(np.count_nonzero(is_dir_flags[keep]))
+            total_folders += folders_in_batch
+            total_files += len(keep) - folders_in_batch
+            valid_records_in_batch += len(keep)
+            keep = keep[(current_record + keep) % 1000 == 0] if discovered else keep[:0]
             
-            # Read MFT file record header
-            if record_offset + ctypes.sizeof(MFT_FILE_RECORD_HEADER) > bytes_read.value:
+        for i in keep.tolist():
+            if check_cancelled_callback and check_cancelled_callback():
                 break
-                
-            header = MFT_FILE_RECORD_HEADER.from_buffer(buffer, record_offset)
             
-            # Check if this is a valid FILE record
-            if header.Signature != MFT_RECORD_SIGNATURE:
-                continue
-                
-            # Check if record is in use
-            if not (header.Flags & FILE_RECORD_FLAG_INUSE):
-                continue
-                
             # Determine if it's a directory
-            is_directory = bool(header.Flags & FILE_RECORD_FLAG_DIRECTORY)
-            
-            # Try to extract filename from MFT attributes
+            is_directory = bool(is_dir_flags[i])
+        
+            # Use the FILENAME attribute when the parser found one
             filename = f"{'Folder' if is_directory else 'File'}_{current_record + i}"
-            file_size = header.RealSize if not is_directory else 0
-            
-            # Try to parse filename attribute (simplified)
-            try:
-                # Look for FILENAME attribute (0x30) in the record
-                attr_offset = header.FirstAttributeOffset
-                max_attr_offset = min(bytes_per_record, bytes_read.value - record_offset)
-                
-                while attr_offset < max_attr_offset - 16:  # Minimum attribute header size
-                    if record_offset + attr_offset + 16 > bytes_read.value:
-                        break
-                        
-                    attr_header = ATTRIBUTE_RECORD_HEADER.from_buffer(buffer, record_offset + attr_offset)
-                    
-                    if attr_header.AttributeType == ATTRIBUTE_TYPE_FILENAME and attr_header.RecordLength > 0:
-                        # Found filename attribute - try to extract name
-                        name_offset = attr_offset + 24  # Skip attribute header to resident data
-                        if record_offset + name_offset + 66 < bytes_read.value:  # Minimum filename record size
-                            # Skip filename record header (66 bytes) to get to actual name
-                            name_start = record_offset + name_offset + 66
-                            name_length_byte_pos = record_offset + name_offset + 64
-                            if name_length_byte_pos < bytes_read.value:
-                                name_length = buffer[name_length_byte_pos]  # Length in characters
-                                if name_length > 0 and name_length < 256:
-                                    name_end = name_start + (name_length * 2)  # Unicode = 2 bytes per char
-                                    if name_end <= bytes_read.value:
-                                        try:
-                                            name_bytes = bytes(buffer[name_start:name_end])
-                                            extracted_name = name_bytes.decode('utf-16le').strip('\x00')
-                                            if extracted_name and len(extracted_name) > 0 and not extracted_name.startswith('\x00'):
-                                                filename = extracted_name
-                                        except:
-                                            pass  # Keep default name
-                        break
-                        
-                    # Move to next attribute
-                    if attr_header.RecordLength == 0:
-                        break
-                    attr_offset += attr_header.RecordLength
-                    
-            except:
-                pass  # Keep default filename
+            file_size = int(real_sizes[i]) if not is_directory else 0
+        
+            name_length = int(name_lengths[i])
+            if name_length:
+                name_start = int(name_starts[i])
+                try:
+                    extracted_name = str(buf_view[name_start:name_start + name_length * 2], 'utf-16le').strip('\x00')
+                    if extracted_name:
+                        filename = extracted_name
+                except UnicodeDecodeError:
+                    pass  # Keep default name
+        
+            if sampling:
+                valid_records_in_batch += 1
             
-            # Skip system files and metadata files for cleaner results
-            if filename.startswith('$') or filename.startswith('~') or len(filename) > 200:
-                continue
-                
-            valid_records_in_batch += 1
+                if is_directory:
+                    total_folders += 1
+                    # Collect sample folders for tree view (first 50)
+                    if len(sample_folders) < 50:
+                        sample_folders.add(filename, f"[MFT:{current_record + i}] {filename}")
+                else:
+                    total_files += 1
+                    # Collect sample files for tree view (first 100)
+                    if len(sample_files) < 100:
+                        sample_files.add(filename, f"[MFT:{current_record + i}] {filename}", file_size)
             
-            if is_directory:
-                total_folders += 1
-                # Collect sample folders for tree view (first 50)
-                if len(sample_folders) < 50:
-                    sample_folders.append({
-                        'name': filename,
-                        'path': f"[MFT:{current_record + i}] {filename}",
-                        'size': 0,
-                        'type': 'folder',
-                        'direct_files': [],
-                        'sub_folders': [],
-                        'file_count': 0,
-                        'folder_count': 1,
-                        'last_modified_timestamp': 0
-                    })
-            else:
-                total_files += 1
-                # Collect sample files for tree view (first 100)
-                if len(sample_files) < 100:
-                    sample_files.append({
-                        'name': filename,
-                        'path': f"[MFT:{current_record + i}] {filename}",
-                        'size': file_size,
-                        'type': 'file',
-                        'direct_files': [],
-                        'sub_folders': [],
-                        'file_count': 1,
-                        'folder_count': 0,
-                        'last_modified_timestamp': 0
-                    })
-                
-            # Emit discovery for UI updates (very limited for speed)
-            if item_discovered_callback and (current_record + i) % 1000 == 0:
-                item_discovered_callback({
-                    'type': 'folder' if is_directory else 'file',
-                    'path': f"[MFT:{current_record + i}]",
-                    'parent_path': path_str,
-                    'name': filename,
-                    'size': file_size,
-                    'depth': 1,
-                    'last_modified': 0
-                })
-        
+
+            # Queue discovery for UI updates (very limited for speed)
+            if discovered and (current_record + i) % 1000 == 0:
+                discovered.add(
+                    'folder' if is_directory else 'file',
+                    f"[MFT:{current_record + i}]",
+                    path_str,
+                    filename,
+                    file_size
+                )
+    
+        samples_done = len(sample_folders) >= 50 and len(sample_files) >= 100
         current_record += records_in_batch
         print(f"⚡ Processed {records_in_batch} MFT records ({valid_records_in_batch} valid), total files: {total_files}, folders: {total_folders}")
-        
+    
         # Break conditions to prevent infinite loops
         if records_in_batch < records_per_batch:  # Partial batch means EOF
             break
@@ -1519,11 +1652,14 @@ def _read_mft_records_direct(volume_handle, volume_data, path_str, check_cancell
         if records_in_batch == 0:  # No records processed
             print(f"⚠️ No records processed, stopping MFT scan")
             break
-            
+        
         # If we've processed many records but found relatively few files, fall back to parallel scan
         if current_record > 200000 and total_files < 50000:
             print(f"⚠️ Low file discovery rate after {current_record} records, falling back to parallel scan")
             raise Exception("MFT scan efficiency too low, switching to parallel scan")
+
+    if discovered:
+        discovered.flush()
     
     print(f"🎉 Direct MFT reading completed!")
     print(f"   📊 Records processed: {current_record}")
@@ -1532,12 +1668,12 @@ def _read_mft_records_direct(volume_handle, volume_data, path_str, check_cancell
     
     # Return summary structure with sample data for tree view
     return {
-        'name': os.path.basename(path_str) if path_str else f"Drive {path_str[0]}",
+        'name': result_name,
         'path': path_str,
         'size': 0,  # Size calculation would require parsing DATA attributes
         'type': 'folder',
-        'direct_files': sample_files,  # Sample files for tree view
-        'sub_folders': sample_folders,  # Sample folders for tree view
+        'direct_files': sample_files.file_entries(),  # Sample files for tree view
+        'sub_folders': sample_folders.folder_entries(),  # Sample folders for tree view
         'file_count': total_files,
         'folder_count': total_folders,
         'last_modified_timestamp': time.time(),
@@ -1545,12 +1681,66 @@ def _read_mft_records_direct(volume_handle, volume_data, path_str, check_cancell
     }
 
 
-def _mft_turbo_scan(volume_handle, path_str, check_cancelled_callback, item_discovered_callback):
+# Seek penalty per drive letter, probed once per session
+_SEEK_PENALTY_CACHE = {}
+_SEEK_PENALTY_LOCK = Lock()
+
+
+def _probe_seek_penalty(path_str):
+    """
+    Check whether the volume holding path_str sits on a disk with a seek penalty
+    (a spinning HDD). Unknown devices, like network drives, count as no penalty
+    """
+    drive_letter = path_str[0].upper() if path_str else ''
+    with _SEEK_PENALTY_LOCK:
+        if drive_letter in _SEEK_PENALTY_CACHE:
+            return _SEEK_PENALTY_CACHE[drive_letter]
+        
+        has_seek_penalty = False
+        # No access rights are needed to query device properties, so this works without admin
+        volume_handle = CreateFileW(
+            f"\\\\.\\{drive_letter}:",
+            0,
+            FILE_SHARE_READ | FILE_SHARE_WRITE,
+            None,
+            OPEN_EXISTING,
+            0,
+            None
+        )
+        if volume_handle != INVALID_HANDLE_VALUE:
+            try:
+                query = STORAGE_PROPERTY_QUERY(StorageDeviceSeekPenaltyProperty, PropertyStandardQuery)
+                descriptor = DEVICE_SEEK_PENALTY_DESCRIPTOR()
+                bytes_returned = wintypes.DWORD()
+                if DeviceIoControl(
+                    volume_handle,
+                    IOCTL_STORAGE_QUERY_PROPERTY,
+                    ctypes.byref(query), ctypes.sizeof(query),
+                    ctypes.byref(descriptor), ctypes.sizeof(descriptor),
+                    ctypes.byref(bytes_returned),
+                    None
+                ):
+                    has_seek_penalty = bool(descriptor.IncursSeekPenalty)
+            finally:
+                CloseHandle(volume_handle)
+        
+        _SEEK_PENALTY_CACHE[drive_letter] = has_seek_penalty
+        return has_seek_penalty
+
+
+def _mft_turbo_scan(volume_handle, volume_data, path_str, check_cancelled_callback, item_discovered_callback):
     """
     Turbo-charged directory traversal with maximum optimizations
+    Does not use the volume handle, so it runs without opening the volume. USN records
+    carry no file sizes, so FSCTL_ENUM_USN_DATA cannot stand in for the listings here
     """
     print("🚀 MFT Turbo Scan (optimized traversal) starting...")
     
+    # Parallel listings only thrash a spinning disk, walk those serially
+    has_seek_penalty = _probe_seek_penalty(path_str)
+    max_parallel = 1 if has_seek_penalty else 8
+    print(f"💽 {'HDD (seek penalty)' if has_seek_penalty else 'SSD/no seek penalty'}: {max_parallel} parallel listings")
+    
     # Use the existing optimized scan but with more aggressive settings
     return _mft_optimized_scan(path_str, {
         'name': os.path.basename(path_str) if path_str else "Unknown",
@@ -1562,171 +1752,312 @@ def _mft_turbo_scan(volume_handle, path_str, check_cancelled_callback, item_disc
         'file_count': 0,
         'folder_count': 0,
         'last_modified_timestamp': 0
-    }, check_cancelled_callback, item_discovered_callback, max_depth=5, max_parallel=16)
+    }, check_cancelled_callback, item_discovered_callback, max_depth=5, max_parallel=max_parallel)
 
 
-def _mft_optimized_scan(path_str, dir_data, check_cancelled_callback, item_discovered_callback, max_depth=3, max_parallel=8):
+# Scan strategies for analyze_directory_mft_direct, all called as
+# strategy(volume_handle, volume_data, path_str, check_cancelled_callback, item_discovered_callback)
+MFT_STRATEGIES = {
+    'usn': _enumerate_usn_journal_ultra_fast,
+    'mft': _read_mft_records_direct,
+    'parallel': _mft_turbo_scan,
+}
+# Strategies that need the volume handle and NTFS volume data
+_MFT_VOLUME_STRATEGIES = {'usn', 'mft'}
+# Strategies tried in order by default. The USN and raw MFT enumerations only return totals
+# with sample entries, so they are opt-in (--mft-strategies usn,mft,parallel)
+MFT_ENABLED_STRATEGIES = ('parallel',)
+
+
+def _nt_list_directory(path_str):
     """
-    MFT-optimized scanning that uses the fastest possible file system access patterns
-    Enhanced with configurable depth and parallelism for maximum speed
+    List a directory with NtQueryDirectoryFile, which returns a 64KB batch of entries
+    per system call instead of one entry per FindNextFileW
+    Returns a list of (name, attributes, size, last_write_100ns, reparse_tag) without the
+    "." and ".." entries, or None if the directory cannot be opened
     """
-    import concurrent.futures
-    from threading import Lock
-    
-    # Thread-safe callback
-    callback_lock = Lock()
-    def safe_callback(item_data):
-        if item_discovered_callback:
-            with callback_lock:
-                item_discovered_callback(item_data)
-    
-    try:
-        # Use Windows API for maximum speed
-        search_pattern = os.path.join(path_str, "*")
-        find_data = WIN32_FIND_DATAW()
-        
-        handle = FindFirstFileW(search_pattern, ctypes.byref(find_data))
-        if handle == INVALID_HANDLE_VALUE:
-            return dir_data
-        
-        subdirs = []
-        file_count = 0
-        total_size = 0
-        
-        print(f"🚀 Turbo scanning: {path_str} (max_depth={max_depth}, max_parallel={max_parallel})")
+    dir_handle = CreateFileW(
+        path_str,
+        FILE_LIST_DIRECTORY,
+        FILE_SHARE_READ | FILE_SHARE_WRITE | FILE_SHARE_DELETE,
+        None,
+        OPEN_EXISTING,
+        FILE_FLAG_BACKUP_SEMANTICS,
+        None
+    )
+    if dir_handle == INVALID_HANDLE_VALUE:
+        return None
         
-        # Process all items in current directory super fast
+    entries = []
+    # The per-entry loop runs once per file on the volume, so everything it touches is
+    # bound to a local up front
+    add_entry = entries.append
+    unpack_entry = _FILE_BOTH_DIR_FIELDS.unpack_from
+    name_offset = _FILE_BOTH_DIR_NAME_OFFSET
+    try:
+        buffer = (ctypes.c_byte * NT_QUERY_BUFFER_SIZE)()
+        buffer_bytes = memoryview(buffer).cast('B')
+        io_status = IO_STATUS_BLOCK()
         while True:
-            if check_cancelled_callback and check_cancelled_callback():
-                FindClose(handle)
-                return dir_data
+            status = NtQueryDirectoryFile(
+                dir_handle, None, None, None, ctypes.byref(io_status),
+                buffer, NT_QUERY_BUFFER_SIZE, FileBothDirectoryInformation,
+                False, None, False
+            )
+            if status < 0:  # STATUS_NO_MORE_FILES or an error
+                break
                 
-            filename = find_data.cFileName
-            if filename in ['.', '..']:
-                if not FindNextFileW(handle, ctypes.byref(find_data)):
+            offset = 0
+            while True:
+                (next_offset, last_write, size, attributes,
+                 name_length, reparse_tag) = unpack_entry(buffer_bytes, offset)
+                name_start = offset + name_offset
+                name = str(buffer_bytes[name_start:name_start + name_length], 'utf-16le', 'surrogatepass')
+                # "." and ".." are dropped here so callers never see them
+                if name_length > 4 or (name != '.' and name != '..'):
+                    add_entry((name, attributes, size, last_write, reparse_tag))
+                if not next_offset:
                     break
-                continue
-            
-            item_path = os.path.join(path_str, filename)
-            is_directory = find_data.dwFileAttributes & FILE_ATTRIBUTE_DIRECTORY
-            is_reparse_point = find_data.dwFileAttributes & FILE_ATTRIBUTE_REPARSE_POINT
-            
-            file_size = (find_data.nFileSizeHigh << 32) + find_data.nFileSizeLow
-            last_modified = filetime_to_unix_timestamp(find_data.ftLastWriteTime)
+                offset += next_offset
+    finally:
+        CloseHandle(dir_handle)
+        
+    return entries
+
+
+CALLBACK_BATCH_SIZE = 128  # Turbo-scan discoveries handed to the callback per call
+TURBO_MAX_SUBDIRS = 100  # Sub-directories scanned per directory, the rest are summarised
+TURBO_VECTOR_MTIME_ENTRIES = 1024  # Listings from this size convert timestamps with numpy
+
+# Shared worker pool for turbo-scan directory listings. Past ~3 concurrent listings a
+# disk only thrashes, so the pool is small and shared by every level of the tree
+_SCAN_POOL = None
+_SCAN_POOL_LOCK = Lock()
+_SCAN_POOL_MAX_WORKERS = min(os.cpu_count() or 1, 3)
+
+
+def _get_scan_pool():
+    """Return the shared turbo-scan pool, starting it on first use"""
+    global _SCAN_POOL
+    if _SCAN_POOL is None:
+        with _SCAN_POOL_LOCK:
+            if _SCAN_POOL is None:
+                _SCAN_POOL = ThreadPoolExecutor(
+                    max_workers=_SCAN_POOL_MAX_WORKERS, thread_name_prefix="turbo-scan"
+                )
+    return _SCAN_POOL
+
+
+def _path_prefix(path_str):
+    """Return path_str with a trailing separator, so children are joined by concatenation"""
+    return path_str if path_str.endswith(('\\', '/')) else path_str + '\\'
+
+
+def _turbo_list_directory(path_str, dir_data, check_cancelled_callback, safe_callback=None):
+    """
+    List one directory for the turbo scan: files go straight into dir_data and the
+    traversable sub-directories are returned as parallel (names, last_modified, is_link)
+    columns, their paths are only joined once they are queued
+    Returns None if the scan was cancelled
+    """
+    subdir_names = []
+    subdir_mtimes = array.array('d')
+    subdir_links = bytearray()  # 1 for directory symlinks
+    
+    # Use the native directory query for maximum speed
+    entries = _nt_list_directory(path_str)
+    if entries is None:
+        return subdir_names, subdir_mtimes, subdir_links
+    
+    file_count = 0
+    total_size = 0
+    prefix = _path_prefix(path_str)
+    # The listing is complete before it is classified, so the file list is sized once
+    # up front and trimmed at the end instead of growing per append
+    direct_files = [None] * len(entries)
+    
+    # Large listings convert all their timestamps in one vector operation
+    if len(entries) >= TURBO_VECTOR_MTIME_ENTRIES:
+        last_writes = np.fromiter((entry[3] for entry in entries), dtype=np.int64, count=len(entries))
+        last_modified_times = filetime_100ns_to_unix_timestamps(last_writes).tolist()
+    else:
+        last_modified_times = [filetime_100ns_to_unix_timestamp(entry[3]) for entry in entries]
+    
+    # Process all items in current directory super fast
+    for (filename, attributes, file_size, _, reparse_tag), last_modified in zip(entries, last_modified_times):
+        if check_cancelled_callback and check_cancelled_callback():
+            return None
+        
+        # One masked compare classifies plain directories; only directory reparse points
+        # need their tag checked (see is_traversable_directory)
+        kind = attributes & _DIRECTORY_KIND_MASK
+        
+        if kind == FILE_ATTRIBUTE_DIRECTORY or (kind == _DIRECTORY_KIND_MASK and reparse_tag == IO_REPARSE_TAG_SYMLINK):
+            subdir_names.append(filename)
+            subdir_mtimes.append(last_modified)
+            subdir_links.append(kind == _DIRECTORY_KIND_MASK)
+            # Very limited UI updates for maximum speed
+            if safe_callback and len(subdir_names) <= 10:  # Only show first 10 directories
+                safe_callback({
+                    'type': 'folder',
+                    'path': prefix + filename,
+                    'parent_path': path_str,
+                    'name': filename,
+                    'depth': 1,
+                    'last_modified': last_modified
+                })
+        elif not kind & FILE_ATTRIBUTE_DIRECTORY:
+            direct_files[file_count] = FileRec(filename, prefix + filename, file_size, last_modified)
+            total_size += file_size
+            file_count += 1
             
-            if is_directory and not is_reparse_point:
-                subdirs.append((item_path, filename, last_modified))
-                # Very limited UI updates for maximum speed
-                if len(subdirs) <= 10:  # Only show first 10 directories
-                    safe_callback({
-                        'type': 'folder',
-                        'path': item_path,
-                        'parent_path': path_str,
-                        'name': filename,
-                        'depth': 1,
-                        'last_modified': last_modified
-                    })
-            elif not is_directory:
-                file_data = {
+            # Show only very large files for performance
+            if safe_callback and file_size > 100 * 1024 * 1024:  # Files > 100MB only
+                safe_callback({
+                    'type': 'file',
+                    'path': prefix + filename,
+                    'parent_path': path_str,
                     'name': filename,
-                    'path': item_path,
                     'size': file_size,
-                    'type': 'file',
-                    'direct_files': [],
-                    'sub_folders': [],
-                    'file_count': 1,
-                    'folder_count': 0,
-                    'last_modified_timestamp': last_modified
-                }
-                dir_data['direct_files'].append(file_data)
-                total_size += file_size
-                file_count += 1
-                
-                # Show only very large files for performance
-                if file_size > 100 * 1024 * 1024:  # Files > 100MB only
-                    safe_callback({
-                        'type': 'file',
-                        'path': item_path,
-                        'parent_path': path_str,
-                        'name': filename,
-                        'size': file_size,
-                        'depth': 1,
-                        'last_modified': last_modified
-                    })
+                    'depth': 1,
+                    'last_modified': last_modified
+                })
+    
+    # Update directory data
+    del direct_files[file_count:]
+    dir_data['direct_files'].extend(direct_files)
+    dir_data['size'] = total_size
+    dir_data['file_count'] = file_count
+    return subdir_names, subdir_mtimes, subdir_links
+
+
+def _turbo_scan_tree(root_data, root_listing, check_cancelled_callback, max_depth, max_parallel):
+    """
+    Scan the sub-directories below an already listed directory breadth-first on the
+    shared scan pool, with at most max_parallel listings queued at a time
+    A max_parallel of 1 lists every directory serially on the calling thread
+    """
+    waiting = deque()  # (dir_data, real path, levels left below it) not yet submitted
+    in_flight = {}  # future -> (dir_data, real path, levels left below it)
+    edges = []  # (parent_data, child_data) in breadth-first order
+    root_real_path = os.path.normcase(os.path.realpath(root_data['path']))
+    visited = {root_real_path}  # Real paths of the directories queued so far
+    
+    def enqueue_children(parent_data, parent_real_path, listing, levels_left):
+        subdir_names, subdir_mtimes, subdir_links = listing
+        prefix = _path_prefix(parent_data['path'])
+        real_prefix = _path_prefix(parent_real_path)
+        for i in range(min(len(subdir_names), TURBO_MAX_SUBDIRS)):
+            child_path = prefix + subdir_names[i]
+            child_data = _make_folder_result(child_path, last_modified=subdir_mtimes[i])
+            parent_data['sub_folders'].append(child_data)
+            edges.append((parent_data, child_data))
+            if subdir_links[i]:
+                child_data['is_link'] = True
+                child_real_path = os.path.normcase(os.path.realpath(child_path))
+                # Ancestors are queued before their children, so this also stops links back up the tree
+                if child_real_path in visited:
+                    child_data['type'] = 'folder_link_visited'
+                    continue
+            else:
+                child_real_path = real_prefix + os.path.normcase(subdir_names[i])
+            visited.add(child_real_path)
+            waiting.append((child_data, child_real_path, levels_left))
             
-            if not FindNextFileW(handle, ctypes.byref(find_data)):
+        # If there were more subdirectories, add them as summary
+        if len(subdir_names) > TURBO_MAX_SUBDIRS:
+            remaining_count = len(subdir_names) - TURBO_MAX_SUBDIRS
+            print(f"⚡ Skipped {remaining_count} subdirectories for maximum speed")
+            summary_item = _make_folder_result(parent_data['path'], 'folder_summary')
+            summary_item['name'] = f"... and {remaining_count} more directories (skipped for maximum speed)"
+            summary_item['folder_count'] = remaining_count
+            parent_data['sub_folders'].append(summary_item)
+            parent_data['folder_count'] += remaining_count
+    
+    enqueue_children(root_data, root_real_path, root_listing, max_depth - 1)
+    
+    if max_parallel <= 1:
+        while waiting:
+            if check_cancelled_callback and check_cancelled_callback():
+                break
+            child_data, child_real_path, levels_left = waiting.popleft()
+            listing = _turbo_list_directory(child_data['path'], child_data, check_cancelled_callback)
+            if listing and listing[0] and levels_left > 0:
+                enqueue_children(child_data, child_real_path, listing, levels_left - 1)
+    else:
+        pool = _get_scan_pool()
+        while waiting or in_flight:
+            if check_cancelled_callback and check_cancelled_callback():
+                for future in in_flight:
+                    future.cancel()
                 break
+            
+            while waiting and len(in_flight) < max_parallel:
+                child_data, child_real_path, levels_left = waiting.popleft()
+                future = pool.submit(
+                    _turbo_list_directory, child_data['path'], child_data, check_cancelled_callback
+                )
+                in_flight[future] = (child_data, child_real_path, levels_left)
+            
+            done, _ = concurrent.futures.wait(
+                in_flight, timeout=0.25, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                child_data, child_real_path, levels_left = in_flight.pop(future)
+                try:
+                    listing = future.result()
+                except Exception as e:
+                    print(f"❌ MFT turbo scan error in {child_data['path']}: {e}")
+                    continue
+                if listing and listing[0] and levels_left > 0:
+                    enqueue_children(child_data, child_real_path, listing, levels_left - 1)
+    
+    # Roll totals up the tree, children before their parents
+    for parent_data, child_data in reversed(edges):
+        _roll_up_subfolder(parent_data, child_data)
+
+
+def _mft_optimized_scan(path_str, dir_data, check_cancelled_callback, item_discovered_callback, max_depth=3, max_parallel=8):
+    """
+    MFT-optimized scanning that uses the fastest possible file system access patterns
+    Enhanced with configurable depth and parallelism for maximum speed
+    """
+    # Thread-safe callback, items are queued and handed over in batches so the lock is
+    # taken once per batch. Only the top-level listing reports items, so a plain list
+    # is enough
+    callback_lock = Lock()
+    callback_batch = []
+    
+    def flush_callbacks():
+        if callback_batch:
+            batch = callback_batch[:]
+            callback_batch.clear()
+            with callback_lock:
+                item_discovered_callback(batch)
                 
-        FindClose(handle)
+    def safe_callback(item_data):
+        if item_discovered_callback:
+            callback_batch.append(item_data)
+            if len(callback_batch) >= CALLBACK_BATCH_SIZE:
+                flush_callbacks()
+    
+    try:
+        print(f"🚀 Turbo scanning: {path_str} (max_depth={max_depth}, max_parallel={max_parallel})")
         
-        # Update directory data
-        dir_data['size'] = total_size
-        dir_data['file_count'] = file_count
+        listing = _turbo_list_directory(path_str, dir_data, check_cancelled_callback, safe_callback)
         
-        # Process subdirectories with maximum parallelism and limited depth
-        if subdirs and max_depth > 0:
-            print(f"⚡ Processing {len(subdirs)} subdirectories with {max_parallel} workers")
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as executor:
-                def process_subdir(subdir_info):
-                    subdir_path, subdir_name, subdir_modified = subdir_info
-                    if check_cancelled_callback and check_cancelled_callback():
-                        return None
-                    
-                    subdir_data = {
-                        'name': subdir_name,
-                        'path': subdir_path,
-                        'size': 0,
-                        'type': 'folder',
-                        'direct_files': [],
-                        'sub_folders': [],
-                        'file_count': 0,
-                        'folder_count': 0,
-                        'last_modified_timestamp': subdir_modified
-                    }
-                    
-                    # Recursive call with reduced depth
-                    return _mft_optimized_scan(
-                        subdir_path, subdir_data, check_cancelled_callback, None, 
-                        max_depth - 1, max_parallel
-                    )
-                
-                # Process subdirectories with optimized limits
-                max_subdirs = min(len(subdirs), 100)  # Process max 100 subdirs for speed
-                limited_subdirs = subdirs[:max_subdirs]
-                
-                futures = {executor.submit(process_subdir, subdir): subdir for subdir in limited_subdirs}
-                
-                for future in concurrent.futures.as_completed(futures):
-                    if check_cancelled_callback and check_cancelled_callback():
-                        break
-                    
-                    result = future.result()
-                    if result:
-                        dir_data['sub_folders'].append(result)
-                        dir_data['size'] += result['size']
-                        dir_data['file_count'] += result['file_count']
-                        dir_data['folder_count'] += result['folder_count'] + 1
-                
-                # If there were more subdirectories, add them as summary
-                if len(subdirs) > max_subdirs:
-                    remaining_count = len(subdirs) - max_subdirs
-                    print(f"⚡ Skipped {remaining_count} subdirectories for maximum speed")
-                    summary_item = {
-                        'name': f"... and {remaining_count} more directories (skipped for maximum speed)",
-                        'path': path_str,
-                        'size': 0,
-                        'type': 'folder_summary',
-                        'direct_files': [],
-                        'sub_folders': [],
-                        'file_count': 0,
-                        'folder_count': remaining_count,
-                        'last_modified_timestamp': 0
-                    }
-                    dir_data['sub_folders'].append(summary_item)
-                    dir_data['folder_count'] += remaining_count
+        # End of directory, hand over whatever is still queued
+        flush_callbacks()
+        if listing is None:
+            return dir_data
+        
+        # Process subdirectories on the shared pool with limited depth
+        subdir_names = listing[0]
+        if subdir_names and max_depth > 0:
+            print(f"⚡ Processing {len(subdir_names)} subdirectories with {max_parallel} queued listings")
+            _turbo_scan_tree(dir_data, listing, check_cancelled_callback, max_depth, max_parallel)
         
-        print(f"✅ Completed turbo scan: {path_str} - {file_count} files, {len(subdirs)} folders")
+        print(f"✅ Completed turbo scan: {path_str} - {dir_data['file_count']} files, {dir_data['folder_count']} folders")
         
     except Exception as e:
         print(f"❌ MFT turbo scan error in {path_str}: {e}")
@@ -3,9 +3,11 @@ Simple logging utility for IT Helper
 Replaces print statements with configurable logging for better performance
 """
 
+import atexit
 import sys
 import os
-from datetime import datetime
+import threading
+import time
 
 # Global logging configuration
 LOG_LEVEL = os.getenv('IT_HELPER_LOG_LEVEL', 'ERROR')  # Default to ERROR only
@@ -26,27 +28,53 @@ LEVEL_MAP = {
 
 CURRENT_LEVEL = LEVEL_MAP.get(LOG_LEVEL.upper(), LogLevel.ERROR)
 
+# Log file kept open across calls, opened on first use (False if it could not be opened)
+_LOG_FH = None
+_LOG_FH_LOCK = threading.Lock()
+
+def _get_log_file():
+    """Return the open log file, opening it on first use"""
+    global _LOG_FH
+    if _LOG_FH is None:
+        with _LOG_FH_LOCK:
+            if _LOG_FH is None:
+                try:
+                    _LOG_FH = open(LOG_TO_FILE, 'a', encoding='utf-8', buffering=1)  # Line-buffered, a crash keeps the last lines
+                    atexit.register(_LOG_FH.close)
+                except OSError:
+                    _LOG_FH = False  # Fail silently if can't open the file
+    return _LOG_FH
+
+LEVEL_NAMES = {
+    LogLevel.DEBUG: "DEBUG",
+    LogLevel.INFO: "INFO",
+    LogLevel.WARNING: "WARNING",
+    LogLevel.ERROR: "ERROR"
+}
+
+# (second, formatted "HH:MM:SS") of the last message, messages in the same second reuse it
+_TIMESTAMP_CACHE = (None, "")
+
 def log(level, message, module_name="IT_Helper"):
     """Log a message if it meets the current log level threshold"""
+    global _TIMESTAMP_CACHE
     if level < CURRENT_LEVEL:
         return
     
-    level_names = {
-        LogLevel.DEBUG: "DEBUG",
-        LogLevel.INFO: "INFO", 
-        LogLevel.WARNING: "WARNING",
-        LogLevel.ERROR: "ERROR"
-    }
-    
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    log_message = f"[{timestamp}] {level_names.get(level, 'UNKNOWN')} [{module_name}]: {message}"
+    now = int(time.time())
+    cached_second, timestamp = _TIMESTAMP_CACHE
+    if now != cached_second:
+        timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+        _TIMESTAMP_CACHE = (now, timestamp)
+    log_message = f"[{timestamp}] {LEVEL_NAMES.get(level, 'UNKNOWN')} [{module_name}]: {message}"
     
     if LOG_TO_FILE:
-        try:
-            with open(LOG_TO_FILE, 'a', encoding='utf-8') as f:
-                f.write(log_message + '\n')
-        except:
-            pass  # Fail silently if can't write to file
+        log_file = _get_log_file()
+        if log_file:
+            try:
+                log_file.write(log_message + '\n')
+            except:
+                pass  # Fail silently if can't write to file
     else:
         print(log_message)
 
@@ -69,4 +97,19 @@ def error(message, module_name="IT_Helper"):
 # Compatibility function for existing debug_print calls
 def debug_print(message, module_name="IT_Helper"):
     """Compatibility function for existing debug_print calls"""
-    debug(message, module_name) 
\ No newline at end of file
+    debug(message, module_name)
+
+# Hot paths can guard expensive message formatting with these flags
+DEBUG_ENABLED = CURRENT_LEVEL <= LogLevel.DEBUG
+INFO_ENABLED = CURRENT_LEVEL <= LogLevel.INFO
+
+def _noop(*args, **kwargs):
+    """Stand-in for log functions below the configured level"""
+
+# The level is fixed at import, so filtered levels are bound to a no-op outright
+if not DEBUG_ENABLED:
+    debug = debug_print = _noop
+if not INFO_ENABLED:
+    info = _noop
+if CURRENT_LEVEL > LogLevel.WARNING:
+    warning = _noop 
\ No newline at end of file
@@ -3,22 +3,128 @@ import os
 import argparse
 import subprocess
 import ctypes
-from PySide6.QtCore import Qt, QSize, QTimer, QPropertyAnimation, QEasingCurve
+from functools import lru_cache
+from PySide6.QtCore import Qt, QSize, QRect, QTimer, QPropertyAnimation, QEasingCurve, Property
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStackedWidget, QPushButton, QLabel, QFrame, QGridLayout, QSpacerItem, QSizePolicy, QMessageBox
 )
-from PySide6.QtGui import QFont, QPalette, QColor
+from PySide6.QtGui import QFont, QPalette, QColor, QPixmap, QPainter, QIcon
 
 # Import utility modules
 from wifi_scanner_module import WifiScannerWidget
 from wifi_charts_module import WifiChartsWidget  
 from disk_analyzer_module import DiskAnalyzerWidget
+from disk_utilities import MFT_STRATEGIES
 from system_info_module import SystemInfoWidget
 from network_scanner_module import NetworkScannerWidget
 from smart_test_module import SMARTTestWidget
 from logger import debug, info, warning, error
 
+# ShellExecuteW with its argument types declared once, used to relaunch elevated
+if sys.platform == "win32":
+    _SHELL_EXECUTE = ctypes.windll.shell32.ShellExecuteW
+    _SHELL_EXECUTE.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_wchar_p,
+                               ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_int]
+    _SHELL_EXECUTE.restype = ctypes.c_void_p
+else:
+    _SHELL_EXECUTE = None
+
+# Elevation check picked once per platform, so asking never needs a try/except
+if sys.platform == "win32":
+    _IS_ADMIN_IMPL = ctypes.windll.shell32.IsUserAnAdmin
+    _IS_ADMIN_IMPL.restype = ctypes.c_int
+else:
+    _IS_ADMIN_IMPL = lambda: os.geteuid() == 0
+
+
+@lru_cache(maxsize=None)
+def _cached_font(family, size, weight=QFont.Normal):
+    """Return a shared QFont, built on first use since QFont needs the QApplication"""
+    return QFont(family, size, weight)
+
+
+# Home-screen tile size, and the area inside the button padding the tile content is drawn in
+UTILITY_TILE_SIZE = QSize(250, 160)
+UTILITY_TILE_CONTENT_SIZE = QSize(220, 130)
+
+
+def _render_utility_tile(emoji, title, description, pixel_ratio):
+    """Draw a home-screen tile's emoji, title and description once into a transparent pixmap"""
+    width, height = UTILITY_TILE_CONTENT_SIZE.width(), UTILITY_TILE_CONTENT_SIZE.height()
+    pixmap = QPixmap(UTILITY_TILE_CONTENT_SIZE * pixel_ratio)
+    pixmap.setDevicePixelRatio(pixel_ratio)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.TextAntialiasing)
+    painter.setPen(QColor("white"))
+    painter.setFont(_cached_font("Segoe UI Emoji", 36))
+    painter.drawText(QRect(0, 0, width, 60), Qt.AlignCenter, emoji)
+    painter.setFont(_cached_font("Arial", 14, QFont.Bold))
+    painter.drawText(QRect(0, 64, width, 26), Qt.AlignCenter, title)
+    painter.setPen(QColor("#cccccc"))
+    painter.setFont(_cached_font("Arial", 9))
+    painter.drawText(QRect(0, 94, width, height - 94), Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap, description)
+    painter.end()
+    return pixmap
+
+
+# Application-wide dark theme, applied once to the QApplication. The sidebar rules
+# key off object names and the buttons' "expanded" property, so expanding and
+# collapsing only flips that property
+APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #1a1a1a;
+        color: white;
+    }
+    QWidget {
+        background-color: #1a1a1a;
+        color: white;
+    }
+    QPushButton {
+        background-color: #2d2d2d;
+        color: white;
+        border: 1px solid #3d3d3d;
+        padding: 15px;
+        border-radius: 8px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #3d3d3d;
+        border: 1px solid #4d4d4d;
+    }
+    QPushButton:pressed {
+        background-color: #1e1e1e;
+    }
+    QLabel {
+        color: white;
+    }
+    QFrame#Sidebar, QFrame#Sidebar QFrame {
+        background-color: #2d2d2d;
+        border-right: 1px solid #3d3d3d;
+    }
+    QFrame#Sidebar QPushButton {
+        text-align: center;
+        padding: 8px;
+        background-color: transparent;
+        border: none;
+        border-radius: 4px;
+    }
+    QFrame#Sidebar QPushButton#SidebarHome {
+        background-color: #1e1e1e;
+        border: 1px solid #2d2d2d;
+    }
+    QFrame#Sidebar QPushButton:hover, QFrame#Sidebar QPushButton#SidebarHome:hover {
+        background-color: #3d3d3d;
+    }
+    QFrame#Sidebar QPushButton[expanded="true"] {
+        text-align: left;
+        padding-left: 15px;
+    }
+"""
+
 
 class CollapsibleSidebar(QFrame):
     """Collapsible sidebar that shows only emojis when collapsed and full names when expanded"""
@@ -31,45 +137,41 @@ class CollapsibleSidebar(QFrame):
         self.is_expanded = False
         
         self.setFixedWidth(self.collapsed_width)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #2d2d2d;
-                border-right: 1px solid #3d3d3d;
-            }
-        """)
+        self.setObjectName("Sidebar")  # Styled by APP_STYLESHEET
         
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(5, 10, 5, 10)
         self.layout.setSpacing(5)
         
         self.buttons = []
-        # Create smoother animation by animating both min and max width
-        self.animation = QPropertyAnimation(self, b"minimumWidth")
+        # One animation drives the fixed width, so each tick sets min and max width together
+        self.animation = QPropertyAnimation(self, b"sidebarWidth")
         self.animation.setDuration(350)  # Longer duration for smoother animation
         self.animation.setEasingCurve(QEasingCurve.InOutQuart)  # Smoother easing curve
         
-        self.max_width_animation = QPropertyAnimation(self, b"maximumWidth")
-        self.max_width_animation.setDuration(350)
-        self.max_width_animation.setEasingCurve(QEasingCurve.InOutQuart)
+        # Leaves are debounced so cursor jitter on the edge does not bounce the animation
+        self._collapse_timer = QTimer(self)
+        self._collapse_timer.setSingleShot(True)
+        self._collapse_timer.setInterval(50)
+        self._collapse_timer.timeout.connect(self._collapse)
         
         self._create_buttons()
         
+    def _get_sidebar_width(self):
+        return self.width()
+        
+    def _set_sidebar_width(self, width):
+        # Eased ticks often land on the same pixel width, skip those relayouts
+        if width != self.width():
+            self.setFixedWidth(width)
+        
+    sidebarWidth = Property(int, _get_sidebar_width, _set_sidebar_width)
+        
     def _create_buttons(self):
         """Create sidebar buttons"""
         # Home button
         home_btn = self._create_sidebar_button("🏠", "Home", self.parent_app._show_home if self.parent_app else None)
-        home_btn.setStyleSheet("""
-            QPushButton {
-                text-align: center;
-                padding: 8px;
-                background-color: #1e1e1e;
-                border: 1px solid #2d2d2d;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-            }
-        """)
+        home_btn.setObjectName("SidebarHome")
         self.layout.addWidget(home_btn)
         self.buttons.append(home_btn)
         
@@ -91,18 +193,6 @@ class CollapsibleSidebar(QFrame):
         
         for emoji, title, callback in utilities:
             btn = self._create_sidebar_button(emoji, title, callback)
-            btn.setStyleSheet("""
-                QPushButton {
-                    text-align: center;
-                    padding: 8px;
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #3d3d3d;
-                }
-            """)
             self.layout.addWidget(btn)
             self.buttons.append(btn)
             
@@ -112,71 +202,79 @@ class CollapsibleSidebar(QFrame):
     def _create_sidebar_button(self, emoji, title, callback):
         """Create a sidebar button with emoji and title"""
         btn = QPushButton(emoji)
-        btn.setFont(QFont("Segoe UI Emoji", 20))  # Even bigger emoji font for better visibility
+        btn.setFont(_cached_font("Segoe UI Emoji", 20))  # Even bigger emoji font for better visibility
         btn.setFixedHeight(50)  # Slightly taller buttons to accommodate larger emojis
+        btn.setProperty("expanded", False)
         btn.emoji = emoji
         btn.title = title
+        btn._collapsed_text = emoji
+        btn._expanded_text = f"{emoji} {title}"  # Composed once, swapped in on expand
         if callback:
-            btn.clicked.connect(callback)
+            # Queued so the click repaints before the navigation (and any screen build) runs
+            btn.clicked.connect(callback, Qt.QueuedConnection)
         return btn
         
     def enterEvent(self, event):
         """Handle mouse enter event - expand sidebar"""
+        self._collapse_timer.stop()
         self._expand()
         super().enterEvent(event)
         
     def leaveEvent(self, event):
-        """Handle mouse leave event - collapse sidebar"""
-        self._collapse()
+        """Handle mouse leave event - collapse sidebar after a short debounce"""
+        self._collapse_timer.start()
         super().leaveEvent(event)
         
     def _expand(self):
         """Expand the sidebar to show full names"""
         if not self.is_expanded:
             self.is_expanded = True
-            # Animate both minimum and maximum width for smoother animation
-            self.animation.setStartValue(self.collapsed_width)
+            # Start from the current width so reversing mid-animation does not jump
+            self.animation.stop()
+            self.animation.setStartValue(self.width())
             self.animation.setEndValue(self.expanded_width)
-            self.max_width_animation.setStartValue(self.collapsed_width)
-            self.max_width_animation.setEndValue(self.expanded_width)
-            
             self.animation.start()
-            self.max_width_animation.start()
             
             # Update button text to show full names
             for btn in self.buttons:
-                if hasattr(btn, 'emoji') and hasattr(btn, 'title'):
-                    btn.setText(f"{btn.emoji} {btn.title}")
-                    btn.setStyleSheet(btn.styleSheet().replace("text-align: center", "text-align: left") + 
-                                    " padding-left: 15px;")
+                btn.setText(btn._expanded_text)
+                self._set_button_expanded(btn, True)
                     
     def _collapse(self):
         """Collapse the sidebar to show only emojis"""
         if self.is_expanded:
             self.is_expanded = False
-            # Animate both minimum and maximum width for smoother animation
-            self.animation.setStartValue(self.expanded_width)
+            self.animation.stop()
+            self.animation.setStartValue(self.width())
             self.animation.setEndValue(self.collapsed_width)
-            self.max_width_animation.setStartValue(self.expanded_width)
-            self.max_width_animation.setEndValue(self.collapsed_width)
-            
             self.animation.start()
-            self.max_width_animation.start()
             
             # Update button text to show only emojis
             for btn in self.buttons:
-                if hasattr(btn, 'emoji'):
-                    btn.setText(btn.emoji)
-                    btn.setStyleSheet(btn.styleSheet().replace("text-align: left", "text-align: center").replace(" padding-left: 15px;", ""))
+                btn.setText(btn._collapsed_text)
+                self._set_button_expanded(btn, False)
+                
+    def _set_button_expanded(self, btn, expanded):
+        """Flip a button's "expanded" property and re-apply the stylesheet rules for it"""
+        btn.setProperty("expanded", expanded)
+        btn.style().unpolish(btn)
+        btn.style().polish(btn)
 
 
 class ITHelperApp(QMainWindow):
     """Main IT Helper application with home screen and utilities"""
     
+    # Screens that keep Wi-Fi scanning running while shown, as (start, stop) method names
+    WIFI_PRODUCERS = {
+        "wifi_scanner": ("start_scanning", "stop_scanning"),
+        "wifi_charts": ("start_data_collection", "stop_data_collection"),
+    }
+    
     def __init__(self, args=None):
         super().__init__()
         
         # Check if running as administrator
+        self._is_admin = self._compute_is_admin()
         admin_status = self._is_running_as_admin()
         title = "IT Helper"
         if admin_status:
@@ -190,62 +288,31 @@ class ITHelperApp(QMainWindow):
         
         # Track current screen for WiFi scanning management
         self.current_screen = None
-        
-        # Lazy loading - create widgets only when needed
-        self.wifi_scanner_widget = None
-        self.wifi_charts_widget = None
-        self.disk_analyzer_widget = None
-        self.system_info_widget = None
-        self.network_scanner_widget = None
-        self.smart_test_widget = None
-        
-        # Track screens to avoid recreating them
-        self.wifi_scanner_screen = None
-        self.wifi_charts_screen = None
-        self.disk_analyzer_screen = None
-        self.system_info_screen = None
-        self.network_scanner_screen = None
-        self.smart_test_screen = None
-        
-        # Initialize the UI
-        self._init_style()
+        self._wifi_active = None  # Id of the screen whose Wi-Fi scanning is running
+        
+        # Utility screens by id as (title, widget class). A placeholder holds each one's
+        # place in the stack until the real widget is built on its first visit
+        self._screen_factories = {
+            "wifi_scanner": ("WiFi Scanner", WifiScannerWidget),
+            "wifi_charts": ("WiFi Charts", WifiChartsWidget),
+            "disk_analyzer": ("Disk Analyzer", DiskAnalyzerWidget),
+            "system_info": ("System Info", SystemInfoWidget),
+            "network_scanner": ("Network Scanner", NetworkScannerWidget),
+            "smart_test": ("SMART Test", SMARTTestWidget),
+        }
+        self._screens = {}  # id -> built utility widget
+        self._screen_placeholders = {}  # id -> placeholder widget still in the stack
+        self._screen_indices = {}  # id (and "home") -> position in the stack, fixed at insert time
+        # Rendered home-screen tiles by (emoji, title, description, pixel ratio). Kept on the
+        # window rather than at module level so the pixmaps never outlive the QApplication
+        self._tile_pixmaps = {}
+        
+        # Initialize the UI (the theme is applied to the QApplication in main)
         self._init_ui()
         
-        # Handle auto-navigation after UI is ready
+        # Handle auto-navigation on the first event-loop pass, once the window is shown
         if self.args:
-            QTimer.singleShot(100, self._handle_auto_navigation)
-        
-    def _init_style(self):
-        """Set the application's dark theme styling"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1a1a1a;
-                color: white;
-            }
-            QWidget {
-                background-color: #1a1a1a;
-                color: white;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: white;
-                border: 1px solid #3d3d3d;
-                padding: 15px;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border: 1px solid #4d4d4d;
-            }
-            QPushButton:pressed {
-                background-color: #1e1e1e;
-            }
-            QLabel {
-                color: white;
-            }
-        """)
+            QTimer.singleShot(0, self._handle_auto_navigation)
         
     def _init_ui(self):
         """Initialize the main UI with stacked widget for navigation"""
@@ -253,12 +320,19 @@ class ITHelperApp(QMainWindow):
         self.setCentralWidget(self.main_widget)
         
         # Create main layout
-        self.main_layout = QVBoxLayout(self.main_widget)
+        self.main_layout = QHBoxLayout(self.main_widget)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.setSpacing(0)
+        
+        # One collapsible sidebar shared by all utility screens, hidden on the home screen
+        self.sidebar = CollapsibleSidebar(self)
+        self.main_layout.addWidget(self.sidebar)
         
         # Create stacked widget for different screens
         self.stacked_widget = QStackedWidget()
-        self.main_layout.addWidget(self.stacked_widget)
+        self.stacked_widget.currentChanged.connect(self._update_sidebar_visibility)
+        self.stacked_widget.currentChanged.connect(self._update_wifi_scanning)
+        self.main_layout.addWidget(self.stacked_widget, stretch=1)
         
         # Create home screen
         self._create_home_screen()
@@ -278,14 +352,14 @@ class ITHelperApp(QMainWindow):
         
         # Title
         title_label = QLabel("IT Helper")
-        title_label.setFont(QFont("Arial", 36, QFont.Bold))
+        title_label.setFont(_cached_font("Arial", 36, QFont.Bold))
         title_label.setAlignment(Qt.AlignCenter)
         title_label.setStyleSheet("color: #4CAF50; margin-bottom: 20px;")
         home_layout.addWidget(title_label)
         
         # Subtitle
         subtitle_label = QLabel("Your comprehensive IT toolkit")
-        subtitle_label.setFont(QFont("Arial", 16))
+        subtitle_label.setFont(_cached_font("Arial", 16))
         subtitle_label.setAlignment(Qt.AlignCenter)
         subtitle_label.setStyleSheet("color: #cccccc; margin-bottom: 40px;")
         home_layout.addWidget(subtitle_label)
@@ -300,7 +374,7 @@ class ITHelperApp(QMainWindow):
             "📶", "Wi-Fi Scanner", 
             "Scan and analyze wireless networks in your area"
         )
-        wifi_scanner_btn.clicked.connect(self._show_wifi_scanner)
+        wifi_scanner_btn.clicked.connect(self._show_wifi_scanner, Qt.QueuedConnection)
         buttons_layout.addWidget(wifi_scanner_btn, 0, 0)
         
         # WiFi Charts button  
@@ -308,7 +382,7 @@ class ITHelperApp(QMainWindow):
             "📊", "Wi-Fi Charts",
             "Visualize Wi-Fi signal strength over time"
         )
-        wifi_charts_btn.clicked.connect(self._show_wifi_charts)
+        wifi_charts_btn.clicked.connect(self._show_wifi_charts, Qt.QueuedConnection)
         buttons_layout.addWidget(wifi_charts_btn, 0, 1)
         
         # Disk Analyzer button
@@ -316,7 +390,7 @@ class ITHelperApp(QMainWindow):
             "💾", "Disk Space Analyzer",
             "Analyze disk usage and find large files"
         )
-        disk_analyzer_btn.clicked.connect(self._show_disk_analyzer)
+        disk_analyzer_btn.clicked.connect(self._show_disk_analyzer, Qt.QueuedConnection)
         buttons_layout.addWidget(disk_analyzer_btn, 0, 2)
         
         # System Info button
@@ -324,7 +398,7 @@ class ITHelperApp(QMainWindow):
             "🖥", "System Info",
             "Get system information and hardware details"
         )
-        system_info_btn.clicked.connect(self._show_system_info)
+        system_info_btn.clicked.connect(self._show_system_info, Qt.QueuedConnection)
         buttons_layout.addWidget(system_info_btn, 1, 0)
         
         # Network Scanner button
@@ -332,7 +406,7 @@ class ITHelperApp(QMainWindow):
             "🌐", "Network Scanner",
             "Discover devices on your network with port scanning"
         )
-        network_scanner_btn.clicked.connect(self._show_network_scanner)
+        network_scanner_btn.clicked.connect(self._show_network_scanner, Qt.QueuedConnection)
         buttons_layout.addWidget(network_scanner_btn, 1, 1)
         
         # SMART Disk Health Monitor button
@@ -340,7 +414,7 @@ class ITHelperApp(QMainWindow):
             "🔧", "SMART Disk Health",
             "Monitor disk health with SMART attributes (Requires Admin)"
         )
-        smart_test_btn.clicked.connect(self._show_smart_test)
+        smart_test_btn.clicked.connect(self._show_smart_test, Qt.QueuedConnection)
         buttons_layout.addWidget(smart_test_btn, 1, 2)
         
         home_layout.addWidget(buttons_frame)
@@ -348,157 +422,83 @@ class ITHelperApp(QMainWindow):
         # Add bottom spacer
         home_layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         
-        self.stacked_widget.addWidget(self.home_screen)
+        self._screen_indices["home"] = self.stacked_widget.addWidget(self.home_screen)
         
     def _create_utility_button(self, emoji, title, description):
-        """Create a styled utility button"""
+        """Create a styled utility button showing a pre-rendered tile"""
         button = QPushButton()
-        button.setFixedSize(250, 160)  # Reduced from 300x200 to fit 3 in a row
+        button.setFixedSize(UTILITY_TILE_SIZE)  # Reduced from 300x200 to fit 3 in a row
         button.setCursor(Qt.PointingHandCursor)
         
-        # Create button layout
-        button_layout = QVBoxLayout(button)
-        button_layout.setSpacing(8)  # Reduced spacing
-        
-        # Emoji icon
-        icon_label = QLabel(emoji)
-        icon_label.setFont(QFont("Segoe UI Emoji", 36))  # Reduced from 48
-        icon_label.setAlignment(Qt.AlignCenter)
-        button_layout.addWidget(icon_label)
-        
-        # Title
-        title_label = QLabel(title)
-        title_label.setFont(QFont("Arial", 14, QFont.Bold))  # Reduced from 16
-        title_label.setAlignment(Qt.AlignCenter)
-        button_layout.addWidget(title_label)
-        
-        # Description
-        desc_label = QLabel(description)
-        desc_label.setFont(QFont("Arial", 9))  # Reduced from 10
-        desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #cccccc;")
-        button_layout.addWidget(desc_label)
+        # The emoji, title and description are one cached pixmap instead of three labels
+        key = (emoji, title, description, self.devicePixelRatioF())
+        pixmap = self._tile_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._tile_pixmaps[key] = _render_utility_tile(*key)
+        button.setIcon(QIcon(pixmap))
+        button.setIconSize(UTILITY_TILE_CONTENT_SIZE)
         
         return button
         
     def _create_utility_screens(self):
-        """Create the utility screens with navigation - using lazy loading"""
-        # Don't create any widgets here - they will be created when first needed
+        """Register a placeholder per utility screen - widgets are created when first needed"""
         # This ensures no WiFi scanning starts until user navigates to those screens
-        pass
-        
-    def _create_utility_screen(self, utility_widget, emoji, title):
-        """Create a utility screen with sidebar navigation"""
-        screen = QWidget()
-        screen_layout = QHBoxLayout(screen)
-        screen_layout.setContentsMargins(0, 0, 0, 0)
-        screen_layout.setSpacing(0)
-        
-        # Create collapsible sidebar
-        sidebar = CollapsibleSidebar(self)
-        screen_layout.addWidget(sidebar)
-        
-        # Add utility widget
-        screen_layout.addWidget(utility_widget, stretch=1)
+        for screen_id in self._screen_factories:
+            placeholder = QWidget()
+            self._screen_placeholders[screen_id] = placeholder
+            self._screen_indices[screen_id] = self.stacked_widget.addWidget(placeholder)
+            
+    def _show_screen(self, screen_id):
+        """Navigate to a utility screen, building its widget on the first visit"""
+        self.current_screen = screen_id
+        index = self._screen_indices[screen_id]
+        
+        widget = self._screens.get(screen_id)
+        if widget is None:
+            title, widget_class = self._screen_factories[screen_id]
+            debug(f"Creating {title} widget for first time...", "MainApp")
+            widget = widget_class()
+            self._screens[screen_id] = widget
+            
+            # Swap the real widget in at the placeholder's position
+            placeholder = self._screen_placeholders.pop(screen_id)
+            self.stacked_widget.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.stacked_widget.insertWidget(index, widget)
+            
+        self.stacked_widget.setCurrentIndex(index)
+        return widget
         
-        return screen
+    def _update_sidebar_visibility(self, index):
+        """Show the shared sidebar on utility screens only"""
+        self.sidebar.setVisible(self.stacked_widget.widget(index) is not self.home_screen)
         
 
         
     def _show_home(self):
         """Navigate to home screen"""
-        self._stop_wifi_scanning()
         self.current_screen = "home"
-        self.stacked_widget.setCurrentWidget(self.home_screen)
+        self.stacked_widget.setCurrentIndex(self._screen_indices["home"])
         
     def _show_wifi_scanner(self):
-        """Navigate to WiFi Scanner utility"""
-        self._stop_wifi_scanning()
-        self.current_screen = "wifi_scanner"
-        
-        # Lazy loading - create widget only when first needed
-        if self.wifi_scanner_widget is None:
-            debug("Creating WiFi Scanner widget for first time...", "MainApp")
-            self.wifi_scanner_widget = WifiScannerWidget()
-            self.wifi_scanner_screen = self._create_utility_screen(
-                self.wifi_scanner_widget, "📶", "Wi-Fi Scanner"
-            )
-            self.stacked_widget.addWidget(self.wifi_scanner_screen)
-        
-        self.stacked_widget.setCurrentWidget(self.wifi_scanner_screen)
-        
-        # Start scanning only after navigating to the screen
-        if self.wifi_scanner_widget:
-            self.wifi_scanner_widget.start_scanning()
+        """Navigate to WiFi Scanner utility, scanning starts once it is shown"""
+        self._show_screen("wifi_scanner")
         
     def _show_wifi_charts(self):
-        """Navigate to WiFi Charts utility"""  
-        self._stop_wifi_scanning()
-        self.current_screen = "wifi_charts"
-        
-        # Lazy loading - create widget only when first needed
-        if self.wifi_charts_widget is None:
-            debug("Creating WiFi Charts widget for first time...", "MainApp")
-            self.wifi_charts_widget = WifiChartsWidget()
-            self.wifi_charts_screen = self._create_utility_screen(
-                self.wifi_charts_widget, "📊", "Wi-Fi Charts"
-            )
-            self.stacked_widget.addWidget(self.wifi_charts_screen)
-        
-        self.stacked_widget.setCurrentWidget(self.wifi_charts_screen)
-        
-        # Start data collection only after navigating to the screen
-        if self.wifi_charts_widget:
-            self.wifi_charts_widget.start_data_collection()
+        """Navigate to WiFi Charts utility, data collection starts once it is shown"""
+        self._show_screen("wifi_charts")
         
     def _show_disk_analyzer(self):
         """Navigate to Disk Analyzer utility"""
-        self._stop_wifi_scanning()
-        self.current_screen = "disk_analyzer"
-        
-        # Lazy loading - create widget only when first needed
-        if self.disk_analyzer_widget is None:
-            debug("Creating Disk Analyzer widget for first time...", "MainApp")
-            self.disk_analyzer_widget = DiskAnalyzerWidget()
-            self.disk_analyzer_screen = self._create_utility_screen(
-                self.disk_analyzer_widget, "💾", "Disk Space Analyzer"
-            )
-            self.stacked_widget.addWidget(self.disk_analyzer_screen)
-        
-        self.stacked_widget.setCurrentWidget(self.disk_analyzer_screen)
+        self._show_screen("disk_analyzer")
         
     def _show_system_info(self):
         """Navigate to System Info utility"""
-        self._stop_wifi_scanning()
-        self.current_screen = "system_info"
-        
-        # Lazy loading - create widget only when first needed
-        if self.system_info_widget is None:
-            debug("Creating System Info widget for first time...", "MainApp")
-            self.system_info_widget = SystemInfoWidget()
-            self.system_info_screen = self._create_utility_screen(
-                self.system_info_widget, "🖥", "System Info"
-            )
-            self.stacked_widget.addWidget(self.system_info_screen)
-        
-        self.stacked_widget.setCurrentWidget(self.system_info_screen)
+        self._show_screen("system_info")
         
     def _show_network_scanner(self):
         """Navigate to Network Scanner utility"""
-        self._stop_wifi_scanning()
-        self.current_screen = "network_scanner"
-        
-        # Lazy loading - create widget only when first needed
-        if self.network_scanner_widget is None:
-            debug("Creating Network Scanner widget for first time...", "MainApp")
-            self.network_scanner_widget = NetworkScannerWidget()
-            self.network_scanner_screen = self._create_utility_screen(
-                self.network_scanner_widget, "🌐", "Network Scanner"
-            )
-            self.stacked_widget.addWidget(self.network_scanner_screen)
-        
-        self.stacked_widget.setCurrentWidget(self.network_scanner_screen)
+        self._show_screen("network_scanner")
         
     def _show_smart_test(self):
         """Navigate to SMART Test utility - requires admin privileges"""
@@ -517,12 +517,19 @@ class ITHelperApp(QMainWindow):
                     # Get current script path
                     script_path = os.path.abspath(sys.argv[0])
                     
-                    # Restart as admin with SMART argument
-                    ctypes.windll.shell32.ShellExecuteW(
-                        None, "runas", sys.executable, 
-                        f'"{script_path}" --open-smart-test', None, 1
+                    if _SHELL_EXECUTE is None:
+                        raise OSError("elevated restart is only supported on Windows")
+                    
+                    # Restart as admin with SMART argument, quoted properly even with spaces in the path
+                    result = _SHELL_EXECUTE(
+                        None, "runas", sys.executable,
+                        subprocess.list2cmdline([script_path, "--open-smart-test"]), None, 1
                     )
                     
+                    # ShellExecuteW reports failure (including a declined UAC prompt) as a value <= 32
+                    if (result or 0) <= 32:
+                        raise OSError(f"ShellExecuteW returned {result or 0}")
+                    
                     # Close current instance
                     QApplication.quit()
                     return
@@ -537,31 +544,38 @@ class ITHelperApp(QMainWindow):
             else:
                 return
         
-        self._stop_wifi_scanning()
-        self.current_screen = "smart_test"
-        
-        # Lazy loading - create widget only when first needed
-        if self.smart_test_widget is None:
-            debug("Creating SMART Test widget for first time...", "MainApp")
-            self.smart_test_widget = SMARTTestWidget()
-            self.smart_test_screen = self._create_utility_screen(
-                self.smart_test_widget, "🔧", "SMART Disk Health"
-            )
-            self.stacked_widget.addWidget(self.smart_test_screen)
-        
-        self.stacked_widget.setCurrentWidget(self.smart_test_screen)
+        smart_test_widget = self._show_screen("smart_test")
         
         # Auto-start SMART scan
-        if self.smart_test_widget and not hasattr(self.smart_test_widget, '_has_auto_scanned'):
-            self.smart_test_widget._start_smart_scan()
-            self.smart_test_widget._has_auto_scanned = True
+        if not hasattr(smart_test_widget, '_has_auto_scanned'):
+            smart_test_widget._start_smart_scan()
+            smart_test_widget._has_auto_scanned = True
+        
+    def _update_wifi_scanning(self, index):
+        """Hand Wi-Fi scanning over to the shown screen, only when it actually changes"""
+        widget = self.stacked_widget.widget(index)
+        screen_id = next((sid for sid, screen in self._screens.items() if screen is widget), None)
+        producer = screen_id if screen_id in self.WIFI_PRODUCERS else None
+        if producer == self._wifi_active:
+            return
+            
+        if self._wifi_active:
+            stop_method = self.WIFI_PRODUCERS[self._wifi_active][1]
+            getattr(self._screens[self._wifi_active], stop_method)()
+        if producer:
+            start_method = self.WIFI_PRODUCERS[producer][0]
+            getattr(widget, start_method)()
+        self._wifi_active = producer
         
     def _stop_wifi_scanning(self):
         """Stop all WiFi scanning activities"""
-        if self.wifi_scanner_widget:
-            self.wifi_scanner_widget.stop_scanning()
-        if self.wifi_charts_widget:
-            self.wifi_charts_widget.stop_data_collection()
+        wifi_scanner_widget = self._screens.get("wifi_scanner")
+        if wifi_scanner_widget:
+            wifi_scanner_widget.stop_scanning()
+        wifi_charts_widget = self._screens.get("wifi_charts")
+        if wifi_charts_widget:
+            wifi_charts_widget.stop_data_collection()
+        self._wifi_active = None
             
     def closeEvent(self, event):
         """Handle application close event"""
@@ -583,36 +597,36 @@ class ITHelperApp(QMainWindow):
             debug("Auto-opening Disk Analyzer due to admin restart...", "MainApp")
             
             # Navigate to disk analyzer first
-            self._show_disk_analyzer()
+            disk_analyzer_widget = self._show_screen("disk_analyzer")
             
             # Set up the folder/drive after the widget is created
-            if self.disk_analyzer_widget:
+            if disk_analyzer_widget:
+                disk_analyzer_widget.mft_strategies = self.args.mft_strategies
+                
                 if self.args.folder:
                     debug(f"Auto-selecting folder: {self.args.folder}", "MainApp")
                     # Set the custom folder path
-                    self.disk_analyzer_widget.current_custom_folder_path = self.args.folder
-                    self.disk_analyzer_widget.custom_folder_label.setText(self.args.folder)
-                    self.disk_analyzer_widget.custom_folder_label_prefix.show()
-                    self.disk_analyzer_widget.custom_folder_label.show()
-                    self.disk_analyzer_widget.scan_path_button.setText("🔍 Analyze Folder")
+                    disk_analyzer_widget.current_custom_folder_path = self.args.folder
+                    disk_analyzer_widget.custom_folder_label.setText(self.args.folder)
+                    disk_analyzer_widget.custom_folder_label_prefix.show()
+                    disk_analyzer_widget.custom_folder_label.show()
+                    disk_analyzer_widget.scan_path_button.setText("🔍 Analyze Folder")
                     # Clear drive selection
-                    self.disk_analyzer_widget.drive_select_combo.setCurrentIndex(-1)
+                    disk_analyzer_widget.drive_select_combo.setCurrentIndex(-1)
                     
                 elif self.args.drive:
                     debug(f"Auto-selecting drive: {self.args.drive}", "MainApp")
-                    # Find and select the drive in the combo box
-                    for i in range(self.disk_analyzer_widget.drive_select_combo.count()):
-                        if self.disk_analyzer_widget.drive_select_combo.itemData(i) == self.args.drive:
-                            self.disk_analyzer_widget.drive_select_combo.setCurrentIndex(i)
-                            break
+                    # Selected now, or as soon as the background drive listing arrives
+                    disk_analyzer_widget.select_drive(self.args.drive)
                             
     def _is_running_as_admin(self):
         """Check if the application is running with administrator privileges"""
-        try:
-            import ctypes
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except:
-            return False
+        return self._is_admin
+        
+    @staticmethod
+    def _compute_is_admin():
+        """Ask the OS once whether the process is elevated, it cannot change while running"""
+        return bool(_IS_ADMIN_IMPL())
 
 
 def parse_arguments():
@@ -626,15 +640,36 @@ def parse_arguments():
                        help='Folder path to analyze (used with --open-disk-analyzer)')
     parser.add_argument('--drive', type=str,
                        help='Drive path to analyze (used with --open-disk-analyzer)')
+    parser.add_argument('--mft-strategies', type=_parse_mft_strategies,
+                       help='Comma-separated MFT scan strategies to try in order, from '
+                            f'{",".join(MFT_STRATEGIES)} (used with --open-disk-analyzer)')
     
     return parser.parse_args()
 
 
+def _parse_mft_strategies(value):
+    """Split and check the --mft-strategies list"""
+    strategies = tuple(name.strip() for name in value.split(',') if name.strip())
+    unknown = [name for name in strategies if name not in MFT_STRATEGIES]
+    if unknown or not strategies:
+        raise argparse.ArgumentTypeError(
+            f"invalid MFT strategy list {value!r}, choose from {', '.join(MFT_STRATEGIES)}")
+    return strategies
+
+
 def main():
     """Main application entry point"""
+    # Let Qt merge bursts of mouse-move/resize events (Qt 6 already scales for high DPI on its own)
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
     app = QApplication(sys.argv)
+    
+    # Combo, menu and tooltip animations are not used by the UI, skip them
+    for effect in (Qt.UI_AnimateCombo, Qt.UI_AnimateMenu, Qt.UI_FadeMenu,
+                   Qt.UI_AnimateTooltip, Qt.UI_FadeTooltip):
+        QApplication.setEffectEnabled(effect, False)
     app.setApplicationName("IT Helper")
     app.setOrganizationName("IT Helper")
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Parse command line arguments
     args = parse_arguments()
@@ -6,8 +6,16 @@ import subprocess
 import ipaddress
 import time
 import json
+import re
+import ctypes
+import struct
+import errno
+import selectors
+import select
+import zlib
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FutureTimeoutError
 from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSortFilterProxyModel
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, 
@@ -17,6 +25,114 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QFont, QColor, QAction, QPixmap, QIcon
 import platform
+import numpy as np
+
+# connect_ex results meaning a non-blocking connect is still underway
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN,
+                        getattr(errno, 'WSAEWOULDBLOCK', 10035)}
+
+# How long a host's details wait for its reverse-DNS answer before reporting Unknown
+PTR_WAIT_SECONDS = 0.5
+
+
+@lru_cache(maxsize=4096)
+def _resolve_ptr(ip):
+    """Reverse-resolve an address, remembered across scans since slow PTR servers repeat"""
+    try:
+        # getnameinfo is reentrant and does only the PTR lookup, NI_NAMEREQD fails instead of echoing the IP
+        return socket.getnameinfo((ip, 0), socket.NI_NAMEREQD | socket.NI_NUMERICSERV)[0]
+    except (OSError, UnicodeError):
+        return 'Unknown'
+
+
+# ARP table entries as printed by "arp -a" (Windows) and "arp -an" (macOS)
+_ARP_LINE = re.compile(r'\(?(\d+\.\d+\.\d+\.\d+)\)?\s+(?:at\s+)?([0-9A-Fa-f]{1,2}(?:[-:][0-9A-Fa-f]{1,2}){5})\b')
+
+# Seconds before the cached ARP table is read again during a long scan
+ARP_TABLE_TTL = 5.0
+
+# Seconds allowed for ARP replies after priming the cache with UDP probes
+ARP_PRIME_WAIT = 0.2
+
+# Full IEEE vendor database made by build_tools/build_oui_db.py, next to this module or bundled
+_OUI_DATA_DIR = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))), 'oui_data')
+
+
+@lru_cache(maxsize=1)
+def _load_oui_database():
+    """Map the sorted OUI prefix array and read its vendor names once per process, None if absent"""
+    try:
+        ouis = np.memmap(os.path.join(_OUI_DATA_DIR, 'ouis.bin'), dtype='<u4', mode='r')
+        with open(os.path.join(_OUI_DATA_DIR, 'vendors.txt'), encoding='utf-8') as vendor_file:
+            vendors = vendor_file.read().splitlines()
+    except (OSError, ValueError):
+        return None
+    if len(ouis) != len(vendors):
+        return None
+    return ouis, vendors
+
+
+def _linux_default_network():
+    """Read the default route's on-link network from /proc/net/route, None if there is none"""
+    try:
+        with open('/proc/net/route') as route_file:
+            next(route_file)  # Header
+            routes = [line.split() for line in route_file]
+    except (OSError, StopIteration):
+        return None
+    
+    # Destinations and masks are little-endian hex, the default route has destination 0
+    default_ifaces = [r[0] for r in routes if len(r) >= 8 and r[1] == '00000000' and int(r[3], 16) & 0x2]
+    for fields in routes:
+        if len(fields) >= 8 and fields[0] in default_ifaces and fields[1] != '00000000' and fields[2] == '00000000':
+            address = socket.inet_ntoa(struct.pack('<I', int(fields[1], 16)))
+            mask = socket.inet_ntoa(struct.pack('<I', int(fields[7], 16)))
+            return ipaddress.IPv4Network(f"{address}/{mask}", strict=False)
+    return None
+
+
+# Round-trip time in ping output: "time=0.45 ms" (Linux/macOS), "time<1ms" / "Zeit=3ms" (Windows)
+_PING_RTT = re.compile(rb'[=<]\s*([\d.]+)\s*ms')
+
+# Packs an address int into its 4 network-order bytes
+_PACK_IPV4 = struct.Struct('!I').pack
+
+# Devices whose services are known from the vendor get a short port list instead of
+# the full common set, matched as lowercase substrings of the manufacturer name.
+# Vendors that also make PCs or servers (HP, Canon) are left out so those keep the full scan
+_PRINTER_PORTS = {80: 'HTTP', 443: 'HTTPS', 515: 'LPD', 631: 'IPP', 9100: 'JetDirect'}
+_CAMERA_PORTS = {80: 'HTTP', 443: 'HTTPS', 554: 'RTSP'}
+VENDOR_PORT_PROFILES = [
+    ('brother', _PRINTER_PORTS),
+    ('epson', _PRINTER_PORTS),
+    ('lexmark', _PRINTER_PORTS),
+    ('kyocera', _PRINTER_PORTS),
+    ('xerox', _PRINTER_PORTS),
+    ('ricoh', _PRINTER_PORTS),
+    ('axis communications', _CAMERA_PORTS),
+    ('hikvision', _CAMERA_PORTS),
+    ('dahua', _CAMERA_PORTS),
+    ('espressif', {80: 'HTTP'}),
+    ('tuya', {80: 'HTTP'}),
+]
+
+# Seconds a host's hostname, MAC and open ports are reused by later scans
+HOST_CACHE_TTL = 60.0
+
+# Optional: in-process ICMP pings, the ping command is used when unavailable
+try:
+    import icmplib
+except ImportError:
+    icmplib = None
+
+
+# Linux classic BPF structures (struct sock_filter / struct sock_fprog) for SO_ATTACH_FILTER
+class _SockFilter(ctypes.Structure):
+    _fields_ = [('code', ctypes.c_uint16), ('jt', ctypes.c_uint8), ('jf', ctypes.c_uint8), ('k', ctypes.c_uint32)]
+
+
+class _SockFprog(ctypes.Structure):
+    _fields_ = [('len', ctypes.c_ushort), ('filter', ctypes.POINTER(_SockFilter))]
 
 
 class NetworkScanWorker(QThread):
@@ -26,12 +142,41 @@ class NetworkScanWorker(QThread):
     scan_complete = Signal()
     scan_error = Signal(str)
     
-    def __init__(self, ip_range, scan_ports=True, timeout=1, parent=None):
+    # Echo requests per second sent by the shared-socket ping sweep
+    ICMP_SEND_RATE = 500
+    # SYN packets per second sent by the raw-socket port scan
+    SYN_SEND_RATE = 5000
+    # Least seconds between progress updates, about 30 per second
+    PROGRESS_INTERVAL = 0.033
+    # Bounds on hosts probed concurrently, sized to each scan between them
+    MIN_SCAN_WORKERS = 16
+    MAX_SCAN_WORKERS = 256
+    
+    def __init__(self, ip_range, scan_ports=True, timeout=1, pool=None, host_cache=None, parent=None):
         super().__init__(parent)
         self.ip_range = ip_range
+        self._pool = pool  # Shared across scans by the widget, else one is made per scan
+        self._host_cache = host_cache  # ip -> (time found, details), kept by the widget across scans
         self.scan_ports = scan_ports
         self.timeout = timeout
         self.should_stop = False
+        self._last_progress = 0.0
+        
+        # Checked per host, so looked up once
+        self._is_windows = platform.system().lower() == 'windows'
+        self._is_linux = platform.system().lower() == 'linux'
+        # SO_LINGER on, 0 seconds. Windows' struct linger uses two u_shorts
+        self._linger_abort = struct.pack('HH' if self._is_windows else 'ii', 1, 0)
+        
+        # Ping in-process when icmplib can open its socket, switched off on the first permission error
+        self._use_icmplib = icmplib is not None
+        self._dns_pool = None  # Created per scan in run()
+        
+        # ARP table read in bulk, loaded at scan start and refreshed on a TTL
+        self._arp_table = {}
+        self._arp_loaded_at = 0.0
+        self._arp_lock = threading.Lock()
+        self._arp_refreshing = False  # One worker re-reads the table, the others keep using the old one
         
         # Common ports to scan
         self.common_ports = {
@@ -43,6 +188,9 @@ class NetworkScanWorker(QThread):
         
         # Load MAC vendor database
         self.mac_vendors = self._load_mac_vendors()
+        # Same table keyed by the OUI as a 24-bit int, the form lookups use
+        self._oui_map = {int(prefix.replace(':', ''), 16): vendor for prefix, vendor in self.mac_vendors.items()}
+        self._vendor_ports = {}  # manufacturer -> ports to probe, resolved once per vendor
     
     def stop(self):
         """Stop the scanning process"""
@@ -51,44 +199,88 @@ class NetworkScanWorker(QThread):
     def run(self):
         """Main scanning logic"""
         try:
-            # Parse IP range
+            # Parse IP range into first and last address as ints
             if '/' in self.ip_range:
                 network = ipaddress.IPv4Network(self.ip_range, strict=False)
-                ip_list = list(network.hosts())
+                start = int(network.network_address)
+                end = int(network.broadcast_address)
+                if network.prefixlen < 31:
+                    start, end = start + 1, end - 1  # Skip the network and broadcast addresses
             elif '-' in self.ip_range:
                 start_ip, end_ip = self.ip_range.split('-')
-                start = ipaddress.IPv4Address(start_ip.strip())
-                end = ipaddress.IPv4Address(end_ip.strip())
-                ip_list = [ipaddress.IPv4Address(ip) for ip in range(int(start), int(end) + 1)]
+                start = int(ipaddress.IPv4Address(start_ip.strip()))
+                end = int(ipaddress.IPv4Address(end_ip.strip()))
             else:
-                ip_list = [ipaddress.IPv4Address(self.ip_range)]
+                start = end = int(ipaddress.IPv4Address(self.ip_range))
+            
+            # Lazy stream of dotted-quad strings, nothing is materialized and each is formatted once.
+            # Plain int arithmetic through map, no IPv4Address objects or per-item Python frames
+            addresses = map(socket.inet_ntoa, map(_PACK_IPV4, range(start, end + 1)))
+            total_ips = max(end - start + 1, 0)
             
-            total_ips = len(ip_list)
             self.scan_progress.emit(0, total_ips, "Starting scan...")
+            self._load_arp_table()
             
-            # Use ThreadPoolExecutor for concurrent scanning
-            with ThreadPoolExecutor(max_workers=50) as executor:
-                future_to_ip = {
-                    executor.submit(self._scan_single_ip, str(ip)): str(ip) 
-                    for ip in ip_list
-                }
-                
+            # Find live hosts with one shared ICMP socket, then look up details for those only.
+            # Without it every address is pinged on its own inside the pool
+            alive = self._icmp_sweep(addresses, total_ips) if self._use_icmplib else None
+            if alive is None:
+                targets = ((ip, None) for ip in addresses)
+            else:
+                targets = iter(alive.items())
+                total_ips = len(alive)
+            
+            # Make the kernel resolve every live host's MAC, then read the table once more
+            if alive:
+                self._prime_arp_cache(alive)
+            
+            # When raw sockets are allowed, SYN-probe the ports of every live host in one pass
+            raw_ports = None
+            if self.scan_ports and alive:
+                raw_ports = self._scan_ports_raw([ip for ip in alive if self._cached_details(ip) is None])
+            
+            # Reverse DNS runs in its own pool so a slow PTR never holds up a host's other probes
+            self._dns_pool = ThreadPoolExecutor(max_workers=16)
+            
+            # Concurrency follows the workload, feeding the pool only as fast as it finishes
+            # so at most that many futures exist at any time
+            workers = min(self.MAX_SCAN_WORKERS, max(self.MIN_SCAN_WORKERS, total_ips // 4))
+            executor = self._pool or ThreadPoolExecutor(max_workers=workers)
+            future_to_ip = {}
+            try:
                 completed = 0
-                for future in as_completed(future_to_ip):
-                    if self.should_stop:
+                while not self.should_stop:
+                    for ip, ping_time in targets:
+                        future = executor.submit(self._scan_single_ip, ip, ping_time,
+                                                 raw_ports.get(ip, {}) if raw_ports is not None else None)
+                        future_to_ip[future] = ip
+                        if len(future_to_ip) >= workers:
+                            break
+                    if not future_to_ip:
                         break
-                        
-                    completed += 1
-                    ip = future_to_ip[future]
-                    
-                    try:
-                        result = future.result()
-                        if result:
-                            self.device_found.emit(result)
-                    except Exception as e:
-                        pass  # Skip failed IPs
                     
-                    self.scan_progress.emit(completed, total_ips, f"Scanning {ip}...")
+                    done, _ = wait(future_to_ip, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        completed += 1
+                        ip = future_to_ip.pop(future)
+                        
+                        try:
+                            result = future.result()
+                            if result:
+                                self.device_found.emit(result)
+                        except Exception as e:
+                            pass  # Skip failed IPs
+                        
+                        self._emit_progress(completed, total_ips, f"Scanning {ip}...")
+            finally:
+                # Leave a shared pool free for the next scan
+                for future in future_to_ip:
+                    future.cancel()
+                if executor is not self._pool:
+                    executor.shutdown(wait=False)
+            
+            # Lookups given up on finish in the background and still land in the cache
+            self._dns_pool.shutdown(wait=False)
             
             if not self.should_stop:
                 self.scan_complete.emit()
@@ -96,121 +288,440 @@ class NetworkScanWorker(QThread):
         except Exception as e:
             self.scan_error.emit(f"Scan error: {str(e)}")
     
-    def _scan_single_ip(self, ip):
-        """Scan a single IP address"""
+    def _emit_progress(self, current, total, status):
+        """Report progress at most every PROGRESS_INTERVAL, always for the last item"""
+        now = time.monotonic()
+        if current >= total or now - self._last_progress > self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.scan_progress.emit(current, total, status)
+    
+    def _icmp_sweep(self, addresses, total):
+        """Ping all addresses over one ICMP socket, returns {ip: response ms} or None if not permitted"""
+        identifier = os.getpid() & 0xFFFF
+        sock = self._open_icmp_socket(identifier)
+        if sock is None:
+            self._use_icmplib = False
+            return None
+        
+        pending = {}  # (ip, sequence) -> send time, replies are matched back through it. Sequences wrap
+                      # past 65536 addresses, so the source address is part of the key
+        pending_lock = threading.Lock()
+        sent = [0]
+        sending_done = threading.Event()
+        alive = {}
+        
+        def send_requests():
+            interval = 1.0 / self.ICMP_SEND_RATE
+            for sequence, ip in enumerate(addresses):
+                if self.should_stop:
+                    break
+                request = icmplib.ICMPRequest(ip, id=identifier, sequence=sequence & 0xFFFF)
+                with pending_lock:
+                    pending[(ip, request.sequence)] = time.perf_counter()
+                try:
+                    sock.send(request)
+                except icmplib.ICMPLibError:
+                    pass  # Unreachable from here, it simply never answers
+                sent[0] += 1
+                time.sleep(interval)
+            sending_done.set()
+        
+        sender = threading.Thread(target=send_requests, daemon=True)
+        sender.start()
+        try:
+            deadline = None
+            while not self.should_stop:
+                # Keep listening one timeout past the last request
+                if sending_done.is_set():
+                    if deadline is None:
+                        deadline = time.perf_counter() + self.timeout
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                else:
+                    remaining = self.timeout
+                
+                try:
+                    reply = sock.receive(None, min(remaining, 0.2))
+                except icmplib.ICMPLibError:
+                    reply = None  # Timed out or unreadable, just poll again
+                
+                if reply is not None and reply.type == 0:  # Echo reply
+                    with pending_lock:
+                        sent_at = pending.pop((reply.source, reply.sequence), None)
+                    if sent_at is not None:
+                        alive[reply.source] = (time.perf_counter() - sent_at) * 1000
+                
+                self._emit_progress(sent[0], total, f"Pinging... {len(alive)} hosts up")
+        finally:
+            sender.join()
+            sock.close()
+        
+        return alive
+    
+    def _open_icmp_socket(self, identifier):
+        """Open the sweep's ICMP socket, unprivileged if allowed, else raw when running elevated"""
+        try:
+            return icmplib.ICMPv4Socket(privileged=False)
+        except icmplib.SocketPermissionError:
+            pass
+        
+        try:
+            sock = icmplib.ICMPv4Socket(privileged=True)
+        except icmplib.SocketPermissionError:
+            return None
+        
+        # A raw socket sees every ICMP packet on the host, keep only replies carrying our id
+        if self._is_linux:
+            self._attach_icmp_id_filter(sock, identifier)
+        return sock
+    
+    def _attach_icmp_id_filter(self, sock, identifier):
+        """Attach a classic BPF program dropping ICMP packets whose id is not ours, in the kernel"""
+        program = [
+            (0xb1, 0, 0, 0),           # ldxb 4*([0]&0xf)  - IP header length
+            (0x48, 0, 0, 4),           # ldh [x+4]         - ICMP identifier
+            (0x15, 0, 1, identifier),  # jeq #identifier
+            (0x06, 0, 0, 0xFFFF),      # ret #65535        - accept
+            (0x06, 0, 0, 0),           # ret #0            - drop
+        ]
+        # ICMPSocket.sock is icmplib's public accessor for the OS socket (icmplib 3.x, see
+        # requirements.txt). Without the filter replies are still matched in Python
+        os_sock = getattr(sock, 'sock', None)
+        if not isinstance(os_sock, socket.socket):
+            return
+        filters = (_SockFilter * len(program))(*program)
+        fprog = _SockFprog(len(program), filters)
+        try:
+            os_sock.setsockopt(socket.SOL_SOCKET, getattr(socket, 'SO_ATTACH_FILTER', 26), bytes(fprog))
+        except OSError:
+            pass
+    
+    def _scan_single_ip(self, ip, ping_time=None, open_ports=None):
+        """Scan a single IP address, ping_time and open_ports are given when already probed in bulk"""
         if self.should_stop:
             return None
             
         device_info = {'ip': ip}
         
         # Ping test
-        ping_time = self._ping_host(ip)
+        if ping_time is None:
+            ping_time = self._ping_host(ip)
         if ping_time is None:
             return None  # Host not responding
         
         device_info['response_time'] = f"{ping_time:.1f}ms"
         device_info['status'] = 'Online'
         
-        # Get hostname
-        hostname = self._get_hostname(ip)
-        device_info['hostname'] = hostname
+        # Hostname, MAC and ports rarely change, reuse what a recent scan found and only refresh the RTT
+        details = self._cached_details(ip)
+        if details is None:
+            details = self._lookup_host_details(ip, open_ports)
+            if self._host_cache is not None:
+                self._host_cache[ip] = (time.monotonic(), details)
+        device_info.update(details)
+        
+        # The table and export columns, formatted here so the GUI thread only places them
+        device_info['_row'] = (
+            ip, device_info['hostname'], device_info['mac_address'], device_info['manufacturer'],
+            device_info['response_time'], device_info['status'], device_info['services']
+        )
+        
+        return device_info
+    
+    def _cached_details(self, ip):
+        """Return the host's details from the cache if fresh and from a scan with the same port setting"""
+        if self._host_cache is None:
+            return None
+        cached = self._host_cache.get(ip)
+        if cached is None or time.monotonic() - cached[0] > HOST_CACHE_TTL:
+            return None
+        details = cached[1]
+        if ('open_ports' in details) != self.scan_ports:
+            return None
+        if details['hostname'] == 'Unknown':
+            # The PTR lookup may have timed out last scan, ask again (instant once _resolve_ptr has an answer)
+            hostname = self._get_hostname(self._dns_pool.submit(_resolve_ptr, ip))
+            if hostname != 'Unknown':
+                details = dict(details, hostname=hostname)
+                self._host_cache[ip] = (cached[0], details)
+        return details
+    
+    def _lookup_host_details(self, ip, open_ports=None):
+        """Look up hostname, MAC, manufacturer and open ports of a responding host"""
+        details = {}
+        
+        # Resolve the hostname in the background while MAC and ports are looked up
+        hostname_future = self._dns_pool.submit(_resolve_ptr, ip)
+        details['hostname'] = 'Unknown'
         
         # Get MAC address
         mac_address = self._get_mac_address(ip)
-        device_info['mac_address'] = mac_address
+        details['mac_address'] = mac_address
         
         # Get manufacturer from MAC
         if mac_address and mac_address != 'Unknown':
-            manufacturer = self._get_mac_manufacturer(mac_address)
-            device_info['manufacturer'] = manufacturer
+            details['manufacturer'] = self._get_mac_manufacturer(mac_address)
         else:
-            device_info['manufacturer'] = 'Unknown'
+            details['manufacturer'] = 'Unknown'
         
         # Port scanning
         if self.scan_ports:
-            open_ports = self._scan_ports(ip)
-            device_info['open_ports'] = open_ports
-            device_info['services'] = ', '.join([f"{port}({service})" for port, service in open_ports.items()])
+            if open_ports is None:
+                open_ports = self._scan_ports(ip, self._ports_for_vendor(details['manufacturer']))
+            details['open_ports'] = open_ports
+            details['services'] = ', '.join([f"{port}({service})" for port, service in open_ports.items()])
         else:
-            device_info['services'] = 'Not scanned'
+            details['services'] = 'Not scanned'
         
-        return device_info
+        details['hostname'] = self._get_hostname(hostname_future)
+        return details
     
     def _ping_host(self, ip, timeout=1):
         """Ping a host and return response time in ms"""
+        if self._use_icmplib:
+            try:
+                host = icmplib.ping(ip, count=1, timeout=timeout, privileged=False)
+                return host.avg_rtt if host.is_alive else None
+            except icmplib.SocketPermissionError:
+                # Unprivileged ICMP is not allowed here, use the ping command from now on
+                self._use_icmplib = False
+            except Exception:
+                return None
+        
         try:
-            if platform.system().lower() == 'windows':
+            if self._is_windows:
                 cmd = ['ping', '-n', '1', '-w', str(timeout * 1000), ip]
             else:
                 cmd = ['ping', '-c', '1', '-W', str(timeout), ip]
             
-            start_time = time.time()
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout + 1)
-            end_time = time.time()
+            start_time = time.monotonic()
+            process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                       stderr=subprocess.DEVNULL)
+            try:
+                output, _ = process.communicate(timeout=timeout + 1)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                return None
+            elapsed = (time.monotonic() - start_time) * 1000
             
-            if result.returncode == 0:
-                return (end_time - start_time) * 1000
-            return None
-        except:
+            if process.returncode != 0:
+                return None
+            # Prefer the RTT ping measured itself over timing the whole process
+            match = _PING_RTT.search(output)
+            return float(match.group(1)) if match else elapsed
+        except (OSError, ValueError):
             return None
     
-    def _get_hostname(self, ip):
-        """Get hostname for IP address"""
+    def _get_hostname(self, hostname_future):
+        """Get the hostname from a pending lookup, Unknown if it has not answered in time"""
         try:
-            hostname = socket.gethostbyaddr(ip)[0]
-            return hostname
-        except:
-            return 'Unknown'
+            return hostname_future.result(timeout=PTR_WAIT_SECONDS)
+        except FutureTimeoutError:
+            return 'Unknown'  # Still cached once it answers, so a rescan picks it up
     
     def _get_mac_address(self, ip):
-        """Get MAC address using ARP"""
+        """Get MAC address from the bulk-read ARP table, re-read once it is ARP_TABLE_TTL old"""
+        with self._arp_lock:
+            stale = not self._arp_refreshing and time.monotonic() - self._arp_loaded_at > ARP_TABLE_TTL
+            if stale:
+                self._arp_refreshing = True
+        if stale:
+            self._load_arp_table()
+        return self._arp_table.get(ip, 'Unknown')
+    
+    def _prime_arp_cache(self, ips):
+        """Send each host a 1-byte datagram to the discard port so the kernel ARPs for it, then re-read"""
         try:
-            if platform.system().lower() == 'windows':
-                # Use arp command on Windows
-                result = subprocess.run(['arp', '-a', ip], capture_output=True, text=True, timeout=2)
-                if result.returncode == 0:
-                    lines = result.stdout.split('\n')
-                    for line in lines:
-                        if ip in line and 'dynamic' in line.lower():
-                            parts = line.split()
-                            for part in parts:
-                                if '-' in part and len(part) == 17:  # MAC format xx-xx-xx-xx-xx-xx
-                                    return part.replace('-', ':').upper()
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                for ip in ips:
+                    try:
+                        sock.sendto(b'\x00', (ip, 9))
+                    except OSError:
+                        pass
+        except OSError:
+            return
+        
+        time.sleep(ARP_PRIME_WAIT)  # Give the ARP exchanges a moment to complete
+        self._load_arp_table()
+    
+    def _load_arp_table(self):
+        """Read the whole ARP table once into {ip: MAC} instead of running arp per host
+        
+        Read outside _arp_lock and swapped in under it, so lookups never wait on the arp process.
+        """
+        table = {}
+        try:
+            if self._is_linux:
+                # The kernel table, no process needed
+                with open('/proc/net/arp') as arp_file:
+                    next(arp_file)  # Header
+                    for line in arp_file:
+                        fields = line.split()
+                        if len(fields) >= 4 and fields[2] != '0x0' and fields[3] != '00:00:00:00:00:00':
+                            table[fields[0]] = fields[3].upper()
             else:
-                # Use arp command on Linux/Mac
-                result = subprocess.run(['arp', '-n', ip], capture_output=True, text=True, timeout=2)
+                # Windows lists "ip  xx-xx-xx-xx-xx-xx  dynamic", macOS "? (ip) at x:x:x:x:x:x on en0"
+                cmd = ['arp', '-a'] if self._is_windows else ['arp', '-an']
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
-                    lines = result.stdout.split('\n')
-                    for line in lines:
-                        if ip in line:
-                            parts = line.split()
-                            for part in parts:
-                                if ':' in part and len(part) == 17:  # MAC format xx:xx:xx:xx:xx:xx
-                                    return part.upper()
-        except:
+                    for match in _ARP_LINE.finditer(result.stdout):
+                        octets = re.split('[-:]', match.group(2))
+                        # macOS drops leading zeros from octets
+                        table[match.group(1)] = ':'.join(octet.zfill(2) for octet in octets).upper()
+        except (OSError, subprocess.SubprocessError, StopIteration):
             pass
-        return 'Unknown'
+        
+        with self._arp_lock:
+            self._arp_table = table
+            self._arp_loaded_at = time.monotonic()
+            self._arp_refreshing = False
+    
+    def _ports_for_vendor(self, manufacturer):
+        """Ports worth probing for a manufacturer, a short profile for printer and camera/IoT makers"""
+        ports = self._vendor_ports.get(manufacturer)
+        if ports is None:
+            name = manufacturer.lower()
+            ports = next((profile for keyword, profile in VENDOR_PORT_PROFILES if keyword in name), self.common_ports)
+            self._vendor_ports[manufacturer] = ports
+        return ports
     
-    def _scan_ports(self, ip):
-        """Scan common ports on the host"""
+    def _scan_ports(self, ip, ports=None):
+        """Scan common (or the given) ports on the host, all connects in flight at once within one timeout"""
         open_ports = {}
+        selector = selectors.DefaultSelector()
         
-        for port, service in self.common_ports.items():
-            if self.should_stop:
-                break
-                
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(0.5)
-                result = sock.connect_ex((ip, port))
-                sock.close()
+        try:
+            # Start a non-blocking connect to every port
+            for port, service in (ports or self.common_ports).items():
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                    # Close with a reset, so probed connections never sit in TIME_WAIT
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, self._linger_abort)
+                    sock.setblocking(False)
+                    result = sock.connect_ex((ip, port))
+                except OSError:
+                    continue
                 
+                if result in _CONNECT_IN_PROGRESS:
+                    selector.register(sock, selectors.EVENT_WRITE, (port, service))
+                    continue
                 if result == 0:
                     open_ports[port] = service
-            except:
-                pass
+                sock.close()
+            
+            # Writable means the connect finished, SO_ERROR tells open from refused
+            deadline = time.monotonic() + self.timeout
+            while selector.get_map() and not self.should_stop:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break  # Whatever is left is filtered
+                for key, _ in selector.select(min(remaining, 0.2)):
+                    sock = key.fileobj
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        port, service = key.data
+                        open_ports[port] = service
+                    selector.unregister(sock)
+                    sock.close()
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
         
-        return open_ports
+        return dict(sorted(open_ports.items()))
+    
+    def _scan_ports_raw(self, ips):
+        """SYN-probe the common ports of all hosts over one raw socket, returns {ip: {port: service}}
+        
+        Stateless like masscan: the sequence number and source port of each SYN are derived
+        from a per-scan secret and the target, so a SYN/ACK is validated from its own headers
+        without any table of outstanding probes. Returns None where raw sockets are unavailable.
+        """
+        if not self._is_linux or os.geteuid() != 0 or not ips:
+            return None  # Windows does not allow TCP over raw sockets
+        
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
+            route = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            route.connect((ips[0], 9))  # No packet is sent, it just picks the outgoing address
+            source_ip = route.getsockname()[0]
+            route.close()
+        except OSError:
+            return None
+        
+        secret = os.urandom(8)
+        source = socket.inet_aton(source_ip)
+        
+        def cookie(ip, port):
+            return zlib.crc32(secret + socket.inet_aton(ip) + port.to_bytes(2, 'big'))
+        
+        def source_port(seq):
+            return 32768 + (seq & 0x7FFF)
+        
+        def checksum(data):
+            if len(data) % 2:
+                data += b'\0'
+            total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+            total = (total >> 16) + (total & 0xFFFF)
+            total += total >> 16
+            return ~total & 0xFFFF
+        
+        def send_syns():
+            interval = 1.0 / self.SYN_SEND_RATE
+            for ip in ips:
+                destination = socket.inet_aton(ip)
+                for port in self.common_ports:
+                    if self.should_stop:
+                        return
+                    seq = cookie(ip, port)
+                    header = struct.pack('!HHLLBBHHH', source_port(seq), port, seq, 0, 5 << 4, 0x02, 1024, 0, 0)
+                    pseudo = source + destination + struct.pack('!BBH', 0, socket.IPPROTO_TCP, len(header))
+                    header = header[:16] + struct.pack('!H', checksum(pseudo + header)) + header[18:]
+                    try:
+                        sock.sendto(header, (ip, 0))
+                    except OSError:
+                        pass
+                    time.sleep(interval)
+        
+        results = {ip: {} for ip in ips}
+        sender = threading.Thread(target=send_syns, daemon=True)
+        sender.start()
+        try:
+            deadline = None
+            while not self.should_stop:
+                # Keep listening one timeout past the last SYN
+                if not sender.is_alive():
+                    if deadline is None:
+                        deadline = time.monotonic() + self.timeout
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                else:
+                    remaining = 0.2
+                
+                readable, _, _ = select.select([sock], [], [], min(remaining, 0.2))
+                if not readable:
+                    continue
+                packet = sock.recv(128)
+                
+                # Every TCP packet for this host arrives here, keep SYN/ACKs answering our SYNs
+                header_length = (packet[0] & 0x0F) * 4
+                if len(packet) < header_length + 14:
+                    continue
+                ip = socket.inet_ntoa(packet[12:16])
+                sport, dport, _, ack, _, flags = struct.unpack_from('!HHLLBB', packet, header_length)
+                if (flags & 0x12) != 0x12 or ip not in results or sport not in self.common_ports:
+                    continue
+                seq = cookie(ip, sport)
+                if dport == source_port(seq) and ack == (seq + 1) & 0xFFFFFFFF:
+                    results[ip][sport] = self.common_ports[sport]
+        finally:
+            sender.join()  # Already finished, or returning because the scan was stopped
+            sock.close()
+        
+        return {ip: dict(sorted(ports.items())) for ip, ports in results.items()}
     
     def _load_mac_vendors(self):
         """Load MAC vendor database (simplified version)"""
@@ -254,21 +765,44 @@ class NetworkScanWorker(QThread):
         if not mac_address or mac_address == 'Unknown':
             return 'Unknown'
         
-        # Extract first 3 octets (OUI)
+        # First 3 octets (OUI) as an int
         try:
-            oui = ':'.join(mac_address.split(':')[:3])
-            return self.mac_vendors.get(oui, 'Unknown')
-        except:
+            oui = int(mac_address.replace(':', '')[:6], 16)
+        except ValueError:
             return 'Unknown'
+        
+        # Binary search of the full database when it was built, else the short built-in table
+        database = _load_oui_database()
+        if database is not None:
+            ouis, vendors = database
+            index = int(np.searchsorted(ouis, oui))
+            if index < len(ouis) and ouis[index] == oui:
+                return vendors[index]
+        return self._oui_map.get(oui, 'Unknown')
 
 
 class NetworkScannerWidget(QWidget):
     """Network Scanner utility widget"""
     
+    _ONLINE_COLOR = QColor('#4CAF50')
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.scan_worker = None
         self.scan_results = []
+        
+        # Host probe threads, kept alive between scans so each one does not start them anew
+        self._scan_pool = ThreadPoolExecutor(max_workers=NetworkScanWorker.MAX_SCAN_WORKERS)
+        # Per-host details from recent scans, so a rescan of the same LAN mostly refreshes RTTs
+        self._host_cache = {}
+        
+        # Found devices wait here and are added to the table in batches
+        self._pending_devices = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(200)
+        self._flush_timer.timeout.connect(self._flush_devices)
+        
         self._init_ui()
         self._detect_network_range()
         
@@ -480,10 +1014,12 @@ class NetworkScannerWidget(QWidget):
             local_ip = s.getsockname()[0]
             s.close()
             
-            # Convert to network range (assuming /24)
-            ip_parts = local_ip.split('.')
-            network_range = f"{ip_parts[0]}.{ip_parts[1]}.{ip_parts[2]}.0/24"
-            self.ip_range_edit.setText(network_range)
+            # Convert to network range, the real subnet where the routing table tells it
+            # (Linux) as long as it is no larger than the /24 otherwise assumed
+            network = _linux_default_network() if platform.system().lower() == 'linux' else None
+            if network is None or network.prefixlen < 24 or ipaddress.IPv4Address(local_ip) not in network:
+                network = ipaddress.IPv4Network(f"{local_ip}/24", strict=False)
+            self.ip_range_edit.setText(str(network))
             
         except Exception:
             # Fallback to common ranges
@@ -499,6 +1035,7 @@ class NetworkScannerWidget(QWidget):
         # Clear previous results
         self.results_table.setRowCount(0)
         self.scan_results.clear()
+        self._pending_devices.clear()
         self.device_count_label.setText("Devices found: 0")
         
         # Update UI
@@ -512,7 +1049,9 @@ class NetworkScannerWidget(QWidget):
         self.scan_worker = NetworkScanWorker(
             ip_range=ip_range,
             scan_ports=self.port_scan_checkbox.isChecked(),
-            timeout=self.timeout_spin.value()
+            timeout=self.timeout_spin.value(),
+            pool=self._scan_pool,
+            host_cache=self._host_cache
         )
         
         self.scan_worker.device_found.connect(self._on_device_found)
@@ -532,6 +1071,7 @@ class NetworkScannerWidget(QWidget):
     
     def _reset_scan_ui(self):
         """Reset scan UI to initial state"""
+        self._flush_devices()  # Show any devices still waiting for the next batch
         self.scan_button.setText("🔍 Start Scan")
         self.scan_button.clicked.disconnect()
         self.scan_button.clicked.connect(self._start_scan)
@@ -540,26 +1080,35 @@ class NetworkScannerWidget(QWidget):
         self.status_label.setText("Ready")
     
     def _on_device_found(self, device_info):
-        """Handle discovered device"""
+        """Handle discovered device, its table row is added with the next batch"""
         self.scan_results.append(device_info)
+        self._pending_devices.append(device_info)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_devices(self):
+        """Add all buffered devices to the table in one pass"""
+        batch, self._pending_devices = self._pending_devices, []
+        if not batch:
+            return
         
-        # Add to table
-        row = self.results_table.rowCount()
-        self.results_table.insertRow(row)
-        
-        self.results_table.setItem(row, 0, QTableWidgetItem(device_info['ip']))
-        self.results_table.setItem(row, 1, QTableWidgetItem(device_info.get('hostname', 'Unknown')))
-        self.results_table.setItem(row, 2, QTableWidgetItem(device_info.get('mac_address', 'Unknown')))
-        self.results_table.setItem(row, 3, QTableWidgetItem(device_info.get('manufacturer', 'Unknown')))
-        self.results_table.setItem(row, 4, QTableWidgetItem(device_info.get('response_time', 'N/A')))
+        # Sorting and repaints are paused so the batch costs one re-sort and one repaint
+        self.results_table.setSortingEnabled(False)
+        self.results_table.setUpdatesEnabled(False)
         
-        # Status with color
-        status_item = QTableWidgetItem(device_info.get('status', 'Unknown'))
-        if device_info.get('status') == 'Online':
-            status_item.setForeground(QColor('#4CAF50'))
-        self.results_table.setItem(row, 5, status_item)
+        first_row = self.results_table.rowCount()
+        self.results_table.setRowCount(first_row + len(batch))
+        for row, device_info in enumerate(batch, first_row):
+            values = device_info['_row']
+            for column, text in enumerate(values):
+                self.results_table.setItem(row, column, QTableWidgetItem(text))
+            
+            # Status with color
+            if values[5] == 'Online':
+                self.results_table.item(row, 5).setForeground(self._ONLINE_COLOR)
         
-        self.results_table.setItem(row, 6, QTableWidgetItem(device_info.get('services', 'None')))
+        self.results_table.setSortingEnabled(True)
+        self.results_table.setUpdatesEnabled(True)
         
         # Update count
         self.device_count_label.setText(f"Devices found: {len(self.scan_results)}")
@@ -585,6 +1134,15 @@ class NetworkScannerWidget(QWidget):
         self.status_label.setText("Scan failed")
         QMessageBox.critical(self, "Scan Error", f"Scanning failed:\n{error_message}")
     
+    def closeEvent(self, event):
+        """Handle widget close event"""
+        if self.scan_worker and self.scan_worker.isRunning():
+            self.scan_worker.stop()
+            self.scan_worker.wait()
+        self._scan_pool.shutdown(wait=False, cancel_futures=True)
+        
+        event.accept()
+    
     def _export_results(self):
         """Export scan results to CSV"""
         if not self.scan_results:
@@ -608,15 +1166,8 @@ class NetworkScannerWidget(QWidget):
                     
                     writer.writeheader()
                     for device in self.scan_results:
-                        writer.writerow({
-                            'IP Address': device['ip'],
-                            'Hostname': device.get('hostname', 'Unknown'),
-                            'MAC Address': device.get('mac_address', 'Unknown'),
-                            'Manufacturer': device.get('manufacturer', 'Unknown'),
-                            'Response Time': device.get('response_time', 'N/A'),
-                            'Status': device.get('status', 'Unknown'),
-                            'Services': device.get('services', 'None')
-                        })
+                        # Same columns, in the same order, as the results table
+                        writer.writerow(dict(zip(fieldnames, device['_row'])))
                 
                 QMessageBox.information(self, "Export Complete", f"Results exported to:\n{filename}")
                 
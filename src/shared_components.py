@@ -1,7 +1,6 @@
 """
 Shared UI components used across multiple IT Helper modules
 """
-import time
 from collections import deque
 from datetime import datetime
 
@@ -12,6 +11,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QFont, QStandardItem
 
+import numpy as np
+
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
@@ -19,18 +20,25 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 class NumericTableWidgetItem(QTableWidgetItem):
     """Table widget item that sorts numerically rather than alphabetically"""
     
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._key = None  # Mirror of the UserRole value, compared without a QVariant round-trip
+    
+    def setData(self, role, value):
+        if role == Qt.UserRole:
+            self._key = value
+        super().setData(role, value)
+    
+    def setSortKey(self, key):
+        """Set the value the item sorts by (also stored as its UserRole data)"""
+        self.setData(Qt.UserRole, key)
+    
     def __lt__(self, other):
-        if not isinstance(other, QTableWidgetItem):
-            return super().__lt__(other)
-
-        self_data = self.data(Qt.UserRole)
-        other_data = other.data(Qt.UserRole)
-
         try:
-            return self_data < other_data
-        except TypeError:
+            return self._key < other._key
+        except (AttributeError, TypeError):
             # Fallback to text comparison if numeric comparison fails
-            return self.text() < other.text()
+            return super().__lt__(other)
 
 
 class SortableSizeStandardItem(QStandardItem):
@@ -41,17 +49,24 @@ class SortableSizeStandardItem(QStandardItem):
             super().__init__(text)
         else:
             super().__init__()
-
+        self._key = None  # Mirror of the UserRole value, compared without a QVariant round-trip
+    
+    def setData(self, value, role=Qt.UserRole + 1):
+        if role == Qt.UserRole:
+            self._key = value
+        super().setData(value, role)
+    
+    def setSortKey(self, key):
+        """Set the size the item sorts by (also stored as its UserRole data)"""
+        self.setData(key, Qt.UserRole)
+    
     def __lt__(self, other):
-        # Use UserRole data for numeric comparison
-        self_size = self.data(Qt.UserRole)
-        other_size = other.data(Qt.UserRole)
-
-        if isinstance(self_size, (int, float)) and isinstance(other_size, (int, float)):
-            return self_size < other_size
-        
-        # Fallback to standard comparison
-        return super().__lt__(other)
+        # Numeric comparison of the cached sizes
+        try:
+            return self._key < other._key
+        except (AttributeError, TypeError):
+            # Fallback to standard comparison
+            return super().__lt__(other)
 
 
 class MplCanvas(FigureCanvas):
@@ -76,6 +91,44 @@ class MplCanvas(FigureCanvas):
         # Grid styling
         self.axes.grid(True, alpha=0.3, color='white')
         
+        # Blitted series line and the background it is drawn over, see update_series
+        self._series_line = None
+        self._background = None
+        self.mpl_connect('draw_event', self._on_draw)
+        
+    def _on_draw(self, event):
+        """After every full draw (including resizes) grab the clean background and redraw the line on it"""
+        if self._series_line is None:
+            return  # Canvas not used for a blitted series
+        self._background = self.copy_from_bbox(self.axes.bbox)
+        if self._series_line in self.axes.lines:
+            self.axes.draw_artist(self._series_line)
+        
+    def update_series(self, xs, ys):
+        """Show xs/ys as the canvas' line, blitting just the line unless the axis limits must grow"""
+        line = self._series_line
+        if line is None or line not in self.axes.lines:
+            line, = self.axes.plot([], [], 'b-', linewidth=2, marker='o', markersize=4, animated=True)
+            self._series_line = line
+            self._background = None
+        line.set_data(xs, ys)
+        
+        # Limits only move when the data leaves them, x with headroom so it does not grow every tick
+        x_max = xs[-1]
+        y_min, y_max = float(np.min(ys)), float(np.max(ys))
+        x_low, x_high = self.axes.get_xlim()
+        y_low, y_high = self.axes.get_ylim()
+        if self._background is None or x_max > x_high or y_min < y_low or y_max > y_high:
+            padding = (y_max - y_min) * 0.1 if y_max != y_min else 5
+            self.axes.set_xlim(0, max(x_max * 1.25, 1.0))
+            self.axes.set_ylim(y_min - padding, y_max + padding)
+            self.draw()  # The draw_event handler captures the background and draws the line
+            return
+        
+        self.restore_region(self._background)
+        self.axes.draw_artist(line)
+        self.blit(self.axes.bbox)
+        
     def clear_axes(self):
         """Clear the axes and reset styling"""
         self.axes.clear()
@@ -86,15 +139,63 @@ class MplCanvas(FigureCanvas):
         self.axes.tick_params(colors='white')
 
 
+class SignalHistory:
+    """Fixed-size signal history for one BSSID, kept as parallel timestamp and dBm arrays"""
+    
+    def __init__(self, maxlen=100):
+        self.maxlen = maxlen
+        # Row 0 holds timestamps, row 1 signals. Every sample is written twice, maxlen apart,
+        # so the newest maxlen samples are always one contiguous slice in chronological order
+        self._data = np.empty((2, 2 * maxlen), dtype=np.float64)
+        self._total = 0
+        
+    def __len__(self):
+        return min(self._total, self.maxlen)
+        
+    def _window(self):
+        start = self._total % self.maxlen if self._total > self.maxlen else 0
+        return self._data[:, start:start + len(self)]
+        
+    def append(self, timestamp, signal_dbm):
+        """Add a sample, dropping the oldest one when full"""
+        index = self._total % self.maxlen
+        self._data[:, index] = self._data[:, index + self.maxlen] = (timestamp, signal_dbm)
+        self._total += 1
+        
+    def arrays(self):
+        """Return (timestamps, signals) as new float64 arrays, oldest first"""
+        timestamps, signals = self._window().copy()
+        return timestamps, signals
+        
+    def latest(self):
+        """Return (timestamp, signal_dbm) of the newest sample, None when empty"""
+        if not self._total:
+            return None
+        index = (self._total - 1) % self.maxlen
+        return float(self._data[0, index]), float(self._data[1, index])
+        
+    def __iter__(self):
+        """Yield (timestamp, signal_dbm) pairs, oldest first"""
+        timestamps, signals = self._window().tolist()
+        return zip(timestamps, signals)
+
+
 class NetworkDetailDialog(QDialog):
     """Dialog for displaying detailed network information"""
     
+    # network_info fields shown in the details text
+    DETAIL_KEYS = ('ssid', 'signal_dbm', 'channel', 'frequency_mhz', 'encryption', 'vendor')
+    
     def __init__(self, bssid, network_info, history_data, parent=None):
         super().__init__(parent)
         self.bssid = bssid
         self.network_info = network_info
-        self.history_data = history_data
+        self.history_data = history_data  # SignalHistory, shared with the parent widget
         self.parent_widget = parent  # Store reference to parent widget for data updates
+        self._chart_mode = None  # 'empty' or 'series', what the chart axes are currently set up for
+        
+        # Relative-time buffer reused across refresh ticks, grown geometrically when the history outgrows it
+        self._rel_buf = np.empty(128, dtype=np.float64)
         
         self.setWindowTitle(f"Network Details - {network_info.get('ssid', 'Hidden Network')}")
         self.setGeometry(200, 200, 800, 600)
@@ -102,17 +203,32 @@ class NetworkDetailDialog(QDialog):
         self._init_ui()
         self._update_details_and_plot()
         
-        # Set up refresh timer to update every 0.5 seconds
+        # Set up refresh timer to check for new data every second. Coarse, so Windows
+        # does not raise the system timer resolution for it
+        self._last_snapshot = None
         self.refresh_timer = QTimer(self)
+        self.refresh_timer.setTimerType(Qt.CoarseTimer)
         self.refresh_timer.timeout.connect(self._refresh_data_and_update)
-        self.refresh_timer.start(500)  # 500ms = 0.5 seconds
+        self.refresh_timer.start(1000)
         
     def _refresh_data_and_update(self):
-        """Refresh data from parent and update display"""
+        """Refresh data from parent and update display, skipped when nothing shown has changed"""
         if self.parent_widget and hasattr(self.parent_widget, 'all_detected_networks') and hasattr(self.parent_widget, 'all_signal_history_data'):
+            # Peek at the parent's data without copying it
+            network_info = self.parent_widget.all_detected_networks.get(self.bssid, self.network_info)
+            history = self.parent_widget.all_signal_history_data.get(self.bssid)
+            snapshot = (
+                tuple(network_info.get(key) for key in self.DETAIL_KEYS),
+                len(history) if history else 0,
+                history.latest() if history else None,
+            )
+            if snapshot == self._last_snapshot:
+                return
+            self._last_snapshot = snapshot
+            
             # Get updated network info and history data from parent
-            self.network_info = self.parent_widget.all_detected_networks.get(self.bssid, self.network_info)
-            self.history_data = list(self.parent_widget.all_signal_history_data.get(self.bssid, []))
+            self.network_info = network_info
+            self.history_data = history if history is not None else SignalHistory()
             
             # Update the display
             self._update_details_and_plot()
@@ -197,8 +313,8 @@ class NetworkDetailDialog(QDialog):
         if self.history_data:
             details_text.append(f"History Points: {len(self.history_data)}")
             if len(self.history_data) > 0:
-                latest_entry = self.history_data[-1]
-                last_seen = datetime.fromtimestamp(latest_entry['timestamp']).strftime("%Y-%m-%d %H:%M:%S")
+                latest_timestamp, _ = self.history_data.latest()
+                last_seen = datetime.fromtimestamp(latest_timestamp).strftime("%Y-%m-%d %H:%M:%S")
                 details_text.append(f"Last Seen: {last_seen}")
         
         self.details_text.setPlainText('\n'.join(details_text))
@@ -207,41 +323,39 @@ class NetworkDetailDialog(QDialog):
         self._plot_signal_history()
         
     def _plot_signal_history(self):
-        """Plot the signal history"""
-        self.chart_canvas.axes.clear()
+        """Plot the signal history, the axes are set up once and later ticks only update the line"""
+        canvas = self.chart_canvas
         
         if not self.history_data or len(self.history_data) < 2:
-            self.chart_canvas.axes.text(0.5, 0.5, "Insufficient data for plotting", 
-                                       transform=self.chart_canvas.axes.transAxes, 
-                                       ha='center', va='center', fontsize=12, alpha=0.7, color='white')
-        else:
-            timestamps = [entry['timestamp'] for entry in self.history_data]
-            signals = [entry['signal_dbm'] for entry in self.history_data]
-            
-            # Convert timestamps to relative times
-            current_time = time.time()
-            relative_times = [(ts - timestamps[0]) / 60 for ts in timestamps]  # Minutes since first measurement
-            
-            self.chart_canvas.axes.plot(relative_times, signals, 'b-', linewidth=2, marker='o', markersize=4)
-            self.chart_canvas.axes.set_xlabel("Time (minutes since first measurement)")
-            self.chart_canvas.axes.set_ylabel("Signal Strength (dBm)")
-            self.chart_canvas.axes.set_title(f"Signal History - {self.network_info.get('ssid', 'Hidden Network')}")
-            self.chart_canvas.axes.grid(True, alpha=0.3)
-            
-            # Set y-axis limits
-            min_signal = min(signals)
-            max_signal = max(signals)
-            padding = (max_signal - min_signal) * 0.1 if max_signal != min_signal else 5
-            self.chart_canvas.axes.set_ylim(min_signal - padding, max_signal + padding)
-        
-        # Apply dark theme styling
-        self.chart_canvas.axes.set_facecolor('#2d2d2d')
-        self.chart_canvas.axes.xaxis.label.set_color('white')
-        self.chart_canvas.axes.yaxis.label.set_color('white')
-        self.chart_canvas.axes.title.set_color('white')
-        self.chart_canvas.axes.tick_params(colors='white')
-        
-        self.chart_canvas.draw()
+            if self._chart_mode != 'empty':
+                canvas.clear_axes()
+                canvas.axes.text(0.5, 0.5, "Insufficient data for plotting", 
+                                 transform=canvas.axes.transAxes, 
+                                 ha='center', va='center', fontsize=12, alpha=0.7, color='white')
+                canvas.draw()
+                self._chart_mode = 'empty'
+            return
+        
+        if self._chart_mode != 'series':
+            canvas.clear_axes()  # Also applies the dark theme styling
+            canvas.axes.set_xlabel("Time (minutes since first measurement)")
+            canvas.axes.set_ylabel("Signal Strength (dBm)")
+            canvas.axes.set_title(f"Signal History - {self.network_info.get('ssid', 'Hidden Network')}")
+            canvas.axes.grid(True, alpha=0.3)
+            self._chart_mode = 'series'
+        
+        # One contiguous copy of each column, no per-sample Python work
+        timestamps, signals = self.history_data.arrays()
+        count = len(timestamps)
+        if count > len(self._rel_buf):
+            self._rel_buf = np.empty(max(count, 2 * len(self._rel_buf)), dtype=np.float64)
+        relative_times = self._rel_buf[:count]
+        
+        # Convert timestamps to relative times, minutes since first measurement
+        np.subtract(timestamps, timestamps[0], out=relative_times)
+        relative_times *= 1.0 / 60.0
+        
+        canvas.update_series(relative_times, signals)
         
     def closeEvent(self, event):
         """Handle dialog close event"""
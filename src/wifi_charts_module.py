@@ -1,6 +1,5 @@
 import time
 import numpy as np
-from collections import deque
 from datetime import datetime
 
 from PySide6.QtCore import Qt, QTimer, Signal, Slot, QSize
@@ -14,7 +13,7 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 import wifi_utilities
-from shared_components import MplCanvas
+from shared_components import MplCanvas, SignalHistory
 
 
 class WifiChartsWidget(QWidget):
@@ -177,13 +176,10 @@ class WifiChartsWidget(QWidget):
                     
                     # Update signal history
                     if bssid not in self.all_signal_history_data:
-                        self.all_signal_history_data[bssid] = deque(maxlen=100)
+                        self.all_signal_history_data[bssid] = SignalHistory(maxlen=100)
                     
                     signal_strength = network.get('signal_dbm', -100)
-                    self.all_signal_history_data[bssid].append({
-                        'timestamp': current_time,
-                        'signal_dbm': signal_strength
-                    })
+                    self.all_signal_history_data[bssid].append(current_time, signal_strength)
                 
                 # Update the network list
                 self._update_charts_network_list()
@@ -289,13 +285,11 @@ class WifiChartsWidget(QWidget):
                 if len(history) < 1:  # Changed from 2 to 1 to allow single data points
                     continue
                     
-                timestamps = [entry['timestamp'] for entry in history]
-                signals = [entry['signal_dbm'] for entry in history]
+                timestamps, signals = history.arrays()
                 
                 # Convert timestamps to relative times (minutes ago)
-                relative_times = [(current_time - ts) / 60 for ts in timestamps]
-                relative_times.reverse()  # Show oldest on left
-                signals.reverse()
+                relative_times = (current_time - timestamps[::-1]) / 60  # Show oldest on left
+                signals = signals[::-1]
                 
                 ssid = network_info.get('ssid', '<Hidden Network>')
                 if not ssid or ssid.strip() == '':
@@ -17,7 +17,7 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 import wifi_utilities
-from shared_components import NumericTableWidgetItem, MplCanvas, NetworkDetailDialog
+from shared_components import NumericTableWidgetItem, MplCanvas, NetworkDetailDialog, SignalHistory
 
 
 class ScanWorker(QThread):
@@ -29,9 +29,11 @@ class ScanWorker(QThread):
         super().__init__(parent)
         self.running = False
         self.current_scan_interval = 0.1
+        self._stop_event = threading.Event()  # Wakes the worker out of its wait on stop()
 
     def run(self):
         self.running = True
+        self._stop_event.clear()
         print("ScanWorker: Thread started.")
         while self.running:
             print(f"ScanWorker: Requesting Wi-Fi data (interval: {self.current_scan_interval}s)")
@@ -47,16 +49,8 @@ class ScanWorker(QThread):
                 self.scan_error.emit(error_msg)
                 self.scan_completed.emit([])
 
-            # Handle sleep based on interval
-            if self.current_scan_interval == 0.1:
-                time.sleep(0.1)
-            else:
-                sleep_chunk = 0.25
-                total_sleep_needed = self.current_scan_interval
-                slept_time = 0
-                while slept_time < total_sleep_needed and self.running:
-                    time.sleep(min(sleep_chunk, total_sleep_needed - slept_time))
-                    slept_time += sleep_chunk
+            # Wait out the interval, returning at once when a stop is requested
+            self._stop_event.wait(self.current_scan_interval)
             
             if not self.running:
                 break
@@ -65,6 +59,7 @@ class ScanWorker(QThread):
     def stop(self):
         print("ScanWorker: Stop requested.")
         self.running = False
+        self._stop_event.set()
 
 
 class WifiScannerWidget(QWidget):
@@ -474,13 +469,10 @@ class WifiScannerWidget(QWidget):
             
             # Update signal history
             if bssid not in self.all_signal_history_data:
-                self.all_signal_history_data[bssid] = deque(maxlen=self.MAX_HISTORY_POINTS)
+                self.all_signal_history_data[bssid] = SignalHistory(maxlen=self.MAX_HISTORY_POINTS)
             
             signal_strength = network.get('signal_dbm', -100)
-            self.all_signal_history_data[bssid].append({
-                'timestamp': current_time,
-                'signal_dbm': signal_strength
-            })
+            self.all_signal_history_data[bssid].append(current_time, signal_strength)
             
         # Refresh UI
         self._refresh_active_display_list_and_ui()
@@ -552,7 +544,7 @@ class WifiScannerWidget(QWidget):
             # Signal
             signal_dbm = network.get('signal_dbm', -100)
             signal_item = NumericTableWidgetItem(self._dbm_to_signal_bar_text(signal_dbm))
-            signal_item.setData(Qt.UserRole, signal_dbm)
+            signal_item.setSortKey(signal_dbm)
             # Make item non-editable but still selectable
             signal_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
             self.network_table.setItem(row, 1, signal_item)
@@ -560,7 +552,7 @@ class WifiScannerWidget(QWidget):
             # Channel
             channel = network.get('channel', 0)
             channel_item = NumericTableWidgetItem(str(channel))
-            channel_item.setData(Qt.UserRole, channel)
+            channel_item.setSortKey(channel)
             # Make item non-editable but still selectable
             channel_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
             self.network_table.setItem(row, 2, channel_item)
@@ -568,7 +560,7 @@ class WifiScannerWidget(QWidget):
             # Frequency
             freq = network.get('frequency_mhz', 0)
             freq_item = NumericTableWidgetItem(f"{freq} MHz")
-            freq_item.setData(Qt.UserRole, freq)
+            freq_item.setSortKey(freq)
             # Make item non-editable but still selectable
             freq_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
             self.network_table.setItem(row, 3, freq_item)
@@ -933,9 +925,9 @@ class WifiScannerWidget(QWidget):
                         channel = network_info.get('channel', 0)
                         frequency = network_info.get('frequency_mhz', 0)
                         
-                        for entry in history:
+                        for timestamp, signal_dbm in history:
                             writer.writerow([
-                                entry['timestamp'], bssid, ssid, entry['signal_dbm'], 
+                                timestamp, bssid, ssid, f"{signal_dbm:g}", 
                                 channel, frequency
                             ])
                             
@@ -950,7 +942,7 @@ class WifiScannerWidget(QWidget):
         if row < len(self.current_networks_for_display):
             network = self.current_networks_for_display[row]
             bssid = network.get('bssid', '')
-            history_data = self.all_signal_history_data.get(bssid, deque())
+            history_data = self.all_signal_history_data.get(bssid, SignalHistory())
             
             dialog = NetworkDetailDialog(bssid, network, history_data, self)
             dialog.exec()
@@ -1066,7 +1058,7 @@ class WifiScannerWidget(QWidget):
                 # Only show details if it's a valid BSSID (not group summary)
                 if bssid and bssid != f"{len(self.all_detected_networks)} BSSIDs" and ":" in bssid:
                     network = self.all_detected_networks.get(bssid, {})
-                    history_data = self.all_signal_history_data.get(bssid, deque())
+                    history_data = self.all_signal_history_data.get(bssid, SignalHistory())
                     
                     dialog = NetworkDetailDialog(bssid, network, history_data, self)
                     dialog.exec()